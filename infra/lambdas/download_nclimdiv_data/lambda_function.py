@@ -1,9 +1,18 @@
-import boto3
 import os
-import requests
-from bs4 import BeautifulSoup
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .noaa_listing import get_listing
+except ImportError:  # deployed as a flat Lambda asset
+    from noaa_listing import get_listing
+
+# boto3 and requests dominate cold-start import time, so they are imported on
+# first use instead of at module load (see scripts/profile_lambda_imports.py)
+s3 = None
+session = None
+transfer_config = None
 
-s3 = boto3.client("s3")
 bucket = os.environ["RAW_BUCKET"]
 parent_prefix = "nclimdiv-county/"
 base_url = "https://www.ncei.noaa.gov/pub/data/cirs/climdiv/"
@@ -18,43 +27,156 @@ FILE_PREFIXES = [
 
 EXCLUDE_SUFFIXES = (".pdf", ".html", ".txt")
 
+# All five files are transferred at once, each piped straight from NOAA into an
+# S3 multipart upload in CHUNK_SIZE parts, so nothing is staged in /tmp.
+# A non-seekable stream is buffered in memory part by part: each transfer holds
+# at most UPLOAD_CONCURRENCY parts in flight plus the one being read, i.e.
+# MAX_WORKERS * (UPLOAD_CONCURRENCY + 1) * CHUNK_SIZE = 120 MB at the defaults
+# (sized for the function's 512 MB memory_size in the stack).
+MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "5"))
+CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE_MB", "8")) * 1024 * 1024
+UPLOAD_CONCURRENCY = 2
+
+# The NOAA index changes monthly; warm invocations within the TTL reuse it
+LISTING_TTL_SECONDS = int(os.environ.get("LISTING_TTL_SECONDS", "3600"))
+
+def get_s3():
+    global s3
+    if s3 is None:
+        import boto3
+        s3 = boto3.client("s3")
+    return s3
+
+def get_transfer_config():
+    global transfer_config
+    if transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+        transfer_config = TransferConfig(
+            multipart_threshold=CHUNK_SIZE,
+            multipart_chunksize=CHUNK_SIZE,
+            max_concurrency=UPLOAD_CONCURRENCY,
+        )
+        # Not a constructor argument; s3transfer otherwise buffers up to 10 parts of a streamed body
+        transfer_config.max_in_memory_upload_chunks = UPLOAD_CONCURRENCY + 1
+    return transfer_config
+
+def make_session(pool_size=MAX_WORKERS):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_session():
+    global session
+    if session is None:
+        session = make_session()
+    return session
+
 def get_latest_file_urls():
-    response = requests.get(base_url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    file_urls = {}
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.endswith(EXCLUDE_SUFFIXES):
-            continue
-        for prefix in FILE_PREFIXES:
-            if href.startswith(prefix):
-                file_urls[prefix] = base_url + href
-    return file_urls
+    return get_listing(get_session(), base_url, FILE_PREFIXES, EXCLUDE_SUFFIXES, ttl=LISTING_TTL_SECONDS)
+
+def get_source_metadata(s3_key, s3_client=None):
+    """Source metadata recorded on the last upload of `s3_key`, or {} if absent."""
+    from botocore.exceptions import ClientError
+
+    s3_client = s3_client or get_s3()
+    try:
+        return s3_client.head_object(Bucket=bucket, Key=s3_key).get("Metadata", {})
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return {}
+        raise
+
+def conditional_headers(metadata):
+    headers = {}
+    if metadata.get("source-etag"):
+        headers["If-None-Match"] = metadata["source-etag"]
+    if metadata.get("source-last-modified"):
+        headers["If-Modified-Since"] = metadata["source-last-modified"]
+    return headers
+
+def stream_to_s3(url, s3_key, http=None, s3_client=None, previous=None):
+    """Pipe one HTTP response body into S3 and return its transfer stats.
+
+    `previous` is the source metadata of the current object. A file with the
+    same versioned name is only fetched if NOAA answers the conditional request
+    with new content; without validators to check, the name match is trusted.
+    """
+    http = http or get_session()
+    s3_client = s3_client or get_s3()
+    previous = previous or {}
+    filename = os.path.basename(url)
+    stats = {"url": url, "s3_key": s3_key, "skipped": False, "bytes": 0}
+
+    headers = {}
+    if previous.get("source-filename") == filename:
+        headers = conditional_headers(previous)
+        if not headers:
+            return {**stats, "skipped": True}
+
+    transferred = 0
+
+    def on_progress(n):
+        nonlocal transferred
+        transferred += n
+
+    start = time.perf_counter()
+    with http.get(url, stream=True, timeout=60, headers=headers) as r:
+        if r.status_code == 304:
+            return {**stats, "skipped": True}
+        r.raise_for_status()
+        r.raw.decode_content = True
+        metadata = {
+            "source-url": url,
+            "source-filename": filename,
+            "source-etag": r.headers.get("ETag", ""),
+            "source-last-modified": r.headers.get("Last-Modified", ""),
+        }
+        s3_client.upload_fileobj(
+            r.raw, bucket, s3_key,
+            ExtraArgs={"Metadata": metadata},
+            Config=get_transfer_config(),
+            Callback=on_progress,
+        )
+    seconds = time.perf_counter() - start
+
+    return {
+        **stats,
+        "bytes": transferred,
+        "seconds": round(seconds, 3),
+        "bytes_per_second": round(transferred / seconds) if seconds else None,
+    }
+
+def transfer_file(prefix, url):
+    s3_key = f"{parent_prefix}{prefix}/{prefix}.dat"  # normalized
+    stats = stream_to_s3(url, s3_key, previous=get_source_metadata(s3_key))
+    if stats["skipped"]:
+        print(f"⏭️ {prefix}: {os.path.basename(url)} unchanged, skipping")
+    else:
+        print(f"📤 {prefix}: {stats['bytes']} bytes in {stats['seconds']}s ({stats['bytes_per_second']} B/s) → s3://{bucket}/{s3_key}")
+    return stats
 
 def lambda_handler(event, context):
     print("🔍 Searching for latest NOAA nClimDiv files...")
+    # Create the shared clients before the worker threads race to do it
+    get_s3()
+    get_transfer_config()
     files = get_latest_file_urls()
 
-    for prefix, url in files.items():
-        original_filename = os.path.basename(url)
-        local_path = f"/tmp/{original_filename}"
-        final_name = f"{prefix}.dat"  # normalized
-        s3_key = f"{parent_prefix}{prefix}/{final_name}"
-
-        print(f"⬇️ Downloading (streamed) {url}")
-        with requests.get(url, stream=True, timeout=60) as r:
-            r.raise_for_status()
-            with open(local_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-        print(f"📤 Uploading to s3://{bucket}/{s3_key}")
-        s3.upload_file(local_path, bucket, s3_key)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        transfers = list(pool.map(transfer_file, files.keys(), files.values()))
 
-    print("✅ All files downloaded and uploaded to S3.")
+    uploaded = [t for t in transfers if not t["skipped"]]
+    skipped = [t for t in transfers if t["skipped"]]
+    print(f"✅ {len(uploaded)} files uploaded to S3, {len(skipped)} unchanged.")
     return {
         "status": "success",
-        "files_uploaded": list(files.values())
+        "files_uploaded": [t["url"] for t in uploaded],
+        "files_skipped": [t["url"] for t in skipped],
+        "uploaded_keys": [t["s3_key"] for t in uploaded],
+        "transfers": uploaded
     }
@@ -0,0 +1,60 @@
+import re
+import time
+from urllib.parse import urljoin
+
+# Plain regex scan of the Apache-style index; much cheaper than building a soup
+HREF_RE = re.compile(r"""<a\s[^>]*?href\s*=\s*["']([^"'#?]+)["']""", re.IGNORECASE)
+
+# climdiv-tmaxcy-v1.0.0-20250306 -> (1, 0, 0, 20250306)
+VERSION_RE = re.compile(r"-v(\d+)\.(\d+)\.(\d+)-(\d{8})")
+
+_cache = {}
+
+
+def extract_hrefs(html: str) -> list:
+    return HREF_RE.findall(html)
+
+
+def version_key(filename: str) -> tuple:
+    """Sortable release version; unversioned names sort before any release."""
+    match = VERSION_RE.search(filename)
+    if not match:
+        return (-1, -1, -1, -1)
+    return tuple(int(part) for part in match.groups())
+
+
+def pick_latest(base_url, hrefs, prefixes, exclude_suffixes=()) -> dict:
+    """Newest file URL per prefix, by version suffix rather than listing order."""
+    latest = {}
+    for href in hrefs:
+        filename = href.rstrip("/").rsplit("/", 1)[-1]
+        if filename.endswith(tuple(exclude_suffixes)):
+            continue
+        for prefix in prefixes:
+            if not filename.startswith(prefix):
+                continue
+            candidate = (version_key(filename), urljoin(base_url, href))
+            if prefix not in latest or candidate[0] >= latest[prefix][0]:
+                latest[prefix] = candidate
+    return {prefix: url for prefix, (_, url) in latest.items()}
+
+
+def get_listing(http, base_url, prefixes, exclude_suffixes=(), ttl=0) -> dict:
+    """Latest file URLs from the directory index, cached for `ttl` seconds.
+
+    The cache lives at module level, so warm Lambda invocations reuse it.
+    """
+    key = (base_url, tuple(prefixes), tuple(exclude_suffixes))
+    cached = _cache.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return dict(cached[1])
+
+    response = http.get(base_url, timeout=60)
+    response.raise_for_status()
+    file_urls = pick_latest(base_url, extract_hrefs(response.text), prefixes, exclude_suffixes)
+    _cache[key] = (time.monotonic(), file_urls)
+    return dict(file_urls)
+
+
+def clear_cache():
+    _cache.clear()
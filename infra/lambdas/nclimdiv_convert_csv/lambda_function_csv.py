@@ -2,12 +2,37 @@ import boto3
 import os
 import io
 import re
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .nclimdiv_manifest import load_manifest, manifest_key, save_manifest
+    from .nclimdiv_parser import concat_records, iter_decode_records, parse_fixed_width, to_long_frame
+    from .s3_stream import S3MultipartWriter, stream_budget
+except ImportError:  # deployed as a flat Lambda asset
+    from nclimdiv_manifest import load_manifest, manifest_key, save_manifest
+    from nclimdiv_parser import concat_records, iter_decode_records, parse_fixed_width, to_long_frame
+    from s3_stream import S3MultipartWriter, stream_budget
 
 s3 = boto3.client("s3")
 raw_bucket = os.environ["RAW_BUCKET"]
 processed_bucket = os.environ["PROCESSED_BUCKET"]
 
+# "stream" keeps memory flat regardless of file size; "buffered" reads whole files
+conversion_mode = os.environ.get("CONVERSION_MODE", "stream")
+memory_budget_mb = int(os.environ.get("MEMORY_BUDGET_MB", "64"))
+
+# "csv" writes nclimdiv/{var}.csv; "parquet" writes nclimdiv/{var}/year=YYYY/...
+output_format = os.environ.get("OUTPUT_FORMAT", "csv")
+partition_by_state = os.environ.get("PARTITION_BY_STATE", "false").lower() == "true"
+
+# Parquet only: rewrite just the partitions whose content changed since the last run
+incremental = os.environ.get("INCREMENTAL", "true").lower() == "true"
+
+# Variable files are independent, so they are converted concurrently; the memory
+# budget is shared between workers
+max_workers = max(1, int(os.environ.get("MAX_WORKERS", "5")))
+worker_budget_mb = max(1, memory_budget_mb // max_workers)
+
 PREFIX_MAP = {
     "tmax": "tmax",
     "tmin": "tmin",
@@ -16,77 +41,152 @@ PREFIX_MAP = {
     "pdsi": "pdsi"
 }
 
-def parse_fixed_width_lines(lines, var_name):
-    records = []
-    for line in lines:
-        try:
-            state = line[0:2]
-            county = line[2:5]
-            year = int(line[7:11])
-            for i in range(12):
-                start = 11 + i * 7
-                value_str = line[start:start + 7].strip()
-                if not value_str or value_str in {"-9.99", "-99.99", "-9999"}:
-                    continue
-                value = float(value_str)
-                records.append({
-                    "state_code": state,
-                    "county_fips": county,
-                    "year": year,
-                    "month": i + 1,
-                    var_name: value
-                })
-        except Exception as e:
-            print(f"⚠️ Skipped line: {e}")
-    return pd.DataFrame(records)
+def convert_buffered(key, var_name, output_csv):
+    # Step 1: Download
+    print("📥 Downloading file from S3...")
+    obj = s3.get_object(Bucket=raw_bucket, Key=key)
+    content = obj["Body"].read()
+    print(f"📄 Total bytes read: {len(content)}")
+
+    # Step 2: Parse
+    print(f"🧮 Parsing records for variable: {var_name}")
+    df = parse_fixed_width(content, var_name)
+    print(f"✅ Parsed records: {len(df)}")
+
+    if df.empty:
+        print(f"⚠️ No valid data in {key}")
+        return
+
+    # Step 3: Convert to CSV
+    csv_buffer = io.StringIO()
+    df.to_csv(csv_buffer, index=False)
+    print(f"📤 CSV ready, uploading to: {output_csv}")
+
+    # Step 4: Upload
+    s3.put_object(
+        Bucket=processed_bucket,
+        Key=output_csv,
+        Body=csv_buffer.getvalue().encode("utf-8")
+    )
+    print(f"✅ Uploaded full CSV to s3://{processed_bucket}/{output_csv}")
+
+def convert_streaming(key, var_name, output_csv):
+    chunk_size, part_size = stream_budget(worker_budget_mb)
+    print(f"🌊 Streaming {key} in {chunk_size // 1024} KB chunks, {part_size // 1024} KB parts...")
+
+    obj = s3.get_object(Bucket=raw_bucket, Key=key)
+    writer = S3MultipartWriter(s3, processed_bucket, output_csv, part_size=part_size)
+    rows = 0
+    try:
+        for records in iter_decode_records(obj["Body"].iter_chunks(chunk_size)):
+            df = to_long_frame(records, var_name)
+            writer.write(df.to_csv(index=False, header=rows == 0).encode("utf-8"))
+            rows += len(df)
+    except Exception:
+        writer.abort()
+        raise
+
+    if rows == 0:
+        writer.abort()
+        print(f"⚠️ No valid data in {key}")
+        return
+
+    writer.close()
+    print(f"✅ Streamed {rows} records ({writer.bytes_written} bytes) to s3://{processed_bucket}/{output_csv}")
+
+def parquet_writer():
+    # pyarrow is only needed for OUTPUT_FORMAT=parquet, so CSV cold starts never import it
+    try:
+        from .nclimdiv_parquet import write_parquet_partitions
+    except ImportError:
+        from nclimdiv_parquet import write_parquet_partitions
+    return write_parquet_partitions
+
+def convert_parquet(key, etag, var_name, table_prefix):
+    manifest_path = manifest_key(var_name)
+    manifest = load_manifest(s3, processed_bucket, manifest_path) if incremental else None
+
+    if manifest is not None and manifest["source_etags"].get(key) == etag:
+        print(f"⏭️ {key} unchanged since last run, skipping")
+        return 0
+
+    obj = s3.get_object(Bucket=raw_bucket, Key=key)
+
+    # Parquet partitions by year, but files are ordered by county, so the chunks
+    # are decoded into compact records first and partitioned once at the end
+    chunk_size, _ = stream_budget(worker_budget_mb)
+    records = concat_records(iter_decode_records(obj["Body"].iter_chunks(chunk_size)))
+    df = to_long_frame(records, var_name)
+    print(f"✅ Parsed records: {len(df)}")
+
+    if df.empty:
+        print(f"⚠️ No valid data in {key}")
+        return 0
+
+    partition_cols = ["year", "state_code"] if partition_by_state else ["year"]
+    fingerprints = manifest["partitions"] if manifest is not None else None
+    keys = parquet_writer()(s3, processed_bucket, table_prefix, df, partition_cols, fingerprints=fingerprints)
+    print(f"✅ Wrote {len(keys)} Parquet partitions to s3://{processed_bucket}/{table_prefix}")
+
+    if manifest is not None:
+        manifest["source_etags"] = {key: etag}
+        save_manifest(s3, processed_bucket, manifest_path, manifest)
+    return len(keys)
+
+def convert_file(key, etag):
+    print(f"📄 Processing: {key}")
+    match = re.search(r"climdiv-([a-z]+)cy", key)
+    if not match:
+        print(f"⚠️ Skipping unknown file: {key}")
+        return None, 0
+
+    var_prefix = match.group(1)
+    var_name = PREFIX_MAP.get(var_prefix, var_prefix)
+
+    if output_format == "parquet":
+        return var_name, convert_parquet(key, etag, var_name, f"nclimdiv/{var_name}/")
+
+    output_csv = f"nclimdiv/{var_name}.csv"
+    if conversion_mode == "stream":
+        convert_streaming(key, var_name, output_csv)
+    else:
+        convert_buffered(key, var_name, output_csv)
+    return var_name, 0
+
+def changed_raw_keys(event):
+    """Raw keys the download Lambda replaced, or None when every file should be converted."""
+    payload = (event or {}).get("detail", {}).get("responsePayload") or {}
+    return payload.get("uploaded_keys")
 
 def lambda_handler(event, context):
     print("🚀 Starting nClimDiv fixed-width to CSV conversion...")
 
-    response = s3.list_objects_v2(Bucket=raw_bucket, Prefix="nclimdiv-county/")
-    dat_files = [
-        obj["Key"] for obj in response.get("Contents", [])
+    changed = changed_raw_keys(event)
+    if changed is not None and not changed:
+        print("⏭️ Download step reported no new NOAA files, nothing to convert.")
+        return {
+            "status": "skipped",
+            "partitions_written": {}
+        }
+
+    pages = s3.get_paginator("list_objects_v2").paginate(Bucket=raw_bucket, Prefix="nclimdiv-county/")
+    dat_files = {
+        obj["Key"]: obj["ETag"] for page in pages for obj in page.get("Contents", [])
         if obj["Key"].endswith(".dat") and "climdiv-" in obj["Key"]
-    ]
-
-    for key in dat_files:
-        print(f"📄 Processing: {key}")
-        match = re.search(r"climdiv-([a-z]+)cy", key)
-        if not match:
-            print(f"⚠️ Skipping unknown file: {key}")
-            continue
-
-        var_prefix = match.group(1)
-        var_name = PREFIX_MAP.get(var_prefix, var_prefix)
-
-        # Step 1: Download
-        print("📥 Downloading file from S3...")
-        obj = s3.get_object(Bucket=raw_bucket, Key=key)
-        content = obj["Body"].read().decode("utf-8")
-        lines = content.splitlines()
-        print(f"📄 Total lines read: {len(lines)}")
-
-        # Step 2: Parse
-        print(f"🧮 Parsing records for variable: {var_name}")
-        df = parse_fixed_width_lines(lines, var_name)
-        print(f"✅ Parsed records: {len(df)}")
-
-        if df.empty:
-            print(f"⚠️ No valid data in {key}")
-            continue
-
-        # Step 3: Convert to CSV
-        output_csv = f"nclimdiv/{var_name}.csv"
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        print(f"📤 CSV ready, uploading to: {output_csv}")
-
-        # Step 4: Upload
-        s3.put_object(
-            Bucket=processed_bucket,
-            Key=output_csv,
-            Body=csv_buffer.getvalue().encode("utf-8")
-        )
-        print(f"✅ Uploaded full CSV to s3://{processed_bucket}/{output_csv}")
+        and (changed is None or obj["Key"] in changed)
+    }
+
+    print(f"🧵 Converting {len(dat_files)} files with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(convert_file, dat_files.keys(), dat_files.values()))
+
+    partitions_written = {
+        var_name: count for var_name, count in results
+        if var_name is not None and output_format == "parquet"
+    }
 
     print("🎉 All conversions complete.")
+    return {
+        "status": "success",
+        "partitions_written": partitions_written
+    }
@@ -0,0 +1,37 @@
+import json
+from datetime import datetime, timezone
+
+from botocore.exceptions import ClientError
+
+# Kept outside nclimdiv/ so the Glue crawler never picks the manifests up as a table
+MANIFEST_PREFIX = "manifests/nclimdiv/"
+
+
+def manifest_key(table_name: str) -> str:
+    return f"{MANIFEST_PREFIX}{table_name}.json"
+
+
+def empty_manifest() -> dict:
+    return {"source_etags": {}, "partitions": {}}
+
+
+def load_manifest(s3, bucket: str, key: str) -> dict:
+    """Previous run's manifest, or an empty one if this table was never written."""
+    try:
+        obj = s3.get_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return empty_manifest()
+        raise
+    return {**empty_manifest(), **json.loads(obj["Body"].read())}
+
+
+def save_manifest(s3, bucket: str, key: str, manifest: dict):
+    manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+    s3.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+        ContentType="application/json",
+    )
+
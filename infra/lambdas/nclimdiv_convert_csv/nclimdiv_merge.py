@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from .nclimdiv_parser import MONTHS, NclimdivRecords
+except ImportError:  # deployed as a flat Lambda asset
+    from nclimdiv_parser import MONTHS, NclimdivRecords
+
+KEY_COLUMNS = ["state_code", "county_fips", "year", "month"]
+
+# Packed row key: SS CCC YYYY as one int64, which sorts like the zero-padded strings
+_STATE_SCALE = 10 ** 7
+_COUNTY_SCALE = 10 ** 4
+
+
+def _row_keys(records: NclimdivRecords) -> np.ndarray:
+    return (
+        records.state_code.astype(np.int64) * _STATE_SCALE
+        + records.county_fips.astype(np.int64) * _COUNTY_SCALE
+        + records.year
+    )
+
+
+def _labels(codes: np.ndarray, take: np.ndarray, width: int) -> pd.Categorical:
+    categories, inverse = np.unique(codes, return_inverse=True)
+    return pd.Categorical.from_codes(
+        inverse[take], categories=np.char.zfill(categories.astype(str), width).astype(object)
+    )
+
+
+def merge_wide(records_by_var: dict) -> pd.DataFrame:
+    """Align every variable on (state, county, year, month) in one pre-sized array.
+
+    Produces the same rows, order and columns as chaining outer `pd.merge` calls
+    over each variable's long frame, without hashing or copying per join.
+    """
+    names = list(records_by_var)
+    row_keys = [_row_keys(records) for records in records_by_var.values()]
+    keys = np.unique(np.concatenate(row_keys)) if row_keys else np.empty(0, dtype=np.int64)
+
+    cube = np.full((len(keys), MONTHS, len(names)), np.nan, dtype=np.float32)
+    for i, (records, var_keys) in enumerate(zip(records_by_var.values(), row_keys)):
+        cube[np.searchsorted(keys, var_keys), :, i] = records.values
+
+    present = ~np.isnan(cube).all(axis=2).ravel()
+    row = np.repeat(np.arange(len(keys)), MONTHS)[present]
+    month = np.tile(np.arange(1, MONTHS + 1, dtype=np.int8), len(keys))[present]
+    values = cube.reshape(-1, len(names))[present]
+
+    merged = pd.DataFrame({
+        "state_code": _labels(keys // _STATE_SCALE, row, 2),
+        "county_fips": _labels(keys // _COUNTY_SCALE % 1000, row, 3),
+        "year": (keys % _COUNTY_SCALE).astype(np.int16)[row],
+        "month": month,
+    })
+    for i, name in enumerate(names):
+        merged[name] = values[:, i]
+    return merged
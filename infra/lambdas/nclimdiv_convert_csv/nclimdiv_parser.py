@@ -0,0 +1,145 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# nClimDiv county layout: state(2) county(3) element(2) year(4) + 12 x value(7)
+STATE_COLS = slice(0, 2)
+COUNTY_COLS = slice(2, 5)
+YEAR_COLS = slice(7, 11)
+VALUES_OFFSET = 11
+VALUE_WIDTH = 7
+MONTHS = 12
+RECORD_WIDTH = VALUES_OFFSET + MONTHS * VALUE_WIDTH
+
+MISSING_VALUES = (-9.99, -99.99, -9999.0)
+
+_SPACE = ord(" ")
+_NEWLINE = ord("\n")
+_YEAR_WEIGHTS = np.array([1000, 100, 10, 1], dtype=np.int32)
+
+
+class NclimdivRecords(NamedTuple):
+    """One row per (state, county, year) line with its 12 monthly values."""
+    state_code: np.ndarray   # S2
+    county_fips: np.ndarray  # S3
+    year: np.ndarray         # int16
+    values: np.ndarray       # float32, shape (n, 12), NaN where missing
+
+
+def _as_matrix(buf: bytes) -> np.ndarray:
+    """View a fixed-width buffer as an (n_records, RECORD_WIDTH) uint8 matrix."""
+    if not buf:
+        return np.empty((0, RECORD_WIDTH), dtype=np.uint8)
+    if not buf.endswith(b"\n"):
+        buf += b"\n"
+
+    # Fast path: every line has the same length, so the buffer reshapes in place
+    stride = buf.find(b"\n") + 1
+    if stride > RECORD_WIDTH and len(buf) % stride == 0:
+        raw = np.frombuffer(buf, dtype=np.uint8).reshape(-1, stride)
+        if (raw[:, -1] == _NEWLINE).all():
+            return raw[:, :RECORD_WIDTH]
+
+    # Ragged input (trimmed trailing blanks, blank lines): pad each line to width
+    lines = [line.ljust(RECORD_WIDTH)[:RECORD_WIDTH] for line in buf.splitlines() if line.strip()]
+    raw = np.frombuffer(b"".join(lines), dtype=np.uint8)
+    return raw.reshape(-1, RECORD_WIDTH)
+
+
+def _fixed_strings(matrix: np.ndarray, cols: slice) -> np.ndarray:
+    width = cols.stop - cols.start
+    return np.ascontiguousarray(matrix[:, cols]).view(f"S{width}").ravel()
+
+
+def _safe_float(field: bytes) -> float:
+    try:
+        return float(field)
+    except ValueError:
+        return np.nan
+
+
+def _parse_values(matrix: np.ndarray) -> np.ndarray:
+    cells = np.ascontiguousarray(matrix[:, VALUES_OFFSET:RECORD_WIDTH])
+    fields = cells.view(f"S{VALUE_WIDTH}").reshape(-1, MONTHS)
+
+    blank = (cells.reshape(-1, MONTHS, VALUE_WIDTH) == _SPACE).all(axis=2)
+    if blank.any():
+        fields = fields.copy()
+        fields[blank] = b"nan"
+
+    try:
+        values = fields.astype(np.float64)
+    except ValueError:
+        values = np.frompyfunc(_safe_float, 1, 1)(fields).astype(np.float64)
+        print(f"⚠️ Unparseable values in {int(np.isnan(values).sum() - blank.sum())} fields, treated as missing")
+
+    values[np.isin(values, MISSING_VALUES)] = np.nan
+    return values.astype(np.float32)
+
+
+def decode_records(buf: bytes) -> NclimdivRecords:
+    """Decode a whole nClimDiv `.dat` buffer into columnar arrays in one pass."""
+    matrix = _as_matrix(buf)
+
+    digits = matrix[:, YEAR_COLS].astype(np.int32) - ord("0")
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+    if not valid.all():
+        print(f"⚠️ Skipped {int((~valid).sum())} lines with an invalid year")
+        matrix = matrix[valid]
+        digits = digits[valid]
+
+    return NclimdivRecords(
+        state_code=_fixed_strings(matrix, STATE_COLS),
+        county_fips=_fixed_strings(matrix, COUNTY_COLS),
+        year=(digits @ _YEAR_WEIGHTS).astype(np.int16),
+        values=_parse_values(matrix),
+    )
+
+
+def _categorical(labels: np.ndarray, take: np.ndarray) -> pd.Categorical:
+    categories, codes = np.unique(labels, return_inverse=True)
+    return pd.Categorical.from_codes(
+        codes[take], categories=categories.astype(str).astype(object)
+    )
+
+
+def to_long_frame(records: NclimdivRecords, var_name: str) -> pd.DataFrame:
+    """Melt decoded records to the long `state, county, year, month, value` table."""
+    present = ~np.isnan(records.values).ravel()
+    row = np.repeat(np.arange(len(records.year)), MONTHS)[present]
+    month = np.tile(np.arange(1, MONTHS + 1, dtype=np.int8), len(records.year))[present]
+
+    return pd.DataFrame({
+        "state_code": _categorical(records.state_code, row),
+        "county_fips": _categorical(records.county_fips, row),
+        "year": records.year[row],
+        "month": month,
+        var_name: records.values.ravel()[present],
+    })
+
+
+def parse_fixed_width(buf: bytes, var_name: str) -> pd.DataFrame:
+    """Parse a raw nClimDiv `.dat` buffer straight into a typed long DataFrame."""
+    return to_long_frame(decode_records(buf), var_name)
+
+
+def iter_decode_records(chunks):
+    """Decode an iterable of raw byte chunks, carrying partial lines between them."""
+    tail = b""
+    for chunk in chunks:
+        buf = tail + chunk
+        cut = buf.rfind(b"\n") + 1
+        tail = buf[cut:]
+        if cut:
+            yield decode_records(buf[:cut])
+    if tail.strip():
+        yield decode_records(tail)
+
+
+def concat_records(parts) -> NclimdivRecords:
+    """Stitch decoded chunks back into one NclimdivRecords."""
+    parts = list(parts)
+    if not parts:
+        return decode_records(b"")
+    return NclimdivRecords(*(np.concatenate(column) for column in zip(*parts)))
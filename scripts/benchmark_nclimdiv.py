@@ -0,0 +1,149 @@
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_merge import merge_wide
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import decode_records, parse_fixed_width
+from infra.lambdas.nclimdiv_convert_csv.s3_stream import stream_budget
+from scripts.nclimdiv_fixtures import (
+    chained_merge,
+    convert_peak_bytes,
+    legacy_parse_fixed_width_lines,
+    make_synthetic_dat,
+    synthetic_variables,
+)
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_parser(impl, path):
+    with open(path, "rb") as f:
+        buf = f.read()
+    baseline_rss = _peak_rss_mb()
+
+    start = time.perf_counter()
+    if impl == "legacy":
+        df = legacy_parse_fixed_width_lines(buf.decode("utf-8").splitlines(), "tavg")
+    else:
+        df = parse_fixed_width(buf, "tavg")
+    elapsed = time.perf_counter() - start
+
+    return {"rows": len(df), "seconds": elapsed, "peak_rss_mb": _peak_rss_mb(), "baseline_rss_mb": baseline_rss}
+
+
+def _measure(impl, path):
+    # A fresh interpreter per run keeps ru_maxrss from leaking across implementations
+    with mp.get_context("spawn").Pool(1) as pool:
+        return pool.apply(_run_parser, (impl, path))
+
+
+def benchmark_parse(n_counties, n_years):
+    print(f"🧪 Generating synthetic file: {n_counties} counties × {n_years} years...")
+    with tempfile.NamedTemporaryFile(suffix=".dat", delete=False) as f:
+        f.write(make_synthetic_dat(n_counties, n_years))
+        path = f.name
+
+    try:
+        print(f"📄 {os.path.getsize(path) / 1e6:.1f} MB, {n_counties * n_years} lines")
+        results = {impl: _measure(impl, path) for impl in ("legacy", "vectorized")}
+    finally:
+        os.remove(path)
+
+    print(f"{'parser':<12}{'rows':>12}{'seconds':>10}{'rows/s':>14}{'peak RSS MB':>14}{'Δ RSS MB':>11}")
+    for impl, r in results.items():
+        print(
+            f"{impl:<12}{r['rows']:>12,}{r['seconds']:>10.2f}{r['rows'] / r['seconds']:>14,.0f}"
+            f"{r['peak_rss_mb']:>14.0f}{r['peak_rss_mb'] - r['baseline_rss_mb']:>11.0f}"
+        )
+
+    legacy, fast = results["legacy"], results["vectorized"]
+    if legacy["rows"] != fast["rows"]:
+        print(f"⚠️ Row count mismatch: legacy={legacy['rows']} vectorized={fast['rows']}")
+    print(f"🚀 Speedup: {legacy['seconds'] / fast['seconds']:.1f}x")
+    return results
+
+
+def benchmark_stream(memory_budget_mb, n_counties=3100, year_steps=(30, 65, 130)):
+    chunk_size, _ = stream_budget(memory_budget_mb)
+    print(f"🌊 Streaming with a {memory_budget_mb} MB budget ({chunk_size // 1024} KB read chunks)")
+    print(f"{'input MB':>10}{'buffered peak MB':>18}{'streaming peak MB':>19}")
+    for n_years in year_steps:
+        buf = make_synthetic_dat(n_counties, n_years, first_year=1895)
+        buffered = convert_peak_bytes(buf)
+        streamed = convert_peak_bytes(buf, chunk_size)
+        print(f"{len(buf) / 1e6:>10.1f}{buffered / 1e6:>18.1f}{streamed / 1e6:>19.1f}")
+
+
+def benchmark_merge(n_counties, n_years):
+    print(f"🧩 Merging five variables: {n_counties} counties × {n_years} years...")
+    records_by_var = synthetic_variables(n_counties, n_years)
+
+    timings = {}
+    for name, merge in (("chained", chained_merge), ("wide", merge_wide)):
+        start = time.perf_counter()
+        merged = merge(records_by_var)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:<12}{len(merged):>12,} rows{timings[name]:>10.2f}s")
+
+    print(f"🚀 Speedup: {timings['chained'] / timings['wide']:.1f}x")
+    return timings
+
+
+def _decode_file(path):
+    with open(path, "rb") as f:
+        return len(decode_records(f.read()).year)
+
+
+def benchmark_parallel(n_counties, n_years, workers=5):
+    print(f"🧵 Decoding five variable files with {workers} workers...")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for seed in range(5):
+            path = os.path.join(tmp, f"var{seed}.dat")
+            with open(path, "wb") as f:
+                f.write(make_synthetic_dat(n_counties, n_years, seed=seed))
+            paths.append(path)
+
+        single = []
+        for path in paths:
+            start = time.perf_counter()
+            _decode_file(path)
+            single.append(time.perf_counter() - start)
+
+        timings = {"serial": sum(single), "slowest file": max(single)}
+        executors = {
+            "threads": lambda: ThreadPoolExecutor(max_workers=workers),
+            "processes": lambda: ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")),
+        }
+        for name, make in executors.items():
+            with make() as pool:
+                list(pool.map(_decode_file, paths))  # start every worker outside the timing
+                start = time.perf_counter()
+                list(pool.map(_decode_file, paths))
+                timings[name] = time.perf_counter() - start
+
+    for name, seconds in timings.items():
+        print(f"{name:<14}{seconds:>8.2f}s")
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark nClimDiv conversion against the legacy code path")
+    parser.add_argument("--counties", type=int, default=3100)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--memory-budget-mb", type=int, default=64)
+    args = parser.parse_args()
+
+    benchmark_parse(args.counties, args.years)
+    benchmark_merge(args.counties, args.years)
+    benchmark_parallel(args.counties, args.years)
+    benchmark_stream(args.memory_budget_mb, n_counties=args.counties)
@@ -0,0 +1,73 @@
+import argparse
+import os
+import tempfile
+import time
+
+from src.local.s3 import LocalS3Server
+from src.data.uploader import MAX_CONCURRENCY, MAX_WORKERS, MB, upload_files
+
+BUCKET = "benchmark-raw-bucket"
+
+
+def make_dataset(folder, large_mb, small_mb, n_small=5):
+    """One fpa_fod-sized file plus `n_small` nClimDiv-sized files of random bytes."""
+    files = {}
+    sizes = {"fpa_fod.csv": large_mb, **{f"climdiv-{i}.dat": small_mb for i in range(n_small)}}
+    for name, size_mb in sizes.items():
+        path = os.path.join(folder, name)
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(os.urandom(MB))
+        files[path] = f"raw/{name}"
+    return files
+
+
+def sequential_defaults(server, files):
+    """The original scripts: a fresh client per dataset, default transfer settings, one file at a time."""
+    for local_path, key in files.items():
+        server.client().upload_file(local_path, BUCKET, key)
+
+
+def benchmark_uploads(large_mb=256, small_mb=8, latency=0.02, bandwidth_mb=25):
+    print(f"🧪 Local S3 stand-in: {latency * 1000:.0f} ms per request, {bandwidth_mb} MB/s per connection")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_dataset(tmp, large_mb, small_mb)
+        manifest_path = os.path.join(tmp, "manifest.json")
+        total_mb = sum(os.path.getsize(p) for p in files) / MB
+
+        timings = {}
+        for name in ("sequential", "engine"):
+            with LocalS3Server(latency=latency, bandwidth=bandwidth_mb * MB) as server:
+                start = time.perf_counter()
+                if name == "sequential":
+                    sequential_defaults(server, files)
+                else:
+                    client = server.client(max_pool_connections=MAX_WORKERS * MAX_CONCURRENCY)
+                    upload_files(files, BUCKET, s3=client, manifest_path=manifest_path)
+                timings[name] = time.perf_counter() - start
+                assert all(len(server.store.body(BUCKET, key)) == os.path.getsize(p) for p, key in files.items())
+
+            if name == "engine":
+                # Unchanged data: the manifest supplies the hashes and S3 only sees HEAD requests
+                sent = server.store.bytes_received()
+                start = time.perf_counter()
+                upload_files(files, BUCKET, s3=client, manifest_path=manifest_path)
+                timings["unchanged rerun"] = time.perf_counter() - start
+                print(f"⏭️ Rerun sent {server.store.bytes_received() - sent} bytes of object data")
+
+    print(f"{'uploader':<16}{'seconds':>10}{'MB/s':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<16}{seconds:>10.2f}{total_mb / seconds:>10.1f}")
+    print(f"🚀 Speedup: {timings['sequential'] / timings['engine']:.1f}x, unchanged rerun {timings['sequential'] / timings['unchanged rerun']:.0f}x")
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the raw-data upload engine against a local S3 stand-in")
+    parser.add_argument("--large-mb", type=int, default=256)
+    parser.add_argument("--small-mb", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--bandwidth-mb", type=float, default=25)
+    args = parser.parse_args()
+
+    benchmark_uploads(args.large_mb, args.small_mb, args.latency_ms / 1000, args.bandwidth_mb)
@@ -1,11 +1,21 @@
-import boto3
+import argparse
+import multiprocessing as mp
 import io
+import os
 import re
-import pandas as pd
-from src.config import RAW_BUCKET, PROCESSED_BUCKET, NCLIMDIV_RAW_PREFIX, NCLIMDIV_PROCESSED_PREFIX
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_manifest import load_manifest, manifest_key, save_manifest
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_merge import merge_wide
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parquet import write_parquet_partitions
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import concat_records, iter_decode_records
+from src.config import get_client, settings, NCLIMDIV_MERGED_LOCAL_PATH, NCLIMDIV_MERGED_TABLE_NAME, NCLIMDIV_RAW_PREFIX, NCLIMDIV_PROCESSED_PREFIX
+from src.glue_athena.partitions import glue_type, register_parquet_dataset
 
-# Initialize S3 client
-s3 = boto3.client("s3")
+# Raw files are read in chunks of this size instead of all at once
+READ_CHUNK_SIZE = 8 * 1024 * 1024
 
 # Fixed mappings
 PREFIX_MAP = {
@@ -16,77 +26,144 @@ PREFIX_MAP = {
     "pdsi": "pdsi"
 }
 
-def parse_fixed_width_lines(lines, var_name):
-    records = []
-    for line in lines:
-        try:
-            state = line[0:2]
-            county = line[2:5]
-            year = int(line[7:11])
-            for i in range(12):
-                start = 11 + i * 7
-                value_str = line[start:start + 7].strip()
-                if not value_str or value_str in {"-9.99", "-99.99", "-9999"}:
-                    continue
-                value = float(value_str)
-                records.append({
-                    "state_code": state,
-                    "county_fips": county,
-                    "year": year,
-                    "month": i + 1,
-                    var_name: value
-                })
-        except Exception as e:
-            print(f"⚠️ Skipped line due to error: {e}")
-    return pd.DataFrame(records)
-
-def convert_and_merge_all():
-    print("🚀 Starting nClimDiv merged CSV generation...")
-
-    response = s3.list_objects_v2(Bucket=RAW_BUCKET, Prefix=NCLIMDIV_RAW_PREFIX)
-    dat_files = [
-        obj["Key"] for obj in response.get("Contents", [])
-        if obj["Key"].endswith(".dat") and "climdiv-" in obj["Key"]
-    ]
+def upload_merged_csv(merged_df):
+    csv_buffer = io.StringIO()
+    merged_df.to_csv(csv_buffer, index=False)
+    s3_key = f"{NCLIMDIV_PROCESSED_PREFIX}nclimdiv_merged.csv"
+    get_client("s3").put_object(
+        Bucket=settings.processed_bucket,
+        Key=s3_key,
+        Body=csv_buffer.getvalue().encode("utf-8")
+    )
+    print(f"✅ Merged CSV uploaded to s3://{settings.processed_bucket}/{s3_key}")
 
-    merged_df = None
+def upload_merged_parquet(merged_df, partition_by_state=False, manifest=None):
+    table_prefix = f"{NCLIMDIV_PROCESSED_PREFIX}merged/"
+    partition_cols = ["year", "state_code"] if partition_by_state else ["year"]
+    fingerprints = manifest["partitions"] if manifest is not None else None
+    keys = write_parquet_partitions(get_client("s3"), settings.processed_bucket, table_prefix, merged_df, partition_cols, fingerprints=fingerprints)
+    print(f"✅ Merged Parquet: {len(keys)} changed partitions uploaded to s3://{settings.processed_bucket}/{table_prefix}")
+    if keys:
+        schema = pa.Schema.from_pandas(merged_df, preserve_index=False)
+        register_parquet_dataset(
+            settings.nclimdiv_database_name,
+            NCLIMDIV_MERGED_TABLE_NAME,
+            settings.processed_bucket,
+            table_prefix,
+            keys,
+            pa.schema([f for f in schema if f.name not in partition_cols]),
+            [(col, glue_type(schema.field(col).type)) for col in partition_cols],
+            crawler_name=settings.nclimdiv_crawler_name,
+        )
 
-    for key in dat_files:
-        print(f"📄 Processing: {key}")
-        match = re.search(r"climdiv-([a-z]+)cy", key)
-        if not match:
-            print(f"⚠️ Skipping unknown format: {key}")
-            continue
-        var_prefix = match.group(1)
-        var_name = PREFIX_MAP.get(var_prefix, var_prefix)
+def variable_name(key):
+    """The merged column a raw file becomes (climdiv-tmpccy -> tavg), or None if it is not one."""
+    match = re.search(r"climdiv-([a-z]+)cy", key)
+    return PREFIX_MAP.get(match.group(1), match.group(1)) if match else None
 
-        obj = s3.get_object(Bucket=RAW_BUCKET, Key=key)
-        lines = obj["Body"].read().decode("utf-8").splitlines()
-        df = parse_fixed_width_lines(lines, var_name)
+def load_variable(key):
+    print(f"📄 Processing: {key}")
+    var_name = variable_name(key)
+    if var_name is None:
+        print(f"⚠️ Skipping unknown format: {key}")
+        return None, None
 
-        if df.empty:
-            print(f"⚠️ No valid data found in {key}")
-            continue
+    obj = get_client("s3").get_object(Bucket=settings.raw_bucket, Key=key)
+    records = concat_records(iter_decode_records(obj["Body"].iter_chunks(READ_CHUNK_SIZE)))
+
+    if np.isnan(records.values).all():
+        print(f"⚠️ No valid data found in {key}")
+        return None, None
+    return var_name, records
+
+def make_executor(executor, workers):
+    # Parsing is CPU-bound and holds the GIL for the float conversion, so separate
+    # processes are what lets five files finish in the time of the slowest one.
+    # Spawned workers build their own boto3 client instead of inheriting ours.
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=workers)
+
+def convert_and_merge_all(output_format="csv", partition_by_state=False, incremental=True, workers=5, executor="process"):
+    print(f"🚀 Starting nClimDiv merged {output_format} generation...")
+
+    # Every page, so the incremental check below never compares a truncated listing
+    pages = get_client("s3").get_paginator("list_objects_v2").paginate(Bucket=settings.raw_bucket, Prefix=NCLIMDIV_RAW_PREFIX)
+    source_etags = {
+        obj["Key"]: obj["ETag"] for page in pages for obj in page.get("Contents", [])
+        if obj["Key"].endswith(".dat") and "climdiv-" in obj["Key"]
+    }
+    dat_files = list(source_etags)
+
+    # Incremental mode only applies to partitioned output; a CSV is always rewritten whole
+    manifest = None
+    if output_format == "parquet" and incremental:
+        manifest = load_manifest(get_client("s3"), settings.processed_bucket, manifest_key("merged"))
+        if manifest["source_etags"] == source_etags:
+            print("⏭️ Raw nClimDiv files unchanged since last run, nothing to do.")
+            return
 
-        if merged_df is None:
-            merged_df = df
+    # Downloads and parses overlap across files; results keep the listing order so
+    # the merged column order does not depend on which file finishes first
+    with make_executor(executor, max(1, workers)) as pool:
+        loaded = list(pool.map(load_variable, dat_files))
+    records_by_var = {var_name: records for var_name, records in loaded if var_name is not None}
+
+    if records_by_var:
+        print(f"🧩 Merging {', '.join(records_by_var)}...")
+        merged_df = merge_wide(records_by_var)
+        if output_format == "parquet":
+            upload_merged_parquet(merged_df, partition_by_state, manifest)
+            if manifest is not None:
+                manifest["source_etags"] = source_etags
+                save_manifest(get_client("s3"), settings.processed_bucket, manifest_key("merged"), manifest)
         else:
-            merged_df = pd.merge(merged_df, df, on=["state_code", "county_fips", "year", "month"], how="outer")
-
-    if merged_df is not None:
-        csv_buffer = io.StringIO()
-        merged_df.to_csv(csv_buffer, index=False)
-        s3_key = f"{NCLIMDIV_PROCESSED_PREFIX}nclimdiv_merged.csv"
-        s3.put_object(
-            Bucket=PROCESSED_BUCKET,
-            Key=s3_key,
-            Body=csv_buffer.getvalue().encode("utf-8")
-        )
-        print(f"✅ Merged CSV uploaded to s3://{PROCESSED_BUCKET}/{s3_key}")
+            upload_merged_csv(merged_df)
     else:
         print("⚠️ No data was processed, no file uploaded.")
 
     print("🎉 All conversions complete.")
 
+def write_local_merged(paths=None, output_path=NCLIMDIV_MERGED_LOCAL_PATH):
+    """Merge raw files on disk (default: the ones upload_nclimdiv sends) into one local Parquet file.
+
+    This is the nclimdiv_merged table the local analysis backend reads, no AWS needed.
+    """
+    from src.data.upload_nclimdiv import nclimdiv_upload_plan
+
+    records_by_var = {}
+    for path in paths or nclimdiv_upload_plan():
+        var_name = variable_name(os.path.basename(path))
+        if var_name is None or not os.path.exists(path):
+            print(f"⚠️ Skipping {path}")
+            continue
+        with open(path, "rb") as f:
+            records_by_var[var_name] = concat_records(iter_decode_records(iter(lambda: f.read(READ_CHUNK_SIZE), b"")))
+    if not records_by_var:
+        raise RuntimeError("❌ No raw nClimDiv files found to merge")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(merge_wide(records_by_var), preserve_index=False), output_path)
+    print(f"✅ Merged {', '.join(records_by_var)} into {output_path}")
+    return output_path
+
 if __name__ == "__main__":
-    convert_and_merge_all()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Convert raw nClimDiv files into one merged table")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--partition-by-state", action="store_true", help="Parquet only: add a state_code partition under year")
+    parser.add_argument("--full", action="store_true", help="Parquet only: rewrite every partition, ignoring the manifest")
+    parser.add_argument("--workers", type=int, default=5, help="Files downloaded and parsed concurrently")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--local", action="store_true", help=f"Merge the raw files in data/ into {NCLIMDIV_MERGED_LOCAL_PATH} instead")
+    args = parser.parse_args()
+
+    if args.local:
+        write_local_merged()
+    else:
+        convert_and_merge_all(
+            args.format,
+            args.partition_by_state,
+            incremental=not args.full,
+            workers=args.workers,
+            executor=args.executor,
+        )
@@ -0,0 +1,107 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_merge import KEY_COLUMNS
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import (
+    decode_records,
+    iter_decode_records,
+    parse_fixed_width,
+    to_long_frame,
+)
+
+# Synthetic nClimDiv inputs and the original implementations, shared by the
+# unit tests (as reference results) and scripts/benchmark_nclimdiv.py (as baselines)
+
+
+def make_synthetic_dat(n_counties=3100, n_years=30, first_year=1991, element="02", seed=0):
+    """Build a climdiv-style county file with ~2% missing (-99.99) values."""
+    rng = np.random.default_rng(seed)
+    n = n_counties * n_years
+    values = np.round(rng.normal(55.0, 20.0, size=(n, 12)), 2)
+    values[rng.random((n, 12)) < 0.02] = -99.99
+
+    county_idx = np.repeat(np.arange(n_counties), n_years)
+    years = np.tile(np.arange(first_year, first_year + n_years), n_counties)
+    lines = [
+        f"{1 + c // 100:02d}{1 + 2 * (c % 100):03d}{element}{y:04d}"
+        + "".join(f"{v:7.2f}" for v in row)
+        for c, y, row in zip(county_idx, years, values)
+    ]
+    return ("\n".join(lines) + "\n").encode("ascii")
+
+
+def legacy_parse_fixed_width_lines(lines, var_name):
+    """The original per-line, dict-per-value parser, kept as the baseline."""
+    records = []
+    for line in lines:
+        try:
+            state = line[0:2]
+            county = line[2:5]
+            year = int(line[7:11])
+            for i in range(12):
+                start = 11 + i * 7
+                value_str = line[start:start + 7].strip()
+                if not value_str or value_str in {"-9.99", "-99.99", "-9999"}:
+                    continue
+                value = float(value_str)
+                records.append({
+                    "state_code": state,
+                    "county_fips": county,
+                    "year": year,
+                    "month": i + 1,
+                    var_name: value
+                })
+        except Exception as e:
+            print(f"⚠️ Skipped line due to error: {e}")
+    return pd.DataFrame(records)
+
+
+def chained_merge(records_by_var):
+    """The original merge: one outer join per additional variable."""
+    merged_df = None
+    for var_name, records in records_by_var.items():
+        df = to_long_frame(records, var_name)
+        if merged_df is None:
+            merged_df = df
+        else:
+            merged_df = pd.merge(merged_df, df, on=KEY_COLUMNS, how="outer")
+    return merged_df
+
+
+def synthetic_variables(n_counties, n_years):
+    """Five variables over slightly different county/year coverage, like real releases."""
+    shapes = {
+        "tmax": (n_counties, n_years),
+        "tmin": (n_counties, n_years),
+        "tavg": (n_counties, n_years),
+        "precipitation": (n_counties, n_years - 1),
+        "pdsi": (n_counties - n_counties // 50, n_years),
+    }
+    return {
+        name: decode_records(make_synthetic_dat(c, y, seed=seed))
+        for seed, (name, (c, y)) in enumerate(shapes.items())
+    }
+
+
+def _iter_chunks(buf, chunk_size):
+    for start in range(0, len(buf), chunk_size):
+        yield buf[start:start + chunk_size]
+
+
+def convert_peak_bytes(buf, chunk_size=None):
+    """Traced peak allocation of a CSV conversion of `buf`, excluding the input itself.
+
+    With `chunk_size` the conversion streams like the Lambda does; without it the
+    whole buffer is parsed and serialized at once.
+    """
+    tracemalloc.start()
+    try:
+        if chunk_size is None:
+            parse_fixed_width(buf, "tavg").to_csv(index=False).encode("utf-8")
+        else:
+            for i, records in enumerate(iter_decode_records(_iter_chunks(buf, chunk_size))):
+                to_long_frame(records, "tavg").to_csv(index=False, header=i == 0).encode("utf-8")
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,43 @@
+import argparse
+import os
+
+from scripts.profile_lambda_imports import import_times
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = (
+    "src.config",
+    "src.orchestrator.run_fpa_fod_crawler",
+    "src.orchestrator.run_nclimdiv_crawler",
+    "src.orchestrator.run_wrc_crawler",
+    "src.orchestrator.crawlers",
+    "src.orchestrator.pipeline",
+    "src.data.upload_fpa_fod",
+    "src.data.upload_wrc",
+    "src.data.upload_nclimdiv",
+    "src.data.upload_all",
+    "src.data.upload_fpa_fod_parquet",
+    "scripts.convert_nclimdiv_manually",
+)
+
+
+def entry_point_times(modules=ENTRY_POINTS, repeat=3):
+    """Best-of-`repeat` cold import time in ms for each module, and whether it pulled in boto3."""
+    results = {}
+    for module in modules:
+        runs = [import_times(f"import {module}", cwd=PROJECT_ROOT) for _ in range(repeat)]
+        results[module] = {
+            "ms": min(run[module] for run in runs) / 1000,
+            "boto3": any("boto3" in run for run in runs),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile cold import time of the src/ and scripts/ entry points")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'entry point':<42}{'import ms':>10}{'boto3':>7}")
+    for module, r in entry_point_times(repeat=args.repeat).items():
+        print(f"{module:<42}{r['ms']:>10.1f}{'yes' if r['boto3'] else 'no':>7}")
@@ -0,0 +1,73 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "infra", "lambdas", "download_nclimdiv_data")
+
+# Cold-start budgets for the download Lambda; the import-time budget is only
+# reported here, since it depends on the machine that measures it
+IMPORT_BUDGET_MS = 150
+PACKAGE_BUDGET_MB = 2.5
+LAZY_MODULES = ("boto3", "botocore", "requests", "urllib3", "bs4")
+
+
+def import_times(statement="import lambda_function", cwd=ASSET_DIR):
+    """Run `statement` under `python -X importtime` and return {module: cumulative µs}."""
+    env = dict(os.environ, RAW_BUCKET=os.environ.get("RAW_BUCKET", "profile-raw-bucket"), PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def package_size(asset_dir=ASSET_DIR):
+    """Bytes the asset would ship with, ignoring bytecode caches."""
+    total = 0
+    for root, dirs, files in os.walk(asset_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def profile(top=10):
+    times = import_times()
+    handler_ms = times.get("lambda_function", 0) / 1000
+    size_mb = package_size() / (1024 * 1024)
+    eager = sorted(m for m in times if m.split(".")[0] in LAZY_MODULES)
+
+    print(f"📦 Package size: {size_mb:.2f} MB (budget {PACKAGE_BUDGET_MB} MB)")
+    print(f"⏱️ Cold import of lambda_function: {handler_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"{'module':<40}{'cumulative ms':>15}")
+    for name, us in sorted(times.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{name:<40}{us / 1000:>15.1f}")
+
+    first_call = import_times("import lambda_function; lambda_function.get_s3(); lambda_function.get_session()")
+    print(f"🐢 First handler call adds {(sum(first_call[m] for m in ('boto3', 'requests') if m in first_call)) / 1000:.0f} ms of deferred imports")
+
+    problems = []
+    if handler_ms > IMPORT_BUDGET_MS:
+        problems.append(f"cold import {handler_ms:.1f} ms > {IMPORT_BUDGET_MS} ms")
+    if size_mb > PACKAGE_BUDGET_MB:
+        problems.append(f"package {size_mb:.2f} MB > {PACKAGE_BUDGET_MB} MB")
+    if eager:
+        problems.append(f"imported at module load: {', '.join(eager)}")
+    for problem in problems:
+        print(f"❌ {problem}")
+    return not problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile cold-start imports of the nClimDiv download Lambda")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    sys.exit(0 if profile(args.top) else 1)
@@ -1,75 +1,183 @@
 import os
 import json
+import threading
+from functools import cached_property
 from pathlib import Path
-from dotenv import load_dotenv
-import boto3
 
-# Load environment variables
-load_dotenv()
-
-# Set AWS region
-REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+# Nothing here touches the network, the filesystem or boto3 at import time:
+# settings resolve on first access (`from src.config import RAW_BUCKET` counts)
+# and AWS clients are created on first use from one shared session.
 
 # Project root and CDK outputs path
 project_root = Path(__file__).resolve().parents[1]
 CDK_OUTPUTS_PATH = project_root / "cdk_outputs.json"
 
-if not CDK_OUTPUTS_PATH.exists():
-    raise FileNotFoundError(
-        "❌ cdk_outputs.json not found. Run:\n\n  cdk deploy --outputs-file cdk_outputs.json"
-    )
-
-# Load CDK outputs
-with open(CDK_OUTPUTS_PATH) as f:
-    cdk_outputs = json.load(f)["WildfireRiskAnalyticsStack"]
-
-# S3 Buckets
-RAW_BUCKET = os.getenv("RAW_BUCKET", cdk_outputs["RawBucketName"])
-PROCESSED_BUCKET = os.getenv("PROCESSED_BUCKET", cdk_outputs["ProcessedBucketName"])
-
-# Glue & Athena
-GLUE_IAM_ROLE = os.getenv("GLUE_IAM_ROLE", cdk_outputs["GlueRoleArn"])
-FPA_FOD_CRAWLER_NAME = os.getenv("FPA_FOD_CRAWLER_NAME", cdk_outputs["FpaFodCrawlerName"])
-NCLIMDIV_CRAWLER_NAME = os.getenv("NCLIMDIV_CRAWLER_NAME", cdk_outputs["NclimdivCrawlerName"])
-
 ATHENA_OUTPUT_PREFIX = "athena-results/"
-ATHENA_OUTPUT_LOCATION = f"s3://{PROCESSED_BUCKET}/{ATHENA_OUTPUT_PREFIX}"
 
 # FPA FOD paths
 FPA_FOD_LOCAL_PATH = "data/fpa_fod.csv"
 FPA_FOD_S3_KEY = "fpa-fod/fpa_fod.csv"
+FPA_FOD_PARQUET_LOCAL_DIR = "data/fpa_fod_parquet"
+FPA_FOD_PARQUET_PREFIX = "fpa-fod/"
+# Cleaned sample bundled with the notebooks: large fires (over 1,000 acres) only
+FPA_FOD_SAMPLE_PATH = "notebooks/eda/data/cleaned_fpa_fod.csv"
+# Table the fpa_ crawler would name the Parquet under fpa-fod/
+FPA_FOD_TABLE_NAME = "fpa_fpa_fod"
 
 # S3 prefixes
 NCLIMDIV_RAW_PREFIX = "nclimdiv-county/"
 NCLIMDIV_PROCESSED_PREFIX = "nclimdiv/"
+NCLIMDIV_MERGED_TABLE_NAME = "nclimdiv_merged"
+# Written by `python -m scripts.convert_nclimdiv_manually --local` from the raw files in data/
+NCLIMDIV_MERGED_LOCAL_PATH = "data/nclimdiv_merged.parquet"
+
+# ERA5: hourly NetCDF copied from the public bucket into the raw bucket under era5/
+ERA5_PUBLIC_BUCKET = "era5-pds"
+ERA5_RAW_PREFIX = "era5/"
+ERA5_PROCESSED_PREFIX = "era5/"
 
-# AWS clients
-glue = boto3.client("glue", region_name=REGION)
+# WRC upload config
+WRC_LOCAL_PATH = str(Path("data/WRC_V2_County_Summary.csv"))
+WRC_S3_KEY = "wrc-v2/WRC_V2_County_Summary.csv"
+
+_env_loaded = False
+
+
+def load_env():
+    """Load `.env` once, the first time any setting is needed."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+class Settings:
+    """Deployment settings, each resolved from the environment or cdk_outputs.json on first access."""
+
+    def __init__(self, outputs_path=CDK_OUTPUTS_PATH):
+        self.outputs_path = Path(outputs_path)
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    @cached_property
+    def cdk_outputs(self):
+        load_env()
+        if not self.outputs_path.exists():
+            raise FileNotFoundError(
+                "❌ cdk_outputs.json not found. Run:\n\n  cdk deploy --outputs-file cdk_outputs.json"
+            )
+        with open(self.outputs_path) as f:
+            return json.load(f)["WildfireRiskAnalyticsStack"]
+
+    def _resolve(self, env_name, output_key):
+        load_env()
+        return os.getenv(env_name) or self.cdk_outputs[output_key]
+
+    @cached_property
+    def region(self):
+        load_env()
+        return os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+
+    # S3 Buckets
+    @cached_property
+    def raw_bucket(self):
+        return self._resolve("RAW_BUCKET", "RawBucketName")
+
+    @cached_property
+    def processed_bucket(self):
+        return self._resolve("PROCESSED_BUCKET", "ProcessedBucketName")
+
+    # ERA5 source
+    @cached_property
+    def era5_bucket(self):
+        load_env()
+        return os.getenv("ERA5_BUCKET", ERA5_PUBLIC_BUCKET)
+
+    @cached_property
+    def era5_data_prefix(self):
+        load_env()
+        prefix = os.getenv("ERA5_DATA_PREFIX")
+        if not prefix:
+            # An empty prefix would copy the whole public archive
+            raise RuntimeError("❌ ERA5_DATA_PREFIX is not set, e.g. ERA5_DATA_PREFIX=2020/07/ for one month")
+        return prefix
+
+    # Glue & Athena
+    @cached_property
+    def glue_iam_role(self):
+        return self._resolve("GLUE_IAM_ROLE", "GlueRoleArn")
+
+    @cached_property
+    def fpa_fod_database_name(self):
+        return self._resolve("FPA_FOD_DATABASE_NAME", "FpaFodDatabaseName")
+
+    @cached_property
+    def nclimdiv_database_name(self):
+        return self._resolve("NCLIMDIV_DATABASE_NAME", "NclimdivDatabaseName")
+
+    @cached_property
+    def fpa_fod_crawler_name(self):
+        return self._resolve("FPA_FOD_CRAWLER_NAME", "FpaFodCrawlerName")
+
+    @cached_property
+    def nclimdiv_crawler_name(self):
+        return self._resolve("NCLIMDIV_CRAWLER_NAME", "NclimdivCrawlerName")
+
+    @cached_property
+    def wrc_crawler_name(self):
+        return self._resolve("WRC_CRAWLER_NAME", "WrcCrawlerName")
+
+    @cached_property
+    def athena_output_location(self):
+        return f"s3://{self.processed_bucket}/{ATHENA_OUTPUT_PREFIX}"
+
+    @cached_property
+    def catalog(self):
+        """Glue catalog lookups, cached for GLUE_CATALOG_TTL_SECONDS (and on disk if GLUE_CATALOG_CACHE is set)."""
+        from src.glue_athena.catalog import DEFAULT_TTL_SECONDS, GlueCatalogCache
+        load_env()
+        return GlueCatalogCache(
+            self.client("glue"),
+            ttl=int(os.getenv("GLUE_CATALOG_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            path=os.getenv("GLUE_CATALOG_CACHE"),
+        )
+
+    # AWS clients
+    @cached_property
+    def session(self):
+        import boto3
+        return boto3.session.Session(region_name=self.region)
+
+    def client(self, service_name):
+        """One client per service, shared by every caller (boto3 clients are thread-safe)."""
+        with self._lock:
+            if service_name not in self._clients:
+                self._clients[service_name] = self.session.client(service_name)
+            return self._clients[service_name]
+
+
+settings = Settings()
+
+
+def get_client(service_name):
+    return settings.client(service_name)
+
+
+def __getattr__(name):
+    # Module-level settings (REGION, RAW_BUCKET, ...) and the legacy `glue` client
+    if name == "glue":
+        return get_client("glue")
+    if name.isupper() and hasattr(Settings, name.lower()):
+        return getattr(settings, name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ---------- Dynamic Glue helpers ----------
 
 def get_database_name(prefix: str) -> str:
     """Find the Glue database name starting with a given prefix."""
-    paginator = glue.get_paginator("get_databases")
-    for page in paginator.paginate():
-        for db in page["DatabaseList"]:
-            if db["Name"].startswith(prefix.lower()):
-                return db["Name"]
-    raise ValueError(f"No database found with prefix: {prefix}")
+    return settings.catalog.database_name(prefix)
 
 def get_table_names(database_name: str, prefix: str = "") -> list[str]:
     """List all tables in a database, optionally filtered by prefix."""
-    tables = []
-    paginator = glue.get_paginator("get_tables")
-    for page in paginator.paginate(DatabaseName=database_name):
-        for table in page["TableList"]:
-            if table["Name"].startswith(prefix.lower()):
-                tables.append(table["Name"])
-    return tables
-
-NCLIMDIV_CRAWLER_NAME = cdk_outputs["NclimdivCrawlerName"]
-WRC_CRAWLER_NAME = cdk_outputs["WrcCrawlerName"]
-
-# WRC upload config
-WRC_LOCAL_PATH = str(Path("data/WRC_V2_County_Summary.csv"))
-WRC_S3_KEY = "wrc-v2/WRC_V2_County_Summary.csv"
\ No newline at end of file
+    return settings.catalog.table_names(database_name, prefix)
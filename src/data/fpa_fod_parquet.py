@@ -0,0 +1,163 @@
+import csv
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+
+MB = 1024 * 1024
+
+# The raw CSV stores every column as text; these get real types in Parquet.
+# Integers are read as float64 first because exports often write "2016.0".
+INTEGER_COLUMNS = {
+    "fod_id": pa.int64(),
+    "fire_year": pa.int16(),
+    "discovery_doy": pa.int16(),
+    "cont_doy": pa.int16(),
+}
+FLOAT_COLUMNS = ("fire_size", "latitude", "longitude")
+
+PARTITION_COLS = ("fire_year", "state")
+COMPRESSIONS = ("snappy", "zstd")
+
+# The CSV is read in BLOCK_SIZE blocks; the largest single fire year is the most
+# that is ever held in memory at once (a few hundred thousand rows for FPA-FOD)
+BLOCK_SIZE = 16 * MB
+ROW_GROUP_SIZE = 1_000_000
+SPILL_COMPRESSION = "lz4"
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def read_header(csv_path):
+    """Column names from the CSV header, lowercased to match the Glue/Athena schema."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return [name.strip().lower() for name in next(csv.reader(f))]
+
+
+def _record_end(buf):
+    """Offset just past the last newline in `buf` that ends a CSV record (is outside quotes), or 0."""
+    # `buf` starts at a record boundary, so a newline is outside quotes when the
+    # number of quote characters before it is even ("" escapes count as two)
+    cut = buf.rfind(b"\n")
+    quotes = buf.count(b'"', 0, cut)
+    while cut != -1 and quotes % 2:
+        prev = buf.rfind(b"\n", 0, cut)
+        quotes -= buf.count(b'"', prev + 1, cut)
+        cut = prev
+    return cut + 1
+
+
+def iter_line_blocks(f, block_size=BLOCK_SIZE):
+    """Read `f` in ~`block_size` byte blocks that always end on a record boundary.
+
+    Quoted values may contain newlines (free-text fire names), so a block is only
+    cut at a newline outside quotes.
+    """
+    tail = b""
+    while True:
+        chunk = f.read(block_size)
+        if not chunk:
+            break
+        buf = tail + chunk
+        cut = _record_end(buf)
+        tail = buf[cut:]
+        if cut:
+            yield buf[:cut]
+    if tail.strip():
+        yield tail
+
+
+def iter_typed_batches(csv_path, block_size=BLOCK_SIZE):
+    """Stream the CSV in `block_size` blocks and yield batches with the typed schema."""
+    names = read_header(csv_path)
+    read_types = {
+        name: pa.float64() if name in INTEGER_COLUMNS or name in FLOAT_COLUMNS else pa.string()
+        for name in names
+    }
+    schema = pa.schema([(name, INTEGER_COLUMNS.get(name, read_types[name])) for name in names])
+    read_options = pv.ReadOptions(column_names=names)
+    parse_options = pv.ParseOptions(newlines_in_values=True)
+    convert_options = pv.ConvertOptions(column_types=read_types, strings_can_be_null=True)
+
+    def batches():
+        # Blocks are cut here rather than by pv.open_csv, which reads ahead the whole file
+        with open(csv_path, "rb") as f:
+            f.readline()
+            for block in iter_line_blocks(f, block_size):
+                table = pv.read_csv(
+                    pa.py_buffer(block), read_options=read_options, parse_options=parse_options, convert_options=convert_options
+                )
+                for batch in table.to_batches():
+                    columns = [
+                        pc.cast(batch.column(name), INTEGER_COLUMNS[name]) if name in INTEGER_COLUMNS else batch.column(name)
+                        for name in names
+                    ]
+                    yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    return schema, batches()
+
+
+def _hive(schema, cols):
+    return ds.partitioning(pa.schema([schema.field(col) for col in cols]), flavor="hive")
+
+
+def _partition_value(dirname, field):
+    value = dirname.split("=", 1)[1]
+    return pa.scalar(None if value == NULL_PARTITION else int(value), field.type)
+
+
+def convert_csv_to_parquet(csv_path, out_dir, compression="snappy", block_size=BLOCK_SIZE):
+    """Convert the FPA-FOD CSV into Hive-partitioned Parquet under `out_dir`; returns the written files.
+
+    Rows are spilled to per-year files first and then written out one fire year at
+    a time, so every `fire_year=/state=` partition ends up as a single file
+    without the whole CSV ever being in memory.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+    schema, batches = iter_typed_batches(csv_path, block_size)
+    missing = [col for col in PARTITION_COLS if col not in schema.names]
+    if missing:
+        raise ValueError(f"FPA-FOD CSV is missing partition columns: {missing}")
+
+    year_col, state_col = PARTITION_COLS
+    written = []
+    os.makedirs(out_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(out_dir))) as staging:
+        ds.write_dataset(
+            pa.RecordBatchReader.from_batches(schema, batches),
+            staging,
+            format="parquet",
+            partitioning=_hive(schema, [year_col]),
+            file_options=ds.ParquetFileFormat().make_write_options(compression=SPILL_COMPRESSION),
+        )
+
+        for year_dir in sorted(os.listdir(staging)):
+            year = ds.dataset(os.path.join(staging, year_dir), format="parquet").to_table()
+            year = year.append_column(
+                schema.field(year_col),
+                pa.repeat(_partition_value(year_dir, schema.field(year_col)), year.num_rows),
+            )
+            ds.write_dataset(
+                year.sort_by(state_col).select(schema.names),
+                out_dir,
+                format="parquet",
+                partitioning=_hive(schema, PARTITION_COLS),
+                basename_template="part-{i}.parquet",
+                existing_data_behavior="delete_matching",
+                file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+                min_rows_per_group=ROW_GROUP_SIZE,
+                max_rows_per_group=ROW_GROUP_SIZE,
+                file_visitor=lambda f: written.append(f.path),
+            )
+
+    print(f"🪵 Wrote {len(written)} Parquet files ({compression}) under {out_dir}")
+    return sorted(written)
+
+
+def partition_keys(files, out_dir, prefix):
+    """Map local Parquet files to S3 keys that keep their `fire_year=/state=` layout."""
+    prefix = prefix.rstrip("/")
+    return {path: f"{prefix}/{os.path.relpath(path, out_dir).replace(os.sep, '/')}" for path in files}
@@ -0,0 +1,15 @@
+from src.config import settings, FPA_FOD_LOCAL_PATH, FPA_FOD_S3_KEY, WRC_LOCAL_PATH, WRC_S3_KEY
+from src.data.upload_nclimdiv import nclimdiv_upload_plan
+from src.data.uploader import upload_files
+
+def upload_all_datasets():
+    """Upload FPA-FOD, WRC and the nClimDiv files in one concurrent batch."""
+    files = {
+        FPA_FOD_LOCAL_PATH: FPA_FOD_S3_KEY,
+        WRC_LOCAL_PATH: WRC_S3_KEY,
+        **nclimdiv_upload_plan(),
+    }
+    return upload_files(files, settings.raw_bucket)
+
+if __name__ == "__main__":
+    upload_all_datasets()
@@ -0,0 +1,36 @@
+import argparse
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.config import settings, FPA_FOD_LOCAL_PATH, FPA_FOD_PARQUET_LOCAL_DIR, FPA_FOD_PARQUET_PREFIX, FPA_FOD_TABLE_NAME
+from src.data.fpa_fod_parquet import COMPRESSIONS, INTEGER_COLUMNS, PARTITION_COLS, convert_csv_to_parquet, partition_keys
+from src.data.uploader import upload_files
+from src.glue_athena.partitions import glue_type, register_parquet_dataset
+
+def upload_fpa_fod_parquet(compression="snappy", raise_on_failure=False, register=True):
+    """Convert the local FPA-FOD CSV to partitioned Parquet, upload it and register its partitions in Glue."""
+    files = convert_csv_to_parquet(FPA_FOD_LOCAL_PATH, FPA_FOD_PARQUET_LOCAL_DIR, compression=compression)
+    keys = partition_keys(files, FPA_FOD_PARQUET_LOCAL_DIR, FPA_FOD_PARQUET_PREFIX)
+    results = upload_files(keys, settings.processed_bucket, raise_on_failure=raise_on_failure)
+    if register and files:
+        # Partition columns live in the object path, not in the files
+        register_parquet_dataset(
+            settings.fpa_fod_database_name,
+            FPA_FOD_TABLE_NAME,
+            settings.processed_bucket,
+            FPA_FOD_PARQUET_PREFIX,
+            list(keys.values()),
+            pq.read_schema(files[0]).remove_metadata(),
+            [(col, glue_type(INTEGER_COLUMNS.get(col, pa.string()))) for col in PARTITION_COLS],
+            crawler_name=settings.fpa_fod_crawler_name,
+        )
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert FPA-FOD CSV to Parquet partitioned by fire_year and state")
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="snappy")
+    parser.add_argument("--no-register", action="store_true", help="Leave the Glue catalog to the crawler")
+    args = parser.parse_args()
+
+    upload_fpa_fod_parquet(args.compression, register=not args.no_register)
@@ -1,12 +1,6 @@
-import boto3
-from dotenv import load_dotenv
-from botocore.exceptions import ClientError
-
-# Load environment variables
-load_dotenv()
-
 # Import config values
-from src.config import RAW_BUCKET
+from src.config import settings
+from src.data.uploader import upload_files
 
 # Mapping of local filenames to S3 keys
 NCLIMDIV_FILES = {
@@ -19,16 +13,12 @@ NCLIMDIV_FILES = {
 
 LOCAL_FOLDER = "data"
 
-def upload_nclimdiv_files():
-    s3 = boto3.client("s3")
+def nclimdiv_upload_plan():
+    return {f"{LOCAL_FOLDER}/{local_filename}": s3_key for local_filename, s3_key in NCLIMDIV_FILES.items()}
 
-    for local_filename, s3_key in NCLIMDIV_FILES.items():
-        local_path = f"{LOCAL_FOLDER}/{local_filename}"
-        try:
-            s3.upload_file(local_path, RAW_BUCKET, s3_key)
-            print(f"✅ Uploaded {local_filename} to s3://{RAW_BUCKET}/{s3_key}")
-        except ClientError as e:
-            print(f"❌ Upload failed for {local_filename}: {e}")
+def upload_nclimdiv_files():
+    # All five files go up at once through the shared client
+    return upload_files(nclimdiv_upload_plan(), settings.raw_bucket)
 
 if __name__ == "__main__":
     upload_nclimdiv_files()
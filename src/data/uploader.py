@@ -0,0 +1,180 @@
+import base64
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import settings
+
+MB = 1024 * 1024
+MIN_CHUNK_SIZE = 8 * MB
+MAX_CHUNK_SIZE = 64 * MB
+MAX_PARTS = 10_000
+
+MAX_WORKERS = int(os.getenv("UPLOAD_MAX_WORKERS", "5"))
+MAX_CONCURRENCY = int(os.getenv("UPLOAD_MAX_CONCURRENCY", "10"))
+
+HASH_METADATA_KEY = "content-sha256"
+MANIFEST_PATH = os.getenv("UPLOAD_MANIFEST", "data/.upload_manifest.json")
+READ_SIZE = MB
+
+_s3 = None
+
+
+def get_s3_client():
+    """One S3 client for every upload, pooled wide enough for all files and parts in flight."""
+    global _s3
+    if _s3 is None:
+        from botocore.config import Config
+        _s3 = settings.session.client("s3", config=Config(max_pool_connections=MAX_WORKERS * MAX_CONCURRENCY))
+    return _s3
+
+
+def transfer_config_for(size, max_concurrency=MAX_CONCURRENCY):
+    """Size multipart chunks so every thread gets a few parts without flooding S3 with small requests."""
+    from boto3.s3.transfer import TransferConfig
+
+    chunk = min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, size // (max_concurrency * 4)))
+    chunk = max(chunk, -(-size // MAX_PARTS))
+    chunk = -(-chunk // MB) * MB
+    return TransferConfig(
+        multipart_threshold=chunk,
+        multipart_chunksize=chunk,
+        max_concurrency=max_concurrency,
+    )
+
+
+def file_digests(local_path, part_size):
+    """Stream a file once, returning its SHA-256 hex digest and the S3 checksum for `part_size` parts.
+
+    Files of at least one part go up as multipart uploads, whose S3 checksum is the
+    SHA-256 of the concatenated part digests suffixed with the part count.
+    """
+    whole, part, parts = hashlib.sha256(), hashlib.sha256(), []
+    size = filled = 0
+    with open(local_path, "rb") as f:
+        for block in iter(lambda: f.read(min(READ_SIZE, part_size - filled)), b""):
+            whole.update(block)
+            part.update(block)
+            size += len(block)
+            filled += len(block)
+            if filled == part_size:
+                parts.append(part.digest())
+                part, filled = hashlib.sha256(), 0
+    if filled:
+        parts.append(part.digest())
+
+    if size < part_size:
+        return whole.hexdigest(), base64.b64encode(whole.digest()).decode()
+    composite = base64.b64encode(hashlib.sha256(b"".join(parts)).digest()).decode()
+    return whole.hexdigest(), f"{composite}-{len(parts)}"
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def local_digests(local_path, part_size, manifest=None):
+    """File digests, reused from the manifest while the file's size and mtime are unchanged."""
+    stat = os.stat(local_path)
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "part_size": part_size}
+    cached = (manifest or {}).get(local_path, {})
+    if all(cached.get(k) == v for k, v in signature.items()):
+        return cached["sha256"], cached["checksum"]
+
+    sha256, checksum = file_digests(local_path, part_size)
+    if manifest is not None:
+        manifest[local_path] = {**signature, "sha256": sha256, "checksum": checksum}
+    return sha256, checksum
+
+
+def remote_object(s3, bucket, key):
+    """Head an object with its checksum, or None if it does not exist."""
+    from botocore.exceptions import ClientError
+
+    try:
+        return s3.head_object(Bucket=bucket, Key=key, ChecksumMode="ENABLED")
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        raise
+
+
+def upload_file(local_path, bucket, key, s3=None, max_concurrency=MAX_CONCURRENCY, manifest=None):
+    """Upload one local file unless S3 already holds the same content, and return its transfer stats."""
+    from boto3.exceptions import S3UploadFailedError
+
+    s3 = s3 or get_s3_client()
+    size = os.path.getsize(local_path)
+    config = transfer_config_for(size, max_concurrency)
+    sha256, checksum = local_digests(local_path, config.multipart_chunksize, manifest)
+
+    stats = {"local_path": local_path, "s3_key": key, "skipped": False, "bytes": 0, "seconds": 0, "bytes_per_second": 0}
+    existing = remote_object(s3, bucket, key)
+    if existing and existing.get("Metadata", {}).get(HASH_METADATA_KEY) == sha256:
+        print(f"⏭️ {os.path.basename(local_path)} unchanged in s3://{bucket}/{key}")
+        return {**stats, "skipped": True}
+
+    start = time.perf_counter()
+    s3.upload_file(
+        local_path, bucket, key,
+        ExtraArgs={"ChecksumAlgorithm": "SHA256", "Metadata": {HASH_METADATA_KEY: sha256}},
+        Config=config,
+    )
+    seconds = time.perf_counter() - start
+
+    # S3 validates each part's checksum on arrival; this confirms the parts add up to our file
+    uploaded = remote_object(s3, bucket, key) or {}
+    if uploaded.get("ChecksumSHA256", "").split("-")[0] != checksum.split("-")[0]:
+        raise S3UploadFailedError(f"Checksum mismatch for s3://{bucket}/{key}: expected {checksum}, got {uploaded.get('ChecksumSHA256')}")
+
+    stats.update(bytes=size, seconds=round(seconds, 3), bytes_per_second=int(size / seconds) if seconds else size)
+    print(f"✅ Uploaded {os.path.basename(local_path)} to s3://{bucket}/{key} ({size / MB:.1f} MB at {stats['bytes_per_second'] / MB:.1f} MB/s)")
+    return stats
+
+
+def upload_files(files, bucket, s3=None, max_workers=MAX_WORKERS, max_concurrency=MAX_CONCURRENCY, manifest_path=MANIFEST_PATH,
+                 raise_on_failure=False):
+    """Upload {local_path: s3_key} concurrently through one client, skipping unchanged files.
+
+    Failures are reported and left out of the returned stats, or raised as a
+    RuntimeError once every file has been attempted if `raise_on_failure`.
+    """
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.exceptions import ClientError
+
+    s3 = s3 or get_s3_client()
+    manifest = load_manifest(manifest_path)
+
+    def upload(item):
+        local_path, key = item
+        try:
+            return upload_file(local_path, bucket, key, s3, max_concurrency, manifest)
+        except (ClientError, S3UploadFailedError, OSError) as e:
+            print(f"❌ Upload failed for {local_path}: {e}")
+            return None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = [stats for stats in pool.map(upload, files.items()) if stats]
+    seconds = time.perf_counter() - start
+    save_manifest(manifest, manifest_path)
+
+    total = sum(stats["bytes"] for stats in results)
+    skipped = sum(stats["skipped"] for stats in results)
+    print(f"📦 Uploaded {len(results) - skipped}/{len(files)} files ({skipped} unchanged), {total / MB:.1f} MB in {seconds:.1f}s")
+    if raise_on_failure and len(results) < len(files):
+        raise RuntimeError(f"❌ {len(files) - len(results)} of {len(files)} uploads to s3://{bucket} failed")
+    return results
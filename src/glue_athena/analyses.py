@@ -0,0 +1,169 @@
+import argparse
+
+from src.config import FPA_FOD_TABLE_NAME, NCLIMDIV_MERGED_TABLE_NAME
+
+# Aggregate name -> Athena SQL; `{}` is the quoted column
+SQL_AGGREGATES = {
+    "count": "COUNT({})",
+    "count_all": "COUNT(*)",
+    "sum": "SUM(CAST({} AS DOUBLE))",
+    "mean": "AVG(CAST({} AS DOUBLE))",
+    "min": "MIN({})",
+    "max": "MAX({})",
+    "median": "approx_percentile(CAST({} AS DOUBLE), 0.5)",
+}
+OPERATORS = ("=", "!=", ">", ">=", "<", "<=", "not null")
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+class Plan:
+    """A filter -> group -> aggregate -> sort -> limit query over one table.
+
+    The same plan runs on Athena (as the SQL from `to_sql`) or on local files
+    through LocalBackend, which evaluates it with pyarrow's vectorized kernels.
+    `aggregations` are (alias, function, column) with functions from
+    SQL_AGGREGATES, `where` is (column, operator, value) conditions that must all
+    hold and `order_by` is (column, "ascending" | "descending").
+    """
+
+    def __init__(self, table, aggregations, group_by=(), where=(), order_by=(), limit=None):
+        self.table = table
+        self.aggregations = list(aggregations)
+        self.group_by = list(group_by)
+        self.where = list(where)
+        self.order_by = list(order_by)
+        self.limit = limit
+        for _, function, _ in self.aggregations:
+            if function not in SQL_AGGREGATES:
+                raise ValueError(f"Unsupported aggregate: {function}")
+        for _, operator, _ in self.where:
+            if operator not in OPERATORS:
+                raise ValueError(f"Unsupported operator: {operator}")
+
+    def to_sql(self):
+        select = [_quote(c) for c in self.group_by]
+        select += [f"{SQL_AGGREGATES[f].format(_quote(c) if c else '')} AS {_quote(alias)}" for alias, f, c in self.aggregations]
+        sql = f"SELECT {', '.join(select)}\nFROM {_quote(self.table)}"
+        if self.where:
+            conditions = [
+                f"{_quote(c)} IS NOT NULL" if op == "not null" else f"{_quote(c)} {'<>' if op == '!=' else op} {_literal(v)}"
+                for c, op, v in self.where
+            ]
+            sql += "\nWHERE " + " AND ".join(conditions)
+        if self.group_by:
+            sql += "\nGROUP BY " + ", ".join(_quote(c) for c in self.group_by)
+        if self.order_by:
+            sql += "\nORDER BY " + ", ".join(f"{_quote(c)} {'DESC' if d == 'descending' else 'ASC'}" for c, d in self.order_by)
+        if self.limit is not None:
+            sql += f"\nLIMIT {int(self.limit)}"
+        return sql
+
+    async def run(self, backend, database=None, timeout=None):
+        """Rows of the plan as a pyarrow Table, from an AthenaClient or a LocalBackend."""
+        if hasattr(backend, "run_plan"):
+            return backend.run_plan(self)
+        return await backend.query(self.to_sql(), database, timeout)
+
+
+# The notebooks' recurring analyses
+
+def climate_trend(since=2000, table=NCLIMDIV_MERGED_TABLE_NAME):
+    return Plan(
+        table,
+        [("avg_tavg", "mean", "tavg"), ("avg_pdsi", "mean", "pdsi")],
+        group_by=["year", "month"],
+        where=[("year", ">=", since), ("tavg", "not null", None), ("pdsi", "not null", None)],
+        order_by=[("year", "ascending"), ("month", "ascending")],
+    )
+
+
+def top_causes(limit=15, table=FPA_FOD_TABLE_NAME):
+    return Plan(
+        table,
+        [("count", "count_all", None)],
+        group_by=["nwcg_general_cause"],
+        where=[("nwcg_general_cause", "not null", None), ("nwcg_general_cause", "!=", "")],
+        order_by=[("count", "descending")],
+        limit=limit,
+    )
+
+
+def state_counts(limit=10, table=FPA_FOD_TABLE_NAME):
+    return Plan(table, [("fire_count", "count_all", None)], group_by=["state"],
+                order_by=[("fire_count", "descending")], limit=limit)
+
+
+def fire_size_stats(min_size=1000, table=FPA_FOD_TABLE_NAME):
+    return Plan(
+        table,
+        [
+            ("min_fire_size", "min", "fire_size"),
+            ("max_fire_size", "max", "fire_size"),
+            ("avg_fire_size", "mean", "fire_size"),
+            ("median_fire_size", "median", "fire_size"),
+            ("total_records", "count_all", None),
+        ],
+        where=[("fire_size", "not null", None), ("fire_size", ">", min_size)],
+    )
+
+
+def cause_stats(min_size=1000, table=FPA_FOD_TABLE_NAME):
+    return Plan(
+        table,
+        [("avg_size", "mean", "fire_size"), ("max_size", "max", "fire_size"), ("total_fires", "count_all", None)],
+        group_by=["nwcg_general_cause"],
+        where=[("fire_size", "not null", None), ("fire_size", ">", min_size)],
+        order_by=[("total_fires", "descending")],
+    )
+
+
+ANALYSES = {
+    "top_causes": top_causes,
+    "state_counts": state_counts,
+    "fire_size_stats": fire_size_stats,
+    "cause_stats": cause_stats,
+    "climate_trend": climate_trend,
+}
+
+
+if __name__ == "__main__":
+    import os
+    import time
+
+    from src.glue_athena.athena import run_sync
+    from src.glue_athena.local_backend import LocalBackend
+
+    parser = argparse.ArgumentParser(description="Run the EDA analyses on local files (default) or Athena")
+    parser.add_argument("names", nargs="*", help=f"Analyses to run (default: all of {', '.join(ANALYSES)})")
+    parser.add_argument("--athena", metavar="DATABASE", help="Run on Athena in this database instead of locally")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in ANALYSES]
+    if unknown:
+        parser.error(f"unknown analyses: {', '.join(unknown)}")
+
+    if args.athena:
+        from src.glue_athena.athena import AthenaClient
+        backend = AthenaClient()
+    else:
+        backend = LocalBackend()
+    for name in args.names or ANALYSES:
+        plan = ANALYSES[name]()
+        source = plan.table
+        if not args.athena:
+            if not backend.has_table(plan.table):
+                print(f"⏭️ {name}: no local data for {plan.table} at {backend.tables.get(plan.table)}")
+                continue
+            source = os.path.relpath(backend.tables[plan.table])
+        start = time.perf_counter()
+        result = run_sync(plan.run(backend, args.athena))
+        print(f"📊 {name} on {source} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        print(result.to_pandas().head(20).to_string())
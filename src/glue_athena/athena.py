@@ -0,0 +1,213 @@
+import asyncio
+import concurrent.futures
+import time
+import weakref
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.config import get_client, settings
+
+MIN_POLL_SECONDS = 0.25
+MAX_POLL_SECONDS = 5
+BACKOFF = 2
+TIMEOUT_SECONDS = 30 * 60
+# GetQueryResults returns at most this many rows per page
+PAGE_SIZE = 1000
+# Athena's default quota for concurrently running DML queries per account
+MAX_CONCURRENT_QUERIES = 20
+
+TERMINAL_STATES = ("SUCCEEDED", "FAILED", "CANCELLED")
+
+ATHENA_TYPES = {
+    "boolean": pa.bool_(),
+    "tinyint": pa.int8(),
+    "smallint": pa.int16(),
+    "integer": pa.int32(),
+    "int": pa.int32(),
+    "bigint": pa.int64(),
+    "float": pa.float32(),
+    "real": pa.float32(),
+    "double": pa.float64(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("us"),
+}
+
+
+def arrow_type(column_info):
+    """Arrow type for an Athena ColumnInfo; anything without a direct match (varchar, arrays, json) stays a string."""
+    athena_type = column_info["Type"].lower()
+    if athena_type == "decimal":
+        return pa.decimal128(column_info["Precision"], column_info["Scale"])
+    return ATHENA_TYPES.get(athena_type, pa.string())
+
+
+def to_record_batch(columns, rows):
+    """Typed RecordBatch from the string values of GetQueryResults rows."""
+    arrays = [pc.cast(pa.array([row[i] for row in rows], pa.string()), arrow_type(info)) for i, info in enumerate(columns)]
+    return pa.RecordBatch.from_arrays(arrays, names=[c["Name"] for c in columns])
+
+
+class AthenaClient:
+    """Runs Athena queries as asyncio tasks, so many can be in flight without a thread each.
+
+    boto3 calls run briefly on the default executor; waiting between polls is an
+    `asyncio.sleep` that starts at `min_poll` seconds and backs off to `max_poll`.
+    A query that is still running after `timeout` seconds, or whose task is
+    cancelled, is stopped in Athena too.
+
+    With a `cache` (a QueryResultCache) repeated SELECTs are answered from local
+    Parquet until a table they read changes. `reuse_minutes` additionally lets
+    Athena return a stored result of the same query up to that old.
+    """
+
+    def __init__(self, athena=None, output_location=None, workgroup=None, min_poll=MIN_POLL_SECONDS,
+                 max_poll=MAX_POLL_SECONDS, timeout=TIMEOUT_SECONDS, max_concurrent=MAX_CONCURRENT_QUERIES,
+                 cache=None, reuse_minutes=None, sleep=asyncio.sleep, clock=time.monotonic):
+        self.athena = athena or get_client("athena")
+        self.output_location = output_location
+        self.workgroup = workgroup
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.cache = cache
+        self.reuse_minutes = reuse_minutes
+        self.server_reuses = 0
+        self.sleep = sleep
+        self.clock = clock
+        self._slots = weakref.WeakKeyDictionary()
+
+    async def _call(self, method, **kwargs):
+        return await asyncio.to_thread(getattr(self.athena, method), **kwargs)
+
+    def _slot(self):
+        # Semaphores belong to one event loop, and asyncio.run() makes a new loop each time
+        loop = asyncio.get_running_loop()
+        if loop not in self._slots:
+            self._slots[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._slots[loop]
+
+    async def start(self, query, database=None):
+        """Submit `query` and return its QueryExecutionId."""
+        kwargs = {"QueryString": query}
+        if database:
+            kwargs["QueryExecutionContext"] = {"Database": database}
+        if self.workgroup:
+            kwargs["WorkGroup"] = self.workgroup
+        else:
+            kwargs["ResultConfiguration"] = {"OutputLocation": self.output_location or settings.athena_output_location}
+        if self.reuse_minutes:
+            kwargs["ResultReuseConfiguration"] = {
+                "ResultReuseByAgeConfiguration": {"Enabled": True, "MaxAgeInMinutes": self.reuse_minutes}
+            }
+        return (await self._call("start_query_execution", **kwargs))["QueryExecutionId"]
+
+    async def stop(self, execution_id):
+        await self._call("stop_query_execution", QueryExecutionId=execution_id)
+        print(f"🛑 Cancelled Athena query {execution_id}")
+
+    async def wait(self, execution_id, timeout=None, check=True):
+        """Poll until the query finishes and return its QueryExecution.
+
+        Raises RuntimeError if it did not succeed, unless `check` is False.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = self.clock()
+        interval = self.min_poll
+        try:
+            while True:
+                execution = (await self._call("get_query_execution", QueryExecutionId=execution_id))["QueryExecution"]
+                state = execution["Status"]["State"]
+                if state in TERMINAL_STATES:
+                    break
+                if self.clock() - started > timeout:
+                    await self.stop(execution_id)
+                    raise TimeoutError(f"❌ Athena query {execution_id} still {state} after {timeout}s")
+                await self.sleep(interval)
+                interval = min(self.max_poll, interval * BACKOFF)
+        except asyncio.CancelledError:
+            # Do not leave the query running (and billing) after its task is cancelled
+            await asyncio.shield(self.stop(execution_id))
+            raise
+
+        if check and state != "SUCCEEDED":
+            reason = execution["Status"].get("StateChangeReason", "")
+            raise RuntimeError(f"❌ Athena query {execution_id} {state}: {reason}")
+        return execution
+
+    async def iter_batches(self, execution_id, statement_type="DML"):
+        """Yield every result row of a finished query, one typed RecordBatch per GetQueryResults page."""
+        kwargs = {"QueryExecutionId": execution_id, "MaxResults": PAGE_SIZE}
+        columns = None
+        empty = True
+        while True:
+            page = await self._call("get_query_results", **kwargs)
+            rows = [[value.get("VarCharValue") for value in row["Data"]] for row in page["ResultSet"]["Rows"]]
+            if columns is None:
+                columns = page["ResultSet"]["ResultSetMetadata"]["ColumnInfo"]
+                # SELECT results repeat the column names as their first row; DDL and SHOW results do not
+                if statement_type == "DML" and rows:
+                    rows = rows[1:]
+            if rows:
+                empty = False
+                yield to_record_batch(columns, rows)
+            if not page.get("NextToken"):
+                break
+            kwargs["NextToken"] = page["NextToken"]
+        if empty:
+            # An empty result still has a schema
+            yield to_record_batch(columns, [])
+
+    async def run(self, query, database=None, timeout=None):
+        """Run `query` and return its QueryExecution once it has succeeded."""
+        async with self._slot():
+            execution_id = await self.start(query, database)
+            return await self.wait(execution_id, timeout)
+
+    async def query(self, query, database=None, timeout=None):
+        """Run `query` and return all of its rows as a typed pyarrow Table."""
+        key = self.cache and await asyncio.to_thread(self.cache.key, query, database)
+        if key:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        execution = await self.run(query, database, timeout)
+        batches = [b async for b in self.iter_batches(execution["QueryExecutionId"], execution.get("StatementType", "DML"))]
+        table = pa.Table.from_batches(batches)
+
+        statistics = execution.get("Statistics", {})
+        if statistics.get("ResultReuseInformation", {}).get("ReusedPreviousResult"):
+            self.server_reuses += 1
+        if key:
+            await asyncio.to_thread(self.cache.put, key, table, statistics.get("DataScannedInBytes", 0))
+        return table
+
+    async def query_df(self, query, database=None, timeout=None):
+        return (await self.query(query, database, timeout)).to_pandas()
+
+    async def query_many(self, queries, database=None, timeout=None):
+        """Run {name: query} concurrently and return {name: DataFrame}."""
+        names = list(queries)
+        frames = await asyncio.gather(*(self.query_df(queries[name], database, timeout) for name in names))
+        return dict(zip(names, frames))
+
+    def stats(self):
+        """Local cache hits, misses and bytes saved, plus results Athena served from its own reuse."""
+        return {**(self.cache.stats() if self.cache else {}), "server_reuses": self.server_reuses}
+
+
+def run_sync(coroutine):
+    """Run a coroutine to completion, also from code already inside an event loop (a Jupyter cell)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+def run_query_df(query, database=None, client=None, timeout=None):
+    """Blocking helper: every row of `query` as a typed DataFrame."""
+    return run_sync((client or AthenaClient()).query_df(query, database, timeout))
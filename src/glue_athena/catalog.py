@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+import time
+
+DEFAULT_TTL_SECONDS = 900
+
+
+def _columns(columns):
+    return [{"name": c["Name"], "type": c.get("Type")} for c in columns]
+
+
+class GlueCatalogCache:
+    """Glue databases and tables, fetched in bulk and served from memory (and optionally disk) until the TTL expires.
+
+    One `get_tables` pass per database captures every table with its columns and
+    partition keys, so repeated lookups cost no API calls. Call `invalidate`
+    after a crawler run changes a database.
+    """
+
+    def __init__(self, glue, ttl=DEFAULT_TTL_SECONDS, path=None, clock=time.time):
+        self.glue = glue
+        self.ttl = ttl
+        self.path = path
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._entries = self._load()
+
+    def _load(self):
+        if self.path and os.path.exists(self.path):
+            with open(self.path) as f:
+                return json.load(f)
+        return {"databases": None, "tables": {}}
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+    def _fresh(self, entry):
+        return entry is not None and self.clock() - entry["fetched_at"] < self.ttl
+
+    def databases(self):
+        """Every database name in the catalog."""
+        with self._lock:
+            entry = self._entries["databases"]
+            if not self._fresh(entry):
+                names = []
+                for page in self.glue.get_paginator("get_databases").paginate():
+                    names.extend(db["Name"] for db in page["DatabaseList"])
+                entry = self._entries["databases"] = {"fetched_at": self.clock(), "names": names}
+                self._save()
+            return entry["names"]
+
+    def tables(self, database_name):
+        """{table name: {"columns", "partition_keys", "location"}} for one database."""
+        with self._lock:
+            entry = self._entries["tables"].get(database_name)
+            if not self._fresh(entry):
+                tables = {}
+                for page in self.glue.get_paginator("get_tables").paginate(DatabaseName=database_name):
+                    for table in page["TableList"]:
+                        storage = table.get("StorageDescriptor", {})
+                        tables[table["Name"]] = {
+                            "columns": _columns(storage.get("Columns", [])),
+                            "partition_keys": _columns(table.get("PartitionKeys", [])),
+                            "location": storage.get("Location"),
+                        }
+                entry = self._entries["tables"][database_name] = {"fetched_at": self.clock(), "tables": tables}
+                self._save()
+            return entry["tables"]
+
+    def database_name(self, prefix):
+        for name in self.databases():
+            if name.startswith(prefix.lower()):
+                return name
+        raise ValueError(f"No database found with prefix: {prefix}")
+
+    def table_names(self, database_name, prefix=""):
+        return [name for name in self.tables(database_name) if name.startswith(prefix.lower())]
+
+    def columns(self, database_name, table_name):
+        return self.tables(database_name)[table_name]["columns"]
+
+    def partition_keys(self, database_name, table_name):
+        return self.tables(database_name)[table_name]["partition_keys"]
+
+    def invalidate(self, database_name=None):
+        """Drop cached tables for one database (a crawler just ran), or everything."""
+        with self._lock:
+            if database_name is None:
+                self._entries = {"databases": None, "tables": {}}
+            else:
+                self._entries["tables"].pop(database_name, None)
+                self._entries["databases"] = None
+            self._save()
@@ -0,0 +1,131 @@
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+
+from src.config import (
+    FPA_FOD_LOCAL_PATH,
+    FPA_FOD_PARQUET_LOCAL_DIR,
+    FPA_FOD_SAMPLE_PATH,
+    FPA_FOD_TABLE_NAME,
+    NCLIMDIV_MERGED_LOCAL_PATH,
+    NCLIMDIV_MERGED_TABLE_NAME,
+    WRC_LOCAL_PATH,
+    project_root,
+)
+
+# Glue table name -> local copy of its data relative to the project root (the first that exists of a tuple).
+# Without the full FPA FOD download, the fire analyses run on the bundled large-fire sample.
+DEFAULT_TABLES = {
+    FPA_FOD_TABLE_NAME: (FPA_FOD_PARQUET_LOCAL_DIR, FPA_FOD_LOCAL_PATH, FPA_FOD_SAMPLE_PATH),
+    NCLIMDIV_MERGED_TABLE_NAME: NCLIMDIV_MERGED_LOCAL_PATH,
+    "wrc_wrc_v2": WRC_LOCAL_PATH,
+    "cleaned_fpa_fod": FPA_FOD_SAMPLE_PATH,
+}
+
+# Plan aggregate -> pyarrow hash aggregate
+ARROW_AGGREGATES = {
+    "count": "count",
+    "count_all": "count_all",
+    "sum": "sum",
+    "mean": "mean",
+    "min": "min",
+    "max": "max",
+    "median": "approximate_median",
+}
+_COMPARISONS = {"=": pc.equal, "!=": pc.not_equal, ">": pc.greater, ">=": pc.greater_equal,
+                "<": pc.less, "<=": pc.less_equal}
+
+
+def read_csv_table(path):
+    """A CSV as an Arrow table, with headers trimmed and lowercased the way the crawlers name columns."""
+    table = pv.read_csv(path)
+    return table.rename_columns([name.strip().lower() for name in table.column_names])
+
+
+class LocalBackend:
+    """Runs queries in-process over local Parquet/CSV copies of the Glue tables.
+
+    `query` has the same signature as AthenaClient.query. Plans from
+    src.glue_athena.analyses are evaluated with pyarrow's vectorized kernels,
+    with filters pushed down into the Parquet scan (partition pruning included).
+    Plain SQL needs the optional duckdb package.
+    """
+
+    def __init__(self, tables=None, root=project_root):
+        self.tables = {}
+        for name, paths in (tables or DEFAULT_TABLES).items():
+            paths = [os.path.join(root, path) for path in ([paths] if isinstance(paths, str) else paths)]
+            self.tables[name] = next((path for path in paths if os.path.exists(path)), paths[0])
+        self._datasets = {}
+        self._lock = threading.Lock()
+
+    def has_table(self, name):
+        return name in self.tables and os.path.exists(self.tables[name])
+
+    def dataset(self, name):
+        """The table as a pyarrow Dataset; CSVs are read once and kept in memory."""
+        with self._lock:
+            if name not in self._datasets:
+                if not self.has_table(name):
+                    raise FileNotFoundError(f"No local data for table {name}: {self.tables.get(name)}")
+                path = self.tables[name]
+                if path.endswith(".csv"):
+                    self._datasets[name] = ds.dataset(read_csv_table(path))
+                else:
+                    self._datasets[name] = ds.dataset(path, format="parquet", partitioning="hive")
+            return self._datasets[name]
+
+    def run_plan(self, plan):
+        dataset = self.dataset(plan.table)
+        condition = None
+        for column, operator, value in plan.where:
+            field = ds.field(column)
+            expression = field.is_valid() if operator == "not null" else _COMPARISONS[operator](field, value)
+            condition = expression if condition is None else condition & expression
+
+        needed = list(dict.fromkeys(plan.group_by + [c for _, _, c in plan.aggregations if c]))
+        table = dataset.to_table(columns=needed, filter=condition)
+
+        aggregations = [(column or [], ARROW_AGGREGATES[function]) for _, function, column in plan.aggregations]
+        grouped = table.group_by(plan.group_by, use_threads=False).aggregate(aggregations)
+        output_names = [f"{column}_{ARROW_AGGREGATES[function]}" if column else "count_all"
+                        for _, function, column in plan.aggregations]
+        result = pa.table(
+            [grouped.column(c) for c in plan.group_by] + [grouped.column(name) for name in output_names],
+            names=plan.group_by + [alias for alias, _, _ in plan.aggregations],
+        )
+        if plan.order_by:
+            result = result.sort_by(plan.order_by)
+        if plan.limit is not None:
+            result = result.slice(0, plan.limit)
+        return result
+
+    def sql(self, query):
+        """Run SQL over every local table with duckdb (optional dependency)."""
+        try:
+            import duckdb
+        except ImportError as e:
+            raise RuntimeError("❌ SQL on the local backend needs duckdb (pip install duckdb); Plans run without it") from e
+
+        connection = duckdb.connect()
+        try:
+            for name in self.tables:
+                if self.has_table(name):
+                    connection.register(name, self.dataset(name))
+            result = connection.execute(query).arrow()
+            # Newer duckdb releases return a RecordBatchReader here
+            return result.read_all() if hasattr(result, "read_all") else result
+        finally:
+            connection.close()
+
+    async def query(self, query, database=None, timeout=None):
+        if hasattr(query, "to_sql"):
+            return self.run_plan(query)
+        return self.sql(query)
+
+    async def query_df(self, query, database=None, timeout=None):
+        return (await self.query(query, database, timeout)).to_pandas()
@@ -0,0 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+
+from src.config import get_client, settings
+
+# BatchCreatePartition accepts at most this many partitions per call
+BATCH_SIZE = 100
+MAX_WORKERS = 4
+
+# The parts of a GetTable response that UpdateTable accepts back
+TABLE_INPUT_KEYS = (
+    "Name", "Description", "Owner", "LastAccessTime", "LastAnalyzedTime", "Retention", "StorageDescriptor",
+    "PartitionKeys", "ViewOriginalText", "ViewExpandedText", "TableType", "Parameters", "TargetTable",
+)
+
+PARQUET_FORMAT = {
+    "InputFormat": "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat",
+    "OutputFormat": "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat",
+    "SerdeInfo": {
+        "SerializationLibrary": "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe",
+        "Parameters": {"serialization.format": "1"},
+    },
+}
+
+_GLUE_TYPES = [
+    (pa.types.is_boolean, "boolean"),
+    (pa.types.is_int8, "tinyint"),
+    (pa.types.is_int16, "smallint"),
+    (pa.types.is_int32, "int"),
+    (pa.types.is_int64, "bigint"),
+    (pa.types.is_float32, "float"),
+    (pa.types.is_float64, "double"),
+    (pa.types.is_date, "date"),
+    (pa.types.is_timestamp, "timestamp"),
+    (pa.types.is_string, "string"),
+    (pa.types.is_large_string, "string"),
+]
+
+
+def glue_type(arrow_type):
+    """Glue/Hive column type for an Arrow type (dictionary columns use their value type)."""
+    if pa.types.is_dictionary(arrow_type):
+        return glue_type(arrow_type.value_type)
+    if pa.types.is_decimal(arrow_type):
+        return f"decimal({arrow_type.precision},{arrow_type.scale})"
+    for matches, name in _GLUE_TYPES:
+        if matches(arrow_type):
+            return name
+    raise ValueError(f"No Glue type for Arrow type {arrow_type}")
+
+
+def glue_columns(schema):
+    return [{"Name": field.name, "Type": glue_type(field.type)} for field in schema]
+
+
+def hive_values(key, partition_names):
+    """Partition values from the `name=value/` segments of an S3 key, in `partition_names` order."""
+    segments = dict(part.split("=", 1) for part in key.split("/") if "=" in part)
+    return tuple(segments[name] for name in partition_names)
+
+
+def _storage(location, columns):
+    return {"Columns": columns, "Location": location, **PARQUET_FORMAT}
+
+
+def ensure_table(glue, database, table, location, columns, partition_keys):
+    """Create the Parquet table if it is missing; returns "created", "unchanged" or "schema_changed"."""
+    from botocore.exceptions import ClientError
+
+    try:
+        existing = glue.get_table(DatabaseName=database, Name=table)["Table"]
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "EntityNotFoundException":
+            raise
+        glue.create_table(DatabaseName=database, TableInput={
+            "Name": table,
+            "TableType": "EXTERNAL_TABLE",
+            "Parameters": {"classification": "parquet", "EXTERNAL": "TRUE"},
+            "StorageDescriptor": _storage(location, columns),
+            "PartitionKeys": partition_keys,
+        })
+        print(f"🆕 Created Glue table {database}.{table}")
+        return "created"
+
+    def shape(cols):
+        return [(c["Name"], c["Type"]) for c in cols]
+
+    same = (shape(existing.get("StorageDescriptor", {}).get("Columns", [])) == shape(columns)
+            and shape(existing.get("PartitionKeys", [])) == shape(partition_keys))
+    return "unchanged" if same else "schema_changed"
+
+
+def create_partitions(glue, database, table, location, partition_names, values, columns, max_workers=MAX_WORKERS):
+    """Register partitions (tuples of values) under `location`; ones that already exist are counted, not errors."""
+    location = location.rstrip("/")
+
+    inputs = [
+        {
+            "Values": list(v),
+            "StorageDescriptor": _storage(
+                f"{location}/{'/'.join(f'{n}={x}' for n, x in zip(partition_names, v))}/", columns
+            ),
+        }
+        for v in sorted(set(values))
+    ]
+    batches = [inputs[i:i + BATCH_SIZE] for i in range(0, len(inputs), BATCH_SIZE)]
+
+    def create(batch):
+        response = glue.batch_create_partition(DatabaseName=database, TableName=table, PartitionInputList=batch)
+        errors = response.get("Errors", [])
+        failed = [e for e in errors if e["ErrorDetail"]["ErrorCode"] != "AlreadyExistsException"]
+        if failed:
+            detail = failed[0]["ErrorDetail"]
+            raise RuntimeError(
+                f"❌ {len(failed)} partitions of {database}.{table} failed, e.g. "
+                f"{failed[0]['PartitionValues']}: {detail['ErrorCode']} {detail.get('ErrorMessage', '')}"
+            )
+        return len(batch) - len(errors), len(errors)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        counts = list(pool.map(create, batches))
+    return {"created": sum(c for c, _ in counts), "existing": sum(e for _, e in counts)}
+
+
+def touch_table(glue, database, table):
+    """Re-save a table unchanged so its UpdateTime moves; adding partitions alone does not move it."""
+    existing = glue.get_table(DatabaseName=database, Name=table)["Table"]
+    table_input = {key: existing[key] for key in TABLE_INPUT_KEYS if key in existing}
+    glue.update_table(DatabaseName=database, TableInput=table_input, SkipArchive=True)
+
+
+def register_parquet_dataset(database, table, bucket, prefix, keys, schema, partition_keys, glue=None, crawler_name=None):
+    """Make freshly written Hive-partitioned Parquet queryable without a crawler run.
+
+    `keys` are the S3 keys just written under `prefix`, `schema` the Arrow schema of
+    the data columns and `partition_keys` [(name, glue type)]. The table is created
+    on first use and new partitions are added with BatchCreatePartition. Only if the
+    columns no longer match the table is `crawler_name` (if given) run to evolve it.
+    """
+    glue = glue or get_client("glue")
+    location = f"s3://{bucket}/{prefix.strip('/')}/"
+    columns = glue_columns(schema)
+    partition_keys = [{"Name": name, "Type": type_} for name, type_ in partition_keys]
+
+    partition_names = [k["Name"] for k in partition_keys]
+    table_status = ensure_table(glue, database, table, location, columns, partition_keys)
+    values = [hive_values(key, partition_names) for key in keys]
+    result = {"table": table_status, **create_partitions(glue, database, table, location, partition_names, values, columns)}
+    print(f"🗂️ {database}.{table}: {result['created']} partitions registered, {result['existing']} already known")
+    if result["created"] and table_status == "unchanged":
+        # Cached query results are keyed on UpdateTime (src.glue_athena.query_cache)
+        touch_table(glue, database, table)
+
+    if table_status == "schema_changed":
+        if crawler_name:
+            print(f"🔄 Schema of {database}.{table} changed, running crawler {crawler_name}")
+            from src.orchestrator.crawlers import run_crawler_and_wait
+            result["crawler"] = run_crawler_and_wait(crawler_name)["status"]
+        else:
+            print(f"⚠️ Schema of {database}.{table} changed; run its crawler to update the table")
+
+    settings.catalog.invalidate(database)
+    return result
@@ -0,0 +1,124 @@
+import argparse
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+PERCENTILES = (0.25, 0.5, 0.75)
+REPORT_COLUMNS = ["column", "type", "null_count", "null_fraction", "distinct_estimate", "min", "max",
+                  *(f"p{int(q * 100)}" for q in PERCENTILES)]
+
+_NUMERIC = re.compile(r"^(tinyint|smallint|int|integer|bigint|float|real|double|decimal)\b")
+_ORDERABLE = re.compile(r"^(tinyint|smallint|int|integer|bigint|float|real|double|decimal|date|timestamp|string|varchar|char)\b")
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def profile_sql(table, columns):
+    """One SELECT that profiles every column in a single scan of `table`.
+
+    `columns` are [{"name", "type"}] as the Glue catalog lists them. Aggregates
+    are aliased by position (c0_nulls, ...) so any column name is safe.
+    """
+    select = ["COUNT(*) AS row_count"]
+    for i, column in enumerate(columns):
+        name, col_type = _quote(column["name"]), (column.get("type") or "").lower()
+        select.append(f"COUNT(*) - COUNT({name}) AS c{i}_nulls")
+        if _ORDERABLE.match(col_type):
+            select.append(f"approx_distinct({name}) AS c{i}_distinct")
+            select.append(f"CAST(MIN({name}) AS VARCHAR) AS c{i}_min")
+            select.append(f"CAST(MAX({name}) AS VARCHAR) AS c{i}_max")
+        if _NUMERIC.match(col_type):
+            for q in PERCENTILES:
+                select.append(f"approx_percentile(CAST({name} AS DOUBLE), {q}) AS c{i}_p{int(q * 100)}")
+    return "SELECT\n    " + ",\n    ".join(select) + f"\nFROM {_quote(table)}"
+
+
+def _report(rows):
+    report = pd.DataFrame(rows, columns=REPORT_COLUMNS)
+    report = report.astype({
+        "null_count": "int64",
+        "null_fraction": "float64",
+        "distinct_estimate": "Int64",
+        "min": "string",
+        "max": "string",
+        **{f"p{int(q * 100)}": "float64" for q in PERCENTILES},
+    })
+    return report.sort_values("null_count", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def report_from_result(columns, result):
+    """Reshape the single result row of `profile_sql` into one report row per column."""
+    row = result.to_pylist()[0] if isinstance(result, pa.Table) else result
+    total = row["row_count"]
+    rows = []
+    for i, column in enumerate(columns):
+        nulls = row[f"c{i}_nulls"]
+        rows.append([
+            column["name"], column.get("type"), nulls, nulls / total if total else 0.0, row.get(f"c{i}_distinct"),
+            row.get(f"c{i}_min"), row.get(f"c{i}_max"),
+            *(row.get(f"c{i}_p{int(q * 100)}") for q in PERCENTILES),
+        ])
+    return _report(rows)
+
+
+async def profile_athena_async(database, table, client=None, columns=None, timeout=None):
+    from src.config import settings
+    from src.glue_athena.athena import AthenaClient
+
+    client = client or AthenaClient()
+    catalog_columns = settings.catalog.columns(database, table) + settings.catalog.partition_keys(database, table)
+    if columns is not None:
+        by_name = {c["name"]: c for c in catalog_columns}
+        missing = [name for name in columns if name not in by_name]
+        if missing:
+            # One unknown column would fail the whole query, so it is left out instead
+            print(f"⚠️ Not in {database}.{table}, skipped: {', '.join(missing)}")
+        catalog_columns = [by_name[name] for name in columns if name in by_name]
+    result = await client.query(profile_sql(table, catalog_columns), database, timeout)
+    return report_from_result(catalog_columns, result)
+
+
+def profile_athena(database, table, client=None, columns=None, timeout=None):
+    """Null counts, distinct estimates, min/max and approximate percentiles for a Glue table, in one Athena query."""
+    from src.glue_athena.athena import run_sync
+
+    return run_sync(profile_athena_async(database, table, client, columns, timeout))
+
+
+def profile_table(table, columns=None):
+    """The same report from a local pyarrow Table (or anything with `.to_table()`), in one columnar pass."""
+    if not isinstance(table, pa.Table):
+        table = table.to_table(columns=columns)
+    rows = []
+    for name in columns or table.column_names:
+        values = table.column(name)
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        row = [name, str(values.type), values.null_count, values.null_count / len(values) if len(values) else 0.0]
+        nested = pa.types.is_nested(values.type)
+        row.append(None if nested else pc.count_distinct(values).as_py())
+        if nested or pa.types.is_boolean(values.type) or values.null_count == len(values):
+            row += [None, None]
+        else:
+            extremes = pc.min_max(values).as_py()
+            row += [str(extremes["min"]), str(extremes["max"])]
+        if pa.types.is_integer(values.type) or pa.types.is_floating(values.type) or pa.types.is_decimal(values.type):
+            quantiles = pc.tdigest(values.cast(pa.float64()), q=list(PERCENTILES)).to_pylist()
+            row += quantiles if values.null_count < len(values) else [None] * len(PERCENTILES)
+        else:
+            row += [None] * len(PERCENTILES)
+        rows.append(row)
+    return _report(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile every column of a Glue table in one Athena scan")
+    parser.add_argument("database")
+    parser.add_argument("table")
+    args = parser.parse_args()
+
+    print(profile_athena(args.database, args.table).to_string())
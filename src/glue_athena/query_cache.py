@@ -0,0 +1,161 @@
+import hashlib
+import os
+import re
+import threading
+import time
+
+import pyarrow.parquet as pq
+
+from src.config import get_client, project_root
+
+MB = 1024 * 1024
+DEFAULT_DIR = str(project_root / "data" / ".athena_cache")
+DEFAULT_MAX_BYTES = 512 * MB
+# Tables whose files are overwritten in place keep their UpdateTime, so entries also expire
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Results of these change between runs, so queries using them are never cached
+NONDETERMINISTIC = re.compile(r"\b(now|rand|random|uuid|current_date|current_time|current_timestamp|localtime|localtimestamp)\b")
+_STRING_LITERAL = re.compile(r"('(?:[^']|'')*')")
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_TABLE_REFERENCE = re.compile(r'\b(?:from|join)\s+("[^"]+"|[\w-]+)(?:\s*\.\s*("[^"]+"|[\w-]+))?')
+SCANNED_BYTES_KEY = b"athena_scanned_bytes"
+CREATED_KEY = b"athena_cached_at"
+
+
+def normalize_sql(sql):
+    """Whitespace, comments, case and a trailing `;` do not change a query; string literals are kept verbatim."""
+    parts = _STRING_LITERAL.split(sql)
+    for i in range(0, len(parts), 2):
+        parts[i] = " ".join(_COMMENTS.sub(" ", parts[i]).lower().split())
+    # Comments were dropped piecewise, so rejoin and tidy the spacing around literals
+    return " ".join(p for p in parts if p).strip().rstrip(";").strip()
+
+
+def referenced_tables(sql, database=None):
+    """(database, table) pairs named after FROM/JOIN; unqualified names belong to `database`."""
+    refs = []
+    for first, second in _TABLE_REFERENCE.findall(normalize_sql(sql)):
+        first, second = first.strip('"'), second.strip('"')
+        ref = (first, second) if second else (database, first)
+        if ref[0] and ref not in refs:
+            refs.append(ref)
+    return refs
+
+
+def cacheable(sql):
+    normalized = normalize_sql(sql)
+    return normalized.startswith(("select", "with")) and not NONDETERMINISTIC.search(_STRING_LITERAL.sub("''", normalized))
+
+
+class QueryResultCache:
+    """Athena results kept on local disk as Parquet, evicted least-recently-used past `max_bytes`.
+
+    Entries are keyed by the normalized SQL, the database and the UpdateTime of
+    every Glue table the query reads, so a crawler run or newly registered
+    partitions make old results unreachable instead of stale. Names that are not
+    Glue tables (CTEs) do not contribute to the key. Entries older than
+    `max_age` seconds are dropped as well.
+    """
+
+    def __init__(self, path=None, max_bytes=None, max_age=DEFAULT_MAX_AGE_SECONDS, glue=None, clock=time.time):
+        self.path = path or os.getenv("ATHENA_CACHE_DIR", DEFAULT_DIR)
+        self.max_bytes = max_bytes or int(os.getenv("ATHENA_CACHE_MAX_MB", DEFAULT_MAX_BYTES // MB)) * MB
+        self.max_age = max_age
+        self.clock = clock
+        self._glue = glue
+        self._lock = threading.Lock()
+        self._last_use = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    @property
+    def glue(self):
+        if self._glue is None:
+            self._glue = get_client("glue")
+        return self._glue
+
+    def table_version(self, database, table):
+        from botocore.exceptions import ClientError
+
+        try:
+            info = self.glue.get_table(DatabaseName=database, Name=table)["Table"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "EntityNotFoundException":
+                raise
+            return None
+        return str(info.get("UpdateTime") or info.get("CreateTime"))
+
+    def key(self, sql, database=None):
+        """Cache key for `sql`, or None if its result must not be cached."""
+        if not cacheable(sql):
+            return None
+        digest = hashlib.sha256(f"{database}\n{normalize_sql(sql)}".encode())
+        for db, table in referenced_tables(sql, database):
+            digest.update(f"\n{db}.{table}@{self.table_version(db, table)}".encode())
+        return digest.hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.parquet")
+
+    def get(self, key):
+        """The cached Table for `key`, or None; a hit counts the bytes Athena would have scanned."""
+        path = self._file(key)
+        with self._lock:
+            if not os.path.exists(path):
+                self.misses += 1
+                return None
+            table = pq.read_table(path)
+            metadata = table.schema.metadata or {}
+            if self.clock() - float(metadata.get(CREATED_KEY, 0)) > self.max_age:
+                os.remove(path)
+                self.misses += 1
+                return None
+            self._mark_used(path)
+            self.hits += 1
+            self.bytes_saved += int(metadata.get(SCANNED_BYTES_KEY, 0))
+        return table.replace_schema_metadata(None)
+
+    def put(self, key, table, scanned_bytes=0):
+        os.makedirs(self.path, exist_ok=True)
+        table = table.replace_schema_metadata({SCANNED_BYTES_KEY: str(scanned_bytes), CREATED_KEY: str(self.clock())})
+        tmp_path = f"{self._file(key)}.{threading.get_ident()}.tmp"
+        pq.write_table(table, tmp_path)
+        with self._lock:
+            os.replace(tmp_path, self._file(key))
+            self._mark_used(self._file(key))
+            self._evict()
+
+    def _mark_used(self, path):
+        # Last use (the mtime) orders eviction; kept strictly increasing for coarse filesystem clocks
+        self._last_use = max(self._last_use + 1, time.time_ns())
+        os.utime(path, ns=(self._last_use, self._last_use))
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith(".parquet"):
+                stat = os.stat(os.path.join(self.path, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.path, name))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.path) if os.path.isdir(self.path) else ():
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(self.path, name))
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+        }
@@ -1,27 +1,21 @@
-import boto3
-import time
-from src.config import GLUE_DATABASE_NAME, ATHENA_OUTPUT_LOCATION, REGION
+import argparse
 
-athena = boto3.client("athena", region_name=REGION)
+from src.glue_athena.athena import AthenaClient, run_query_df, run_sync
 
-def run_query(query: str):
-    response = athena.start_query_execution(
-        QueryString=query,
-        QueryExecutionContext={"Database": GLUE_DATABASE_NAME},
-        ResultConfiguration={"OutputLocation": ATHENA_OUTPUT_LOCATION}
-    )
-    return response["QueryExecutionId"]
+def run_query(query: str, database=None):
+    return run_sync(AthenaClient().start(query, database))
 
 def wait_for_results(query_id: str):
-    while True:
-        response = athena.get_query_execution(QueryExecutionId=query_id)
-        status = response["QueryExecution"]["Status"]["State"]
-        if status in ["SUCCEEDED", "FAILED", "CANCELLED"]:
-            return status
-        time.sleep(2)
+    """Wait for a started query with backing-off polls; returns its final state."""
+    return run_sync(AthenaClient().wait(query_id, check=False))["Status"]["State"]
 
 if __name__ == "__main__":
-    query = "SELECT * FROM era5_hourly_data LIMIT 10"
-    qid = run_query(query)
-    status = wait_for_results(qid)
-    print(f"✅ Athena query finished with status: {status}")
+    parser = argparse.ArgumentParser(description="Run an Athena query and print every result row")
+    parser.add_argument("query", nargs="?", default="SELECT * FROM era5_hourly_data LIMIT 10")
+    parser.add_argument("--database", help="Glue database the query runs in")
+    parser.add_argument("--timeout", type=float, help="Cancel the query after this many seconds")
+    args = parser.parse_args()
+
+    df = run_query_df(args.query, args.database, timeout=args.timeout)
+    print(df.to_string())
+    print(f"✅ Athena query returned {len(df)} rows")
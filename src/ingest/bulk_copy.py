@@ -0,0 +1,122 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import settings
+
+MB = 1024 * 1024
+
+# Server-side copies move no data through this machine, so many more can be in flight than uploads
+MAX_WORKERS = int(os.getenv("COPY_MAX_WORKERS", "32"))
+# Objects from this size up are copied as concurrent UploadPartCopy ranges of this size
+PART_SIZE = int(os.getenv("COPY_PART_SIZE_MB", "128")) * MB
+PART_CONCURRENCY = int(os.getenv("COPY_PART_CONCURRENCY", "8"))
+
+# A copy's ETag need not match a multipart source's, so the source ETag is kept in its metadata
+SOURCE_ETAG_METADATA_KEY = "source-etag"
+
+_s3 = None
+
+
+def get_s3_client():
+    """One S3 client for every copy, pooled wide enough for all workers and their parts."""
+    global _s3
+    if _s3 is None:
+        from botocore.config import Config
+        _s3 = settings.session.client("s3", config=Config(max_pool_connections=MAX_WORKERS * PART_CONCURRENCY))
+    return _s3
+
+
+def list_objects(s3, bucket, prefix):
+    """{key: {"size", "etag"}} for every object under `prefix`, across all listing pages."""
+    objects = {}
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            objects[obj["Key"]] = {"size": obj["Size"], "etag": obj["ETag"]}
+    return objects
+
+
+def is_copied(s3, bucket, key, source, existing):
+    """Whether `existing` (the listing entry for bucket/key, or None) already holds `source`."""
+    if not existing or existing["size"] != source["size"]:
+        return False
+    if existing["etag"] == source["etag"]:
+        return True
+    if "-" not in existing["etag"] and "-" not in source["etag"]:
+        return False
+    # ETags only differ for the same bytes when either side is multipart; the HEAD reads
+    # the ETag the copy was made from
+    metadata = s3.head_object(Bucket=bucket, Key=key).get("Metadata", {})
+    return metadata.get(SOURCE_ETAG_METADATA_KEY) == source["etag"]
+
+
+def copy_object(s3, source_bucket, source_key, bucket, key, source, part_size=PART_SIZE,
+                part_concurrency=PART_CONCURRENCY):
+    """Copy one object inside S3: a single CopyObject, or a multipart copy from `part_size` up."""
+    copy_source = {"Bucket": source_bucket, "Key": source_key}
+    # Either way the copy's ETag can differ from the source's (a multipart source copied
+    # whole, or a multipart copy), so the source ETag is recorded for is_copied
+    metadata = {"Metadata": {SOURCE_ETAG_METADATA_KEY: source["etag"]}, "MetadataDirective": "REPLACE"}
+    if source["size"] < part_size:
+        s3.copy_object(CopySource=copy_source, Bucket=bucket, Key=key, **metadata)
+        return
+
+    from boto3.s3.transfer import TransferConfig
+
+    s3.copy(
+        copy_source, bucket, key,
+        ExtraArgs=metadata,
+        Config=TransferConfig(multipart_threshold=part_size, multipart_chunksize=part_size, max_concurrency=part_concurrency),
+    )
+
+
+def copy_prefix(source_bucket, prefix, bucket, dest_key=lambda key: key, s3=None, max_workers=MAX_WORKERS,
+                part_size=PART_SIZE, part_concurrency=PART_CONCURRENCY, raise_on_failure=False):
+    """Server-side copy of every object under `prefix` to `bucket`, skipping ones already there.
+
+    `dest_key` maps a source key to its destination key. An object counts as
+    already copied when the destination has the same size and ETag (or, when
+    either is multipart, was copied from that ETag). Returns a stats dict; failures
+    are reported and counted, or raised as a RuntimeError once every object has
+    been attempted if `raise_on_failure`.
+    """
+    from botocore.exceptions import ClientError
+
+    s3 = s3 or get_s3_client()
+    start = time.perf_counter()
+    sources = list_objects(s3, source_bucket, prefix)
+    targets = {key: dest_key(key) for key in sources}
+    existing = list_objects(s3, bucket, os.path.commonprefix(list(targets.values()))) if targets else {}
+
+    def copy(key):
+        target = targets[key]
+        try:
+            if is_copied(s3, bucket, target, sources[key], existing.get(target)):
+                return "skipped"
+            copy_object(s3, source_bucket, key, bucket, target, sources[key], part_size, part_concurrency)
+            return "copied"
+        except ClientError as e:
+            print(f"❌ Copy failed for s3://{source_bucket}/{key}: {e}")
+            return "failed"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        outcomes = dict(zip(sources, pool.map(copy, sources)))
+    seconds = time.perf_counter() - start
+
+    copied = [key for key, outcome in outcomes.items() if outcome == "copied"]
+    stats = {
+        "objects": len(sources),
+        "copied": len(copied),
+        "skipped": sum(outcome == "skipped" for outcome in outcomes.values()),
+        "failed": sum(outcome == "failed" for outcome in outcomes.values()),
+        "bytes": sum(sources[key]["size"] for key in copied),
+        "seconds": round(seconds, 3),
+    }
+    stats["objects_per_second"] = round(stats["copied"] / seconds, 1) if seconds else 0.0
+    stats["bytes_per_second"] = int(stats["bytes"] / seconds) if seconds else stats["bytes"]
+    print(f"📦 Copied {stats['copied']}/{stats['objects']} objects ({stats['skipped']} unchanged) from s3://{source_bucket}/{prefix} "
+          f"to s3://{bucket}: {stats['bytes'] / MB:.1f} MB in {seconds:.1f}s "
+          f"({stats['objects_per_second']} objects/s, {stats['bytes_per_second'] / MB:.1f} MB/s)")
+    if raise_on_failure and stats["failed"]:
+        raise RuntimeError(f"❌ {stats['failed']} of {stats['objects']} copies from s3://{source_bucket}/{prefix} failed")
+    return stats
@@ -1,30 +1,25 @@
-import boto3
-from src.config import RAW_BUCKET, ERA5_BUCKET, ERA5_DATA_PREFIX, REGION
+import argparse
 
-s3 = boto3.resource("s3", region_name=REGION)
-src_bucket = s3.Bucket(ERA5_BUCKET)
-dst_bucket = s3.Bucket(RAW_BUCKET)
+from src.config import ERA5_RAW_PREFIX, settings
+from src.ingest.bulk_copy import MAX_WORKERS, copy_prefix
 
-def copy_era5_subset():
-    prefix = ERA5_DATA_PREFIX
-    copied = 0
 
-    for obj in src_bucket.objects.filter(Prefix=prefix):
-        source_key = obj.key
-        dest_key = f"era5/{source_key.split('/')[-1]}"
+def copy_era5_subset(prefix=None, max_workers=MAX_WORKERS, raise_on_failure=False):
+    """Copy the ERA5 files under `prefix` (default ERA5_DATA_PREFIX) into the raw bucket, server-side.
 
-        dst_bucket.copy(
-            {
-                'Bucket': ERA5_BUCKET,
-                'Key': source_key
-            },
-            dest_key
-        )
+    Source keys are kept under era5/, since ERA5 file names repeat from month to month.
+    """
+    prefix = prefix or settings.era5_data_prefix
+    stats = copy_prefix(settings.era5_bucket, prefix, settings.raw_bucket, lambda key: f"{ERA5_RAW_PREFIX}{key}",
+                        max_workers=max_workers, raise_on_failure=raise_on_failure)
+    print(f"🎉 Finished copying ERA5 files: {stats['copied']} copied, {stats['skipped']} already present.")
+    return stats
 
-        copied += 1
-        print(f"✅ Copied: {source_key} → s3://{RAW_BUCKET}/{dest_key}")
-
-    print(f"🎉 Finished copying {copied} ERA5 files.")
 
 if __name__ == "__main__":
-    copy_era5_subset()
+    parser = argparse.ArgumentParser(description="Copy an ERA5 subset from the public bucket into the raw bucket")
+    parser.add_argument("--prefix", help="Source prefix, e.g. 2020/07/ (default: ERA5_DATA_PREFIX)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Objects copied at the same time")
+    args = parser.parse_args()
+
+    copy_era5_subset(args.prefix, args.workers, raise_on_failure=True)
@@ -0,0 +1,315 @@
+import argparse
+import os
+import tempfile
+import warnings
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from src.config import ERA5_PROCESSED_PREFIX, ERA5_RAW_PREFIX, settings
+
+# Hours of every input variable held in memory at once: memory is this x grid cells in the
+# counties' bounding box x 4 bytes per variable, whatever the file length
+CHUNK_HOURS = int(os.getenv("ERA5_CHUNK_HOURS", "24"))
+COUNTY_WEIGHTS_PATH = "data/era5_county_weights.npz"
+COUNTY_SHAPES_URL = "https://www2.census.gov/geo/tiger/GENZ2023/shp/cb_2023_us_county_20m.zip"
+# CONUS Albers, so intersection areas are in m² rather than square degrees
+EQUAL_AREA_CRS = "EPSG:5070"
+FREQUENCIES = ("daily", "monthly")
+
+# Input -> its name in the public era5-pds files and in cdsapi downloads
+INPUT_VARIABLES = {
+    "t2m": ("air_temperature_at_2_metres", "t2m"),
+    "d2m": ("dew_point_temperature_at_2_metres", "d2m"),
+    "u10": ("eastward_wind_at_10_metres", "u10"),
+    "v10": ("northward_wind_at_10_metres", "v10"),
+}
+_DIMENSIONS = {"time0": "time", "valid_time": "time", "latitude": "lat", "longitude": "lon"}
+
+# Output column -> (hourly field, reduction over the hours of a period)
+AGGREGATES = {
+    "tmax_c": ("temperature_c", "max"),
+    "rh_min": ("relative_humidity", "min"),
+    "wind_max": ("wind_speed", "max"),
+    "wind_mean": ("wind_speed", "mean"),
+}
+
+
+def hourly_fields(inputs):
+    """Fire-weather fields from hourly ERA5 inputs (K and m/s): °C, RH % (Magnus formula) and wind speed."""
+    t = inputs["t2m"] - np.float32(273.15)
+    td = inputs["d2m"] - np.float32(273.15)
+    rh = 100 * np.exp(17.625 * td / (243.04 + td) - 17.625 * t / (243.04 + t))
+    return {
+        "temperature_c": t,
+        "relative_humidity": np.minimum(rh, 100, dtype=np.float32),
+        "wind_speed": np.hypot(inputs["u10"], inputs["v10"]),
+    }
+
+
+class CountyWeights:
+    """County x grid-cell area fractions: each county's row sums to 1 over the cells it overlaps.
+
+    Built once from county shapes and the ERA5 grid, saved as .npz and reused
+    for every file on that grid. Only the bounding box of the cells that
+    touch a county is ever read from the NetCDF files.
+    """
+
+    def __init__(self, geoids, lat, lon, rows, cols, fractions):
+        from scipy import sparse
+
+        self.geoids = np.asarray(geoids).astype(str)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        lat_idx, lon_idx = np.divmod(cols, len(self.lon))
+        self.lat_slice = slice(int(lat_idx.min()), int(lat_idx.max()) + 1)
+        self.lon_slice = slice(int(lon_idx.min()), int(lon_idx.max()) + 1)
+        box_width = self.lon_slice.stop - self.lon_slice.start
+        box_cols = (lat_idx - self.lat_slice.start) * box_width + (lon_idx - self.lon_slice.start)
+        n_cells = (self.lat_slice.stop - self.lat_slice.start) * box_width
+        self.matrix = sparse.csr_matrix((fractions, (rows, box_cols)), shape=(len(self.geoids), n_cells))
+        self._saved = (rows, cols, np.asarray(fractions))
+
+    @classmethod
+    def build(cls, lat, lon, counties, geoid_column="GEOID"):
+        """Intersect every grid cell near the counties with them; `counties` is a GeoDataFrame."""
+        import geopandas as gpd
+        import shapely
+
+        lat, lon = np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64)
+        half_lat, half_lon = abs(lat[1] - lat[0]) / 2, abs(lon[1] - lon[0]) / 2
+        counties = counties.to_crs("EPSG:4326")
+        min_x, min_y, max_x, max_y = counties.total_bounds
+
+        # ERA5 longitudes run 0..360; cells are drawn at -180..180 to meet the county shapes
+        lon180 = (lon + 180) % 360 - 180
+        lat_idx = np.flatnonzero((lat + half_lat >= min_y) & (lat - half_lat <= max_y))
+        lon_idx = np.flatnonzero((lon180 + half_lon >= min_x) & (lon180 - half_lon <= max_x))
+        grid_lat, grid_lon = np.meshgrid(lat_idx, lon_idx, indexing="ij")
+        centers_y, centers_x = lat[grid_lat.ravel()], lon180[grid_lon.ravel()]
+        cells = gpd.GeoDataFrame(
+            {"cell": grid_lat.ravel() * len(lon) + grid_lon.ravel()},
+            geometry=shapely.box(centers_x - half_lon, centers_y - half_lat, centers_x + half_lon, centers_y + half_lat),
+            crs="EPSG:4326",
+        )
+
+        geoids = counties[geoid_column].astype(str).to_numpy()
+        shapes = gpd.GeoDataFrame({"county": np.arange(len(counties))}, geometry=counties.geometry.values, crs="EPSG:4326")
+        pieces = gpd.overlay(cells, shapes, how="intersection", keep_geom_type=True).to_crs(EQUAL_AREA_CRS)
+        pieces["area"] = pieces.geometry.area
+        pieces = pieces[pieces["area"] > 0]
+        fractions = pieces["area"] / pieces.groupby("county")["area"].transform("sum")
+        missing = len(geoids) - pieces["county"].nunique()
+        if missing:
+            print(f"⚠️ {missing} counties overlap no grid cell and will have no values")
+        return cls(geoids, lat, lon, pieces["county"].to_numpy(), pieces["cell"].to_numpy(), fractions.to_numpy())
+
+    def save(self, path=COUNTY_WEIGHTS_PATH):
+        rows, cols, fractions = self._saved
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(path, geoids=self.geoids, lat=self.lat, lon=self.lon, rows=rows, cols=cols, fractions=fractions)
+
+    @classmethod
+    def load(cls, path=COUNTY_WEIGHTS_PATH):
+        with np.load(path) as f:
+            return cls(f["geoids"], f["lat"], f["lon"], f["rows"], f["cols"], f["fractions"])
+
+    def check_grid(self, lat, lon):
+        if len(lat) != len(self.lat) or len(lon) != len(self.lon) or not (np.allclose(lat, self.lat) and np.allclose(lon, self.lon)):
+            raise ValueError("The ERA5 grid does not match the county weights; rebuild them for this grid")
+
+    def apply(self, values):
+        """Area-weighted county means of per-cell `values` (flattened box cells); NaN cells are left out."""
+        valid = ~np.isnan(values)
+        total = self.matrix @ np.where(valid, values, 0)
+        covered = self.matrix @ valid.astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(covered > 0, total / covered, np.nan).astype(np.float32)
+
+
+def _standard_dimensions(ds):
+    return ds.rename({old: new for old, new in _DIMENSIONS.items() if old in ds.dims or old in ds.coords})
+
+
+def open_era5(paths):
+    """One lazily read Dataset with time/lat/lon dimensions and the INPUT_VARIABLES, from one file or one per variable."""
+    import xarray as xr
+
+    opened, datasets = [], []
+    for path in paths:
+        opened.append(xr.open_dataset(path))
+        ds = _standard_dimensions(opened[-1])
+        names = {name: short for short, aliases in INPUT_VARIABLES.items() for name in aliases if name in ds.data_vars}
+        datasets.append(ds[list(names)].rename(names))
+    ds = xr.merge(datasets, join="exact", compat="override")
+    ds.set_close(lambda: [d.close() for d in opened])
+    missing = [name for name in INPUT_VARIABLES if name not in ds.data_vars]
+    if missing:
+        raise ValueError(f"ERA5 input is missing {', '.join(INPUT_VARIABLES[name][0] for name in missing)}")
+    return ds
+
+
+def _period_starts(times, freq):
+    times = pd.DatetimeIndex(times)
+    return times.normalize() if freq == "daily" else times.to_period("M").to_timestamp()
+
+
+def _reduce_hours(how, values):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN cells stay NaN
+        if how == "max":
+            return np.nanmax(values, axis=0)
+        if how == "min":
+            return np.nanmin(values, axis=0)
+        return np.nansum(values, axis=0), np.sum(~np.isnan(values), axis=0)
+
+
+def _combine(how, current, update):
+    if current is None:
+        return update
+    if how == "max":
+        return np.fmax(current, update)
+    if how == "min":
+        return np.fmin(current, update)
+    return current[0] + update[0], current[1] + update[1]
+
+
+def _finish(how, accumulated):
+    if how != "mean":
+        return accumulated
+    total, count = accumulated
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def iter_county_aggregates(ds, weights, freq="daily", chunk_hours=CHUNK_HOURS):
+    """Yield (period start, {column: county values}) for each day or month of `ds`, in order.
+
+    Hours are read `chunk_hours` at a time for the weights' bounding box only
+    and folded into running per-cell aggregates, so memory does not grow with
+    the length of the input. A period is weighted to counties as soon as the
+    chunks move past it.
+    """
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Unsupported frequency: {freq}")
+    weights.check_grid(ds["lat"].values, ds["lon"].values)
+    periods = _period_starts(ds["time"].values, freq)
+    box = {"lat": weights.lat_slice, "lon": weights.lon_slice}
+    open_periods = {}
+
+    def emit(period):
+        state = open_periods.pop(period)
+        return period, {column: weights.apply(_finish(how, state[column])) for column, (_, how) in AGGREGATES.items()}
+
+    for start in range(0, len(periods), chunk_hours):
+        hours = slice(start, start + chunk_hours)
+        inputs = {
+            name: ds[name].isel(time=hours, **box).values.astype(np.float32).reshape(-1, weights.matrix.shape[1])
+            for name in INPUT_VARIABLES
+        }
+        fields = hourly_fields(inputs)
+        chunk_periods = periods[hours]
+        for period in chunk_periods.unique():
+            rows = np.asarray(chunk_periods == period)
+            state = open_periods.setdefault(period, dict.fromkeys(AGGREGATES))
+            for column, (field, how) in AGGREGATES.items():
+                state[column] = _combine(how, state[column], _reduce_hours(how, fields[field][rows]))
+        for period in sorted(p for p in open_periods if p < chunk_periods[-1]):
+            yield emit(period)
+    for period in sorted(open_periods):
+        yield emit(period)
+
+
+def county_aggregates(ds, weights, freq="daily", chunk_hours=CHUNK_HOURS):
+    """County fire-weather aggregates as a DataFrame: geoid, date (daily only), year, month and AGGREGATES."""
+    frames = []
+    for period, columns in iter_county_aggregates(ds, weights, freq, chunk_hours):
+        frame = pd.DataFrame({"geoid": weights.geoids, **columns})
+        if freq == "daily":
+            frame.insert(1, "date", period.date())
+        frame["year"], frame["month"] = period.year, period.month
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=["geoid", *(["date"] if freq == "daily" else []), *AGGREGATES, "year", "month"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def reduce_era5_prefix(prefix=None, freq="daily", weights_path=COUNTY_WEIGHTS_PATH, database=None, s3=None,
+                       chunk_hours=CHUNK_HOURS):
+    """Reduce the ERA5 files copied under era5/<prefix> to county Parquet, one source folder (month) at a time.
+
+    Output goes to era5/county_<freq>/year=/month=/ in the processed bucket and,
+    with `database`, is registered as the Glue table era5_county_<freq>.
+    """
+    import pyarrow as pa
+
+    from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parquet import write_parquet_partitions
+    from src.config import get_client
+
+    s3 = s3 or get_client("s3")
+    weights = CountyWeights.load(weights_path)
+    source_prefix = f"{ERA5_RAW_PREFIX}{prefix if prefix is not None else settings.era5_data_prefix}"
+    table_prefix = f"{ERA5_PROCESSED_PREFIX}county_{freq}/"
+    wanted = {f"{name}.nc" for aliases in INPUT_VARIABLES.values() for name in aliases}
+
+    folders = defaultdict(list)
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=settings.raw_bucket, Prefix=source_prefix):
+        for obj in page.get("Contents", []):
+            folder, _, name = obj["Key"].rpartition("/")
+            if name in wanted:
+                folders[folder].append(obj["Key"])
+
+    keys = []
+    for folder, folder_keys in sorted(folders.items()):
+        # Only one folder's files are on local disk at a time
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for key in folder_keys:
+                paths.append(os.path.join(tmp, os.path.basename(key)))
+                s3.download_file(settings.raw_bucket, key, paths[-1])
+            with open_era5(paths) as ds:
+                df = county_aggregates(ds, weights, freq, chunk_hours)
+        written = write_parquet_partitions(s3, settings.processed_bucket, table_prefix, df, ["year", "month"])
+        print(f"✅ {folder}: {len(df)} county rows in {len(written)} partitions")
+        keys += written
+
+    if keys and database:
+        from src.glue_athena.partitions import glue_type, register_parquet_dataset
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        register_parquet_dataset(
+            database, f"era5_county_{freq}", settings.processed_bucket, table_prefix, keys,
+            pa.schema([f for f in schema if f.name not in ("year", "month")]),
+            [(col, glue_type(schema.field(col).type)) for col in ("year", "month")],
+        )
+    print(f"🎉 Reduced {len(folders)} ERA5 folders under s3://{settings.raw_bucket}/{source_prefix}")
+    return keys
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reduce hourly ERA5 grids to county fire-weather aggregates")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("weights", help="Precompute the cell-to-county weights for a grid")
+    build.add_argument("grid", help="Any ERA5 NetCDF file on the target grid")
+    build.add_argument("--counties", default=COUNTY_SHAPES_URL, help="County shapes with a GEOID column")
+    build.add_argument("--out", default=COUNTY_WEIGHTS_PATH)
+    reduce = commands.add_parser("reduce", help="Reduce the copied ERA5 files to county Parquet")
+    reduce.add_argument("--prefix", help="Source prefix under era5/ (default: ERA5_DATA_PREFIX)")
+    reduce.add_argument("--freq", choices=FREQUENCIES, default="daily")
+    reduce.add_argument("--weights", default=COUNTY_WEIGHTS_PATH)
+    reduce.add_argument("--database", help="Register the output as a Glue table in this database")
+    args = parser.parse_args()
+
+    if args.command == "weights":
+        import geopandas as gpd
+        import xarray as xr
+
+        with xr.open_dataset(args.grid) as grid:
+            grid = _standard_dimensions(grid)
+            weights = CountyWeights.build(grid["lat"].values, grid["lon"].values, gpd.read_file(args.counties))
+        weights.save(args.out)
+        print(f"✅ Weights for {len(weights.geoids)} counties over {weights.matrix.shape[1]} cells saved to {args.out}")
+    else:
+        reduce_era5_prefix(args.prefix, args.freq, args.weights, args.database)
@@ -0,0 +1,87 @@
+import copy
+import datetime
+import threading
+
+
+def _error(code, message, operation):
+    from botocore.exceptions import ClientError
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+class LocalGlue:
+    """In-memory Glue crawlers and catalog for offline pipeline runs; a started crawl has finished by the next poll."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.crawls = {}
+        self.tables = {}
+        # {(database, table): {values tuple: PartitionInput}}
+        self.partitions = {}
+        self.requests = []
+
+    def start_crawler(self, Name):
+        with self._lock:
+            self.crawls[Name] = self.crawls.get(Name, 0) + 1
+
+    def batch_get_crawlers(self, CrawlerNames):
+        with self._lock:
+            crawlers = []
+            for name in CrawlerNames:
+                crawler = {"Name": name, "State": "READY", "DatabaseName": None}
+                if self.crawls.get(name):
+                    crawler["LastCrawl"] = {"Status": "SUCCEEDED", "LogStream": f"{name}-{self.crawls[name]}"}
+                crawlers.append(crawler)
+            return {"Crawlers": crawlers}
+
+    def get_crawler_metrics(self, CrawlerNameList):
+        return {"CrawlerMetricsList": [{"CrawlerName": name} for name in CrawlerNameList]}
+
+    def get_table(self, DatabaseName, Name):
+        with self._lock:
+            self.requests.append(("get_table", Name))
+            if (DatabaseName, Name) not in self.tables:
+                raise _error("EntityNotFoundException", f"Table {Name} not found.", "GetTable")
+            return {"Table": copy.deepcopy(self.tables[DatabaseName, Name])}
+
+    def create_table(self, DatabaseName, TableInput):
+        with self._lock:
+            self.requests.append(("create_table", TableInput["Name"]))
+            if (DatabaseName, TableInput["Name"]) in self.tables:
+                raise _error("AlreadyExistsException", "Table already exists.", "CreateTable")
+            now = datetime.datetime.now(datetime.timezone.utc)
+            self.tables[DatabaseName, TableInput["Name"]] = {
+                **copy.deepcopy(TableInput), "DatabaseName": DatabaseName, "CreateTime": now, "UpdateTime": now,
+            }
+            return {}
+
+    def update_table(self, DatabaseName, TableInput, SkipArchive=False):
+        with self._lock:
+            self.requests.append(("update_table", TableInput["Name"]))
+            if (DatabaseName, TableInput["Name"]) not in self.tables:
+                raise _error("EntityNotFoundException", f"Table {TableInput['Name']} not found.", "UpdateTable")
+            created = self.tables[DatabaseName, TableInput["Name"]]["CreateTime"]
+            self.tables[DatabaseName, TableInput["Name"]] = {
+                **copy.deepcopy(TableInput), "DatabaseName": DatabaseName, "CreateTime": created,
+                "UpdateTime": datetime.datetime.now(datetime.timezone.utc),
+            }
+            return {}
+
+    def batch_create_partition(self, DatabaseName, TableName, PartitionInputList):
+        if len(PartitionInputList) > 100:
+            raise _error("ValidationException", "At most 100 partitions per request.", "BatchCreatePartition")
+        with self._lock:
+            self.requests.append(("batch_create_partition", len(PartitionInputList)))
+            if (DatabaseName, TableName) not in self.tables:
+                raise _error("EntityNotFoundException", f"Table {TableName} not found.", "BatchCreatePartition")
+            partitions = self.partitions.setdefault((DatabaseName, TableName), {})
+            errors = []
+            for partition in PartitionInputList:
+                values = tuple(partition["Values"])
+                if values in partitions:
+                    errors.append({
+                        "PartitionValues": list(values),
+                        "ErrorDetail": {"ErrorCode": "AlreadyExistsException", "ErrorMessage": "Partition already exists."},
+                    })
+                else:
+                    partitions[values] = copy.deepcopy(partition)
+            return {"Errors": errors} if errors else {}
@@ -0,0 +1,402 @@
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlparse
+from xml.sax.saxutils import escape
+
+import boto3
+from botocore.config import Config
+
+PART_RE = re.compile(rb"<PartNumber>(\d+)</PartNumber>")
+
+
+def _sha256_b64(data):
+    return base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+def _decode_aws_chunked(body):
+    """Strip aws-chunked framing, returning the payload and any trailing checksum headers."""
+    data, trailers, pos = [], {}, 0
+    while True:
+        end = body.index(b"\r\n", pos)
+        size = int(body[pos:end].split(b";")[0], 16)
+        pos = end + 2
+        if size == 0:
+            break
+        data.append(body[pos:pos + size])
+        pos += size + 2
+    for line in body[pos:].split(b"\r\n"):
+        if b":" in line:
+            name, value = line.decode().split(":", 1)
+            trailers[name.strip().lower()] = value.strip()
+    return b"".join(data), trailers
+
+
+class LocalS3Handler(BaseHTTPRequestHandler):
+    """Path-style S3 subset: objects, metadata, listing, server-side copies and multipart uploads, with optional throttling."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _target(self):
+        url = urlparse(self.path)
+        bucket, _, key = url.path.lstrip("/").partition("/")
+        return bucket, unquote(key), {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunks.append(self.rfile.read(size + 2)[:size])
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b""):
+                        pass
+                    break
+            body = b"".join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        checksums = {k.lower(): v for k, v in self.headers.items() if k.lower().startswith("x-amz-checksum-")}
+        if "aws-chunked" in self.headers.get("Content-Encoding", ""):
+            body, trailers = _decode_aws_chunked(body)
+            checksums.update(trailers)
+        self.server.throttle(len(body))
+        return body, checksums
+
+    def _bad_digest(self, body, checksums):
+        # S3 rejects a PUT/UploadPart whose SHA-256 checksum does not match the payload
+        expected = checksums.get("x-amz-checksum-sha256")
+        if expected and expected != _sha256_b64(body):
+            self._reply(400, b"<Error><Code>BadDigest</Code></Error>")
+            return True
+        return False
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _not_found(self, code="NoSuchKey"):
+        self._reply(404, f"<Error><Code>{code}</Code></Error>".encode())
+
+    def do_PUT(self):
+        bucket, key, query = self._target()
+        body, checksums = self._read_body()
+        if self._bad_digest(body, checksums):
+            return
+        store = self.server.store
+        if "x-amz-copy-source" in self.headers:
+            return self._copy(bucket, key, query)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if "uploadId" in query:
+            upload = store.uploads.get(query["uploadId"])
+            if upload is None:
+                return self._not_found("NoSuchUpload")
+            upload["parts"][int(query["partNumber"])] = (body, checksums)
+            store.requests.append(("UploadPart", key, len(body)))
+            return self._reply(200, headers={"ETag": etag, **checksums})
+        store.put(bucket, key, {"body": body, "etag": etag, "metadata": self._metadata(), "checksums": checksums})
+        store.requests.append(("PutObject", key, len(body)))
+        self._reply(200, headers={"ETag": etag, **checksums})
+
+    def _copy(self, bucket, key, query):
+        # CopyObject, or UploadPartCopy of an optional byte range when the PUT names an upload
+        store = self.server.store
+        source_bucket, _, source_key = unquote(self.headers["x-amz-copy-source"].split("?")[0]).lstrip("/").partition("/")
+        source = store.get(source_bucket, source_key)
+        if source is None:
+            return self._not_found()
+        body = source["body"]
+        if "uploadId" in query:
+            upload = store.uploads.get(query["uploadId"])
+            if upload is None:
+                return self._not_found("NoSuchUpload")
+            byte_range = self.headers.get("x-amz-copy-source-range")
+            if byte_range:
+                first, last = byte_range.split("=")[1].split("-")
+                body = body[int(first):int(last) + 1]
+            upload["parts"][int(query["partNumber"])] = (body, {})
+            store.requests.append(("UploadPartCopy", key, 0))
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            return self._reply(200, f"<CopyPartResult><ETag>{escape(etag)}</ETag></CopyPartResult>".encode())
+
+        # As on S3, the copy is a single-part object with the MD5 of its body as ETag
+        # (so a multipart source's "<md5>-<parts>" ETag is not carried over)
+        replace = self.headers.get("x-amz-metadata-directive", "COPY").upper() == "REPLACE"
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        store.put(bucket, key, {**source, "etag": etag, "metadata": self._metadata() if replace else source["metadata"]})
+        store.requests.append(("CopyObject", key, 0))
+        xml = f"<CopyObjectResult><ETag>{escape(etag)}</ETag><LastModified>2025-01-01T00:00:00.000Z</LastModified></CopyObjectResult>"
+        self._reply(200, xml.encode())
+
+    def do_POST(self):
+        bucket, key, query = self._target()
+        body, _ = self._read_body()
+        store = self.server.store
+        if "uploads" in query:
+            upload_id = uuid.uuid4().hex
+            store.uploads[upload_id] = {"parts": {}, "metadata": self._metadata()}
+            store.requests.append(("CreateMultipartUpload", key, 0))
+            xml = f"<InitiateMultipartUploadResult><Bucket>{bucket}</Bucket><Key>{key}</Key><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+            return self._reply(200, xml.encode())
+
+        upload = store.uploads.pop(query.get("uploadId"), None)
+        if upload is None:
+            return self._not_found("NoSuchUpload")
+        numbers = [int(n) for n in PART_RE.findall(body)]
+        parts = [upload["parts"][n] for n in numbers]
+        digest = hashlib.md5(b"".join(hashlib.md5(body).digest() for body, _ in parts)).hexdigest()
+        etag = f'"{digest}-{len(parts)}"'
+        checksums = {}
+        if all("x-amz-checksum-sha256" in c for _, c in parts):
+            # Composite checksum: SHA-256 over the concatenated raw part digests
+            joined = b"".join(base64.b64decode(c["x-amz-checksum-sha256"]) for _, c in parts)
+            checksums["x-amz-checksum-sha256"] = f"{_sha256_b64(joined)}-{len(parts)}"
+        body = b"".join(body for body, _ in parts)
+        store.put(bucket, key, {"body": body, "etag": etag, "metadata": upload["metadata"], "checksums": checksums})
+        store.requests.append(("CompleteMultipartUpload", key, 0))
+        xml = f"<CompleteMultipartUploadResult><Bucket>{bucket}</Bucket><Key>{key}</Key><ETag>{etag}</ETag></CompleteMultipartUploadResult>"
+        self._reply(200, xml.encode())
+
+    def do_DELETE(self):
+        bucket, key, query = self._target()
+        if "uploadId" in query:
+            self.server.store.uploads.pop(query["uploadId"], None)
+        else:
+            self.server.store.delete(bucket, key)
+        self._reply(204)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        bucket, key, query = self._target()
+        if not key and query.get("list-type") == "2":
+            return self._list(bucket, query)
+        obj = self.server.store.get(bucket, key)
+        if obj is None:
+            return self._not_found()
+        headers = {"ETag": obj["etag"], **{f"x-amz-meta-{k}": v for k, v in obj["metadata"].items()}}
+        if self.headers.get("x-amz-checksum-mode", "").upper() == "ENABLED":
+            headers.update(obj["checksums"])
+        self.server.store.requests.append((self.command.title() + "Object", key, 0))
+        self._reply(200, obj["body"], headers)
+
+    def _list(self, bucket, query):
+        # ListObjectsV2 with Prefix, MaxKeys and ContinuationToken (the last key returned)
+        prefix = query.get("prefix", "")
+        after = query.get("continuation-token") or query.get("start-after", "")
+        max_keys = int(query.get("max-keys", 1000))
+        keys = [k for k in self.server.store.keys(bucket, prefix) if k > after]
+        page, truncated = keys[:max_keys], len(keys) > max_keys
+        contents = ""
+        for k in page:
+            obj = self.server.store.get(bucket, k)
+            contents += (
+                f"<Contents><Key>{escape(k)}</Key><ETag>{escape(obj['etag'])}</ETag><Size>{len(obj['body'])}</Size>"
+                f"<LastModified>2025-01-01T00:00:00.000Z</LastModified><StorageClass>STANDARD</StorageClass></Contents>"
+            )
+        token = f"<NextContinuationToken>{escape(page[-1])}</NextContinuationToken>" if truncated else ""
+        xml = (
+            f"<ListBucketResult><Name>{bucket}</Name><Prefix>{escape(prefix)}</Prefix><KeyCount>{len(page)}</KeyCount>"
+            f"<MaxKeys>{max_keys}</MaxKeys><IsTruncated>{str(truncated).lower()}</IsTruncated>{token}{contents}</ListBucketResult>"
+        )
+        self.server.store.requests.append(("ListObjectsV2", prefix, 0))
+        self._reply(200, xml.encode())
+
+    def _metadata(self):
+        return {k.lower()[len("x-amz-meta-"):]: v for k, v in self.headers.items() if k.lower().startswith("x-amz-meta-")}
+
+
+class LocalS3Store:
+    """In-memory objects, as {(bucket, key): {"body", "etag", "metadata", "checksums"}}.
+
+    The server only goes through `put`, `get`, `delete` and `keys`, so any
+    class with those methods can back it (see FileS3Store).
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def put(self, bucket, key, obj):
+        with self._lock:
+            self.objects[(bucket, key)] = obj
+
+    def get(self, bucket, key):
+        return self.objects.get((bucket, key))
+
+    def delete(self, bucket, key):
+        with self._lock:
+            self.objects.pop((bucket, key), None)
+
+    def keys(self, bucket, prefix=""):
+        with self._lock:
+            return sorted(k for b, k in self.objects if b == bucket and k.startswith(prefix))
+
+    def body(self, bucket, key):
+        obj = self.get(bucket, key)
+        if obj is None:
+            raise KeyError((bucket, key))
+        return obj["body"]
+
+    def bytes_received(self):
+        return sum(size for op, _, size in self.requests if op in ("PutObject", "UploadPart"))
+
+
+def _encode_segment(segment):
+    # Empty, "." and ".." key segments cannot be path components; "%" is quoted, so these never collide
+    return {"": "%", ".": "%2E", "..": "%2E%2E"}.get(segment) or quote(segment, safe=" =-_.,+@()")
+
+
+def _decode_segment(name):
+    return "" if name == "%" else unquote(name)
+
+
+class FileS3Store(LocalS3Store):
+    """Objects kept as plain files under `root/<bucket>/<key>`, so they outlive the server.
+
+    ETags, user metadata and checksums live in `root/.meta/`; a file copied
+    into a bucket directory by hand is served too, with its MD5 as the ETag.
+    A key cannot also be the prefix of another key ("a" and "a/b"), as on any
+    filesystem. In-flight multipart parts stay in memory.
+    """
+
+    META_DIR = ".meta"  # S3 bucket names cannot start with "."
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, bucket, key, meta=False):
+        parts = [_encode_segment(s) for s in key.split("/")]
+        if meta:
+            return os.path.join(self.root, self.META_DIR, bucket, *parts[:-1], parts[-1] + ".json")
+        return os.path.join(self.root, bucket, *parts)
+
+    @staticmethod
+    def _write(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, bucket, key, obj):
+        info = {"etag": obj["etag"], "metadata": obj["metadata"], "checksums": obj["checksums"]}
+        with self._lock:
+            self._write(self._path(bucket, key), obj["body"])
+            self._write(self._path(bucket, key, meta=True), json.dumps(info).encode())
+
+    def get(self, bucket, key):
+        try:
+            with open(self._path(bucket, key), "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+        try:
+            with open(self._path(bucket, key, meta=True)) as f:
+                info = json.load(f)
+        except FileNotFoundError:
+            info = {"etag": f'"{hashlib.md5(body).hexdigest()}"', "metadata": {}, "checksums": {}}
+        return {"body": body, **info}
+
+    def delete(self, bucket, key):
+        with self._lock:
+            for path in (self._path(bucket, key), self._path(bucket, key, meta=True)):
+                try:
+                    os.remove(path)
+                except (FileNotFoundError, IsADirectoryError):
+                    pass
+
+    def keys(self, bucket, prefix=""):
+        top = os.path.join(self.root, bucket)
+        keys = []
+        for folder, _, names in os.walk(top):
+            relative = os.path.relpath(folder, top)
+            segments = [] if relative == "." else relative.split(os.sep)
+            for name in names:
+                if not name.endswith(".tmp"):
+                    key = "/".join(_decode_segment(s) for s in segments + [name])
+                    if key.startswith(prefix):
+                        keys.append(key)
+        return sorted(keys)
+
+
+class LocalS3Server(ThreadingHTTPServer):
+    """In-process S3 stand-in; `latency` (s per request) and `bandwidth` (B/s per connection) emulate a network.
+
+    Objects are kept in memory unless another `store` (a FileS3Store) is given.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency=0.0, bandwidth=None, store=None, port=0):
+        super().__init__(("127.0.0.1", port), LocalS3Handler)
+        self.store = store if store is not None else LocalS3Store()
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def throttle(self, size):
+        delay = self.latency + (size / self.bandwidth if self.bandwidth else 0)
+        if delay:
+            time.sleep(delay)
+
+    @property
+    def endpoint_url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def client(self, **config):
+        return boto3.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            region_name="us-east-1",
+            aws_access_key_id="local",
+            aws_secret_access_key="local",
+            config=Config(s3={"addressing_style": "path"}, **config),
+        )
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local S3 endpoint, e.g. for the Lambdas or copy_era5_to_s3")
+    parser.add_argument("--dir", help="Keep objects as files here (default: in memory)")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--bandwidth-mb", type=float, help="Per-connection bandwidth cap")
+    args = parser.parse_args()
+
+    store = FileS3Store(args.dir) if args.dir else LocalS3Store()
+    bandwidth = args.bandwidth_mb * 1024 * 1024 if args.bandwidth_mb else None
+    server = LocalS3Server(args.latency_ms / 1000, bandwidth, store, args.port)
+    # boto3 picks the endpoint up from the environment, so unmodified scripts use this server
+    print(f"🪣 Local S3 on {server.endpoint_url}{f' backed by {store.root}' if args.dir else ''}. In another shell:")
+    print(f"  export AWS_ENDPOINT_URL_S3={server.endpoint_url} AWS_ACCESS_KEY_ID=local AWS_SECRET_ACCESS_KEY=local")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
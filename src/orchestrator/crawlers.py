@@ -0,0 +1,119 @@
+import argparse
+import sys
+import time
+
+from src.config import get_client, settings
+
+MIN_POLL_SECONDS = 2
+MAX_POLL_SECONDS = 30
+BACKOFF = 1.5
+TIMEOUT_SECONDS = 3 * 60 * 60
+
+
+def start_crawler(glue, name):
+    """Start a crawler; one that is already running is simply waited on. Returns False in that case."""
+    from botocore.exceptions import ClientError
+
+    try:
+        glue.start_crawler(Name=name)
+        print(f"▶️ Started crawler: {name}")
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "CrawlerRunningException":
+            raise
+        print(f"⏳ Crawler {name} is already running, waiting for it")
+        return False
+
+
+def crawler_metrics(glue, names):
+    metrics = glue.get_crawler_metrics(CrawlerNameList=list(names))["CrawlerMetricsList"]
+    return {m["CrawlerName"]: m for m in metrics}
+
+
+def batch_get_crawlers(glue, names):
+    return glue.batch_get_crawlers(CrawlerNames=sorted(names))["Crawlers"]
+
+
+def run_crawlers(names, glue=None, min_poll=MIN_POLL_SECONDS, max_poll=MAX_POLL_SECONDS, timeout=TIMEOUT_SECONDS,
+                 sleep=time.sleep, clock=time.monotonic):
+    """Run crawlers concurrently and wait for all of them with one batched, backing-off poll loop.
+
+    Polling starts every `min_poll` seconds, slows by BACKOFF while nothing
+    changes (up to `max_poll`) and snaps back whenever a crawler changes state.
+    A crawler is done once it is READY after being seen running, or once its
+    LastCrawl differs from the one recorded before the run (a crawl that
+    started and finished between two polls). Raises TimeoutError after `timeout` seconds.
+    Returns {name: {"status", "seconds", "tables_created", "tables_updated", "tables_deleted", "error"}}.
+    """
+    glue = glue or get_client("glue")
+    names = list(dict.fromkeys(names))
+    started = clock()
+    # Snapshot LastCrawl first so a crawl that finishes between polls is still noticed
+    previous_crawls = {c["Name"]: c.get("LastCrawl") for c in batch_get_crawlers(glue, names)}
+    seen_running = {name for name in names if not start_crawler(glue, name)}
+
+    pending = set(names)
+    states = {}
+    finished = {}
+    databases = {}
+    interval = min_poll
+    while pending:
+        if clock() - started > timeout:
+            raise TimeoutError(f"❌ Crawlers still running after {timeout}s: {', '.join(sorted(pending))}")
+        sleep(interval)
+        changed = False
+        for crawler in batch_get_crawlers(glue, pending):
+            name, state = crawler["Name"], crawler["State"]
+            databases[name] = crawler.get("DatabaseName")
+            if state != states.get(name):
+                changed = True
+                states[name] = state
+            if state in ("RUNNING", "STOPPING"):
+                seen_running.add(name)
+            elif state == "READY" and (name in seen_running or crawler.get("LastCrawl") != previous_crawls.get(name)):
+                last = crawler.get("LastCrawl", {})
+                finished[name] = {
+                    "status": last.get("Status", "SUCCEEDED"),
+                    "seconds": round(clock() - started, 1),
+                    "error": last.get("ErrorMessage"),
+                }
+                pending.discard(name)
+                print(f"{'✅' if finished[name]['status'] == 'SUCCEEDED' else '❌'} Crawler {name} {finished[name]['status'].lower()} after {finished[name]['seconds']}s")
+            elif state != "READY":
+                raise RuntimeError(f"❌ Unexpected crawler state for {name}: {state}")
+
+        interval = min_poll if changed else min(max_poll, interval * BACKOFF)
+        if pending and not changed:
+            print(f"⏳ Waiting on {', '.join(sorted(pending))} (next check in {interval:.0f}s)")
+
+    metrics = crawler_metrics(glue, names)
+    for name in names:
+        m = metrics.get(name, {})
+        finished[name].update(
+            tables_created=m.get("TablesCreated", 0),
+            tables_updated=m.get("TablesUpdated", 0),
+            tables_deleted=m.get("TablesDeleted", 0),
+        )
+        # The crawl may have added tables, columns or partitions
+        settings.catalog.invalidate(databases.get(name))
+    return finished
+
+
+def run_crawler_and_wait(crawler_name):
+    return run_crawlers([crawler_name])[crawler_name]
+
+
+def default_crawlers():
+    return [settings.fpa_fod_crawler_name, settings.nclimdiv_crawler_name, settings.wrc_crawler_name]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Glue crawlers concurrently and wait for all of them")
+    parser.add_argument("crawlers", nargs="*", help="Crawler names (default: the FPA FOD, nClimDiv and WRC crawlers)")
+    args = parser.parse_args()
+
+    results = run_crawlers(args.crawlers or default_crawlers())
+    print(f"{'crawler':<22}{'status':<12}{'seconds':>9}{'created':>9}{'updated':>9}{'deleted':>9}")
+    for name, r in results.items():
+        print(f"{name:<22}{r['status']:<12}{r['seconds']:>9}{r['tables_created']:>9}{r['tables_updated']:>9}{r['tables_deleted']:>9}")
+    sys.exit(0 if all(r["status"] == "SUCCEEDED" for r in results.values()) else 1)
@@ -0,0 +1,317 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from src.config import (
+    FPA_FOD_LOCAL_PATH,
+    FPA_FOD_S3_KEY,
+    WRC_LOCAL_PATH,
+    WRC_S3_KEY,
+    settings,
+)
+
+STATE_PATH = os.getenv("PIPELINE_STATE", "data/.pipeline_state.json")
+
+# Stage outcomes; a stage only starts once all of its dependencies are DONE_STATUSES
+DONE_STATUSES = ("ran", "skipped", "offline")
+FAILED_STATUSES = ("failed", "blocked")
+
+
+class Stage:
+    """One pipeline step: `action()` runs once every stage named in `deps` has finished.
+
+    `inputs` are local files or directories. When they and every upstream stage
+    are unchanged since this stage last succeeded, the stage is skipped.
+    `cloud` stages need a real AWS account and are skipped in offline runs.
+    """
+
+    def __init__(self, name, action, deps=(), inputs=(), cloud=False):
+        self.name = name
+        self.action = action
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)
+        self.cloud = cloud
+
+
+def inputs_fingerprint(paths):
+    """Hash of the path, size and mtime of every file under `paths` (missing paths count too)."""
+    digest = hashlib.sha256()
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, f) for root, _, names in os.walk(path) for f in names)
+        else:
+            files = [path]
+        for f in files:
+            if os.path.exists(f):
+                stat = os.stat(f)
+                digest.update(f"{f}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+            else:
+                digest.update(f"{f}:missing\n".encode())
+    return digest.hexdigest()
+
+
+def load_state(path=STATE_PATH):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def check_graph(stages):
+    """Raise ValueError for duplicate names, unknown dependencies or cycles."""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {unknown}")
+
+    visiting, visited = set(), set()
+
+    def visit(name, path):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' → '.join(path + [name])}")
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        visited.add(name)
+
+    for stage in stages:
+        visit(stage.name, [])
+    return by_name
+
+
+def run_pipeline(stages, state_path=STATE_PATH, force=False, offline=False, max_workers=None, clock=time.perf_counter):
+    """Run `stages` as a DAG, independent stages concurrently, and return a per-stage report.
+
+    A failed stage blocks its dependents but not unrelated branches.
+    Returns {name: {"status", "start", "seconds", "error"}} in completion order.
+    """
+    by_name = check_graph(stages)
+    state = load_state(state_path)
+    started = clock()
+    results = {}
+    fingerprints = {}
+    pending = dict(by_name)
+    running = {}
+
+    def fingerprint(stage):
+        parts = [stage.name, inputs_fingerprint(stage.inputs)] + [fingerprints[dep] for dep in stage.deps]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def finish(name, status, start=None, seconds=0.0, error=None):
+        results[name] = {
+            "status": status,
+            "start": round((start if start is not None else clock()) - started, 2),
+            "seconds": round(seconds, 2),
+            "error": error,
+        }
+
+    def execute(stage):
+        start = clock()
+        try:
+            stage.action()
+            return start, clock() - start, None
+        except Exception as e:
+            return start, clock() - start, e
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(stages))) as pool:
+        while pending or running:
+            # Resolve everything decidable now: blocked and skipped stages unlock others immediately
+            progressed = True
+            while progressed:
+                progressed = False
+                for name, stage in list(pending.items()):
+                    statuses = [results.get(dep, {}).get("status") for dep in stage.deps]
+                    if any(s in FAILED_STATUSES for s in statuses):
+                        del pending[name]
+                        finish(name, "blocked")
+                        progressed = True
+                    elif all(s in DONE_STATUSES for s in statuses):
+                        del pending[name]
+                        fingerprints[name] = fingerprint(stage)
+                        if offline and stage.cloud:
+                            finish(name, "offline")
+                            progressed = True
+                        elif not force and state.get(name) == fingerprints[name]:
+                            finish(name, "skipped")
+                            progressed = True
+                        else:
+                            print(f"▶️ {name}")
+                            running[pool.submit(execute, stage)] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                start, seconds, error = future.result()
+                if error is None:
+                    # Re-fingerprinted after the run so outputs the stage writes to its own
+                    # inputs (cdk_outputs.json) do not force a rerun next time
+                    fingerprints[name] = fingerprint(by_name[name])
+                    state[name] = fingerprints[name]
+                    save_state(state, state_path)
+                    finish(name, "ran", start, seconds)
+                    print(f"✅ {name} finished in {seconds:.1f}s")
+                else:
+                    finish(name, "failed", start, seconds, str(error))
+                    print(f"❌ {name} failed after {seconds:.1f}s")
+
+    results["total"] = {"status": "", "start": 0.0, "seconds": round(clock() - started, 2), "error": None}
+    return results
+
+
+def print_report(results):
+    total = results["total"]["seconds"]
+    serial = sum(r["seconds"] for name, r in results.items() if name != "total")
+    print(f"{'stage':<20}{'status':<10}{'start s':>9}{'seconds':>9}")
+    for name, r in results.items():
+        if name != "total":
+            print(f"{name:<20}{r['status']:<10}{r['start']:>9.1f}{r['seconds']:>9.1f}")
+    print(f"⏱️ Wall time {total:.1f}s for {serial:.1f}s of stage work")
+    for name, r in results.items():
+        if r["error"]:
+            print(f"{name}: {r['error']}")
+
+
+def command(*args):
+    """A stage action that runs a shell command and fails on a non-zero exit."""
+    return lambda: subprocess.run(list(args), check=True)
+
+
+def default_stages(offline=False, convert_workers=5):
+    """The stages of the former start_pipeline.sh, with their real dependencies."""
+    from scripts.convert_nclimdiv_manually import convert_and_merge_all
+    from src.data.upload_fpa_fod_parquet import upload_fpa_fod_parquet
+    from src.data.upload_nclimdiv import nclimdiv_upload_plan
+    from src.data.uploader import upload_files
+    from src.orchestrator.crawlers import run_crawler_and_wait
+
+    def upload(files):
+        return lambda: upload_files(files, settings.raw_bucket, raise_on_failure=True)
+
+    def crawl(setting):
+        def action():
+            result = run_crawler_and_wait(getattr(settings, setting))
+            if result["status"] != "SUCCEEDED":
+                raise RuntimeError(f"❌ Crawler finished with status {result['status']}: {result['error']}")
+        return action
+
+    nclimdiv_files = nclimdiv_upload_plan()
+    # Spawned conversion workers would build real AWS clients, so offline runs use threads
+    executor = "thread" if offline else "process"
+    return [
+        Stage("deploy", command("cdk", "deploy", "--outputs-file", "cdk_outputs.json"),
+              inputs=("app.py", "cdk.json", "wildfire_risk_analytics", "infra", "cdk_outputs.json"), cloud=True),
+        Stage("upload_fpa_fod", upload({FPA_FOD_LOCAL_PATH: FPA_FOD_S3_KEY}), deps=["deploy"], inputs=[FPA_FOD_LOCAL_PATH]),
+        Stage("upload_wrc", upload({WRC_LOCAL_PATH: WRC_S3_KEY}), deps=["deploy"], inputs=[WRC_LOCAL_PATH]),
+        Stage("upload_nclimdiv", upload(nclimdiv_files), deps=["deploy"], inputs=list(nclimdiv_files)),
+        # Registers its own table and partitions in Glue, so it needs no crawl stage
+        Stage("fpa_fod_parquet", lambda: upload_fpa_fod_parquet(raise_on_failure=True),
+              deps=["deploy"], inputs=[FPA_FOD_LOCAL_PATH]),
+        Stage("convert_nclimdiv", lambda: convert_and_merge_all(workers=convert_workers, executor=executor),
+              deps=["upload_nclimdiv"]),
+        Stage("crawl_wrc", crawl("wrc_crawler_name"), deps=["upload_wrc"]),
+        Stage("crawl_nclimdiv", crawl("nclimdiv_crawler_name"), deps=["convert_nclimdiv"]),
+    ]
+
+
+def offline_state_path(s3_dir=None):
+    """Where an offline run keeps stage fingerprints: inside the stand-in's S3 directory.
+
+    The state then lives and goes with the objects it describes. An in-memory
+    store starts empty on every run, so there is nothing to skip (None).
+    """
+    return os.path.join(s3_dir, ".pipeline_state.json") if s3_dir else None
+
+
+@contextmanager
+def offline_stand_ins(store=None):
+    """Point every stage at in-process S3 and Glue stand-ins and local bucket and crawler names.
+
+    S3 objects are kept in memory unless a `store` such as src.local.s3.FileS3Store
+    is given. Code that builds its own `boto3.client("s3")` (the Lambdas,
+    copy_era5_to_s3) reaches the stand-in through AWS_ENDPOINT_URL_S3.
+    """
+    from src.local.glue import LocalGlue
+    from src.local.s3 import LocalS3Server
+    from src.data import uploader
+
+    overrides = {
+        "raw_bucket": "local-raw",
+        "processed_bucket": "local-processed",
+        "fpa_fod_crawler_name": "fpa_fod_crawler",
+        "nclimdiv_crawler_name": "nclimdiv_crawler",
+        "wrc_crawler_name": "wrc_crawler",
+        "fpa_fod_database_name": "wildfire_fpa_fod_db",
+        "nclimdiv_database_name": "wildfire_nclimdiv_db",
+    }
+    saved_settings = {name: vars(settings)[name] for name in overrides if name in vars(settings)}
+    saved_clients = dict(settings._clients)
+    saved_uploader = uploader._s3
+    endpoint_env = ("AWS_ENDPOINT_URL_S3", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY")
+    saved_env = {name: os.environ.get(name) for name in endpoint_env}
+    with LocalS3Server(store=store) as server:
+        os.environ.update(AWS_ENDPOINT_URL_S3=server.endpoint_url, AWS_ACCESS_KEY_ID="local", AWS_SECRET_ACCESS_KEY="local")
+        vars(settings).update(overrides)
+        vars(settings).pop("catalog", None)
+        settings._clients.update(s3=server.client(), glue=LocalGlue())
+        uploader._s3 = server.client(max_pool_connections=uploader.MAX_WORKERS * uploader.MAX_CONCURRENCY)
+        try:
+            yield server
+        finally:
+            for name in overrides:
+                vars(settings).pop(name, None)
+            vars(settings).pop("catalog", None)
+            vars(settings).update(saved_settings)
+            settings._clients.clear()
+            settings._clients.update(saved_clients)
+            uploader._s3 = saved_uploader
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deploy, ingest and crawl, running independent stages concurrently")
+    parser.add_argument("--offline", action="store_true", help="Run against in-process S3/Glue stand-ins; skip deploy")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if its inputs are unchanged")
+    parser.add_argument("--state", default=STATE_PATH, help="Where stage fingerprints are kept between online runs")
+    parser.add_argument("--s3-dir", help="With --offline, keep the stand-in's S3 objects as files here")
+    args = parser.parse_args()
+
+    if args.offline:
+        from src.local.s3 import FileS3Store
+
+        # Offline runs keep their own state so they never mark real stages as done
+        with offline_stand_ins(FileS3Store(args.s3_dir) if args.s3_dir else None):
+            results = run_pipeline(default_stages(offline=True), offline_state_path(args.s3_dir),
+                                   force=args.force, offline=True)
+    else:
+        results = run_pipeline(default_stages(), args.state, force=args.force)
+
+    print_report(results)
+    sys.exit(1 if any(r["status"] in FAILED_STATUSES for r in results.values()) else 0)
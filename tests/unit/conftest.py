@@ -0,0 +1,10 @@
+import pytest
+
+from src.local.s3 import LocalS3Server
+
+
+@pytest.fixture
+def local_s3():
+    """An in-process S3 endpoint; use `.client()` for a boto3 client and `.store` to inspect it."""
+    with LocalS3Server() as server:
+        yield server
@@ -0,0 +1,157 @@
+import asyncio
+import datetime
+import decimal
+import threading
+
+import pytest
+
+from src.glue_athena.athena import AthenaClient, run_query_df, run_sync
+
+COLUMNS = [
+    {"Name": "fire_year", "Type": "smallint"},
+    {"Name": "state", "Type": "varchar"},
+    {"Name": "fire_size", "Type": "double"},
+    {"Name": "discovery_date", "Type": "date"},
+    {"Name": "cost", "Type": "decimal", "Precision": 10, "Scale": 2},
+]
+
+
+def _row(values):
+    return {"Data": [{} if v is None else {"VarCharValue": v} for v in values]}
+
+
+class FakeAthena:
+    """Queries that report RUNNING for `polls` checks, then `final_state`, with `rows` served in pages."""
+
+    def __init__(self, rows=(), polls=0, final_state="SUCCEEDED", reused=False):
+        self.rows = list(rows)
+        self.reused = reused
+        self.polls = polls
+        self.final_state = final_state
+        self.checks = {}
+        self.started = []
+        self.stopped = []
+        self.result_calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def start_query_execution(self, QueryString, **kwargs):
+        with self._lock:
+            execution_id = f"q{len(self.started)}"
+            self.started.append((QueryString, kwargs))
+            self.checks[execution_id] = 0
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            return {"QueryExecutionId": execution_id}
+
+    def get_query_execution(self, QueryExecutionId):
+        with self._lock:
+            self.checks[QueryExecutionId] += 1
+            state = "RUNNING" if self.checks[QueryExecutionId] <= self.polls else self.final_state
+            if QueryExecutionId in self.stopped:
+                state = "CANCELLED"
+            if state != "RUNNING" and self.checks[QueryExecutionId] == self.polls + 1:
+                self.running -= 1
+            status = {"State": state}
+            if state == "FAILED":
+                status["StateChangeReason"] = "SYNTAX_ERROR: line 1:8"
+            return {"QueryExecution": {
+                "QueryExecutionId": QueryExecutionId, "Status": status, "StatementType": "DML",
+                "Statistics": {"DataScannedInBytes": 1000, "ResultReuseInformation": {"ReusedPreviousResult": self.reused}},
+            }}
+
+    def stop_query_execution(self, QueryExecutionId):
+        self.stopped.append(QueryExecutionId)
+
+    def get_query_results(self, QueryExecutionId, MaxResults, NextToken=None):
+        self.result_calls.append(NextToken)
+        # The header row takes a slot of the first page, as in Athena
+        rows = [_row([c["Name"] for c in COLUMNS])] + [_row(r) for r in self.rows]
+        start = int(NextToken or 0)
+        page = {"ResultSet": {"Rows": rows[start:start + MaxResults], "ResultSetMetadata": {"ColumnInfo": COLUMNS}}}
+        if start + MaxResults < len(rows):
+            page["NextToken"] = str(start + MaxResults)
+        return page
+
+
+def _client(athena, **kwargs):
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    client = AthenaClient(athena, output_location="s3://results/", sleep=sleep, **kwargs)
+    return client, sleeps
+
+
+def test_pages_through_every_row_with_types():
+    rows = [[str(2000 + i % 20), "CA" if i % 2 else None, f"{i}.5", "2020-06-01", "12.30"] for i in range(2500)]
+    athena = FakeAthena(rows)
+    client, _ = _client(athena)
+
+    df = run_query_df("SELECT * FROM fpa_fpa_fod", "wildfire_fpa_fod_db", client=client)
+
+    assert len(df) == 2500
+    assert athena.result_calls == [None, "1000", "2000"]
+    assert athena.started[0][1]["QueryExecutionContext"] == {"Database": "wildfire_fpa_fod_db"}
+    assert str(df["fire_year"].dtype) == "int16"
+    assert df["fire_size"].iloc[3] == 3.5
+    assert df["state"].isna().sum() == 1250 and df["state"].iloc[1] == "CA"
+    assert df["discovery_date"].iloc[0] == datetime.date(2020, 6, 1)
+    assert df["cost"].iloc[0] == decimal.Decimal("12.30")
+
+
+def test_empty_result_keeps_its_columns():
+    client, _ = _client(FakeAthena())
+    table = run_sync(client.query("SELECT * FROM t WHERE false"))
+    assert table.num_rows == 0
+    assert table.column_names == [c["Name"] for c in COLUMNS]
+
+
+def test_polls_back_off():
+    client, sleeps = _client(FakeAthena(polls=7), min_poll=0.25, max_poll=5)
+    run_sync(client.run("SELECT 1"))
+    assert sleeps == [0.25, 0.5, 1, 2, 4, 5, 5]
+
+
+def test_failed_query_raises_with_reason():
+    client, _ = _client(FakeAthena(final_state="FAILED"))
+    with pytest.raises(RuntimeError, match="SYNTAX_ERROR"):
+        run_sync(client.query("SELEC 1"))
+
+
+def test_timeout_cancels_the_query():
+    athena = FakeAthena(polls=100)
+    ticks = iter(range(1000))
+    client, _ = _client(athena, timeout=3, clock=lambda: next(ticks))
+
+    with pytest.raises(TimeoutError):
+        run_sync(client.run("SELECT * FROM huge"))
+    assert athena.stopped == ["q0"]
+
+
+def test_cancelled_task_stops_the_query():
+    athena = FakeAthena(polls=10_000)
+
+    async def main():
+        client = AthenaClient(athena, output_location="s3://results/", min_poll=0.01, max_poll=0.01)
+        task = asyncio.create_task(client.run("SELECT * FROM huge"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert athena.stopped == ["q0"]
+
+
+def test_queries_run_concurrently():
+    athena = FakeAthena(rows=[["2020", "CA", "1.0", "2020-01-01", "1.00"]], polls=3)
+    client = AthenaClient(athena, output_location="s3://results/", min_poll=0.01, max_poll=0.02, max_concurrent=8)
+
+    frames = run_sync(client.query_many({f"q{i}": "SELECT 1" for i in range(12)}))
+
+    assert sorted(frames) == sorted(f"q{i}" for i in range(12))
+    assert all(len(df) == 1 for df in frames.values())
+    assert 1 < athena.max_running <= 8
@@ -0,0 +1,56 @@
+import os
+
+from src.ingest.bulk_copy import copy_prefix
+
+MB = 1024 * 1024
+
+
+def _copies(local_s3):
+    return [op for op, _, _ in local_s3.store.requests if op in ("CopyObject", "UploadPartCopy")]
+
+
+def test_copies_concurrently_then_skips_unchanged(local_s3):
+    s3 = local_s3.client()
+    small = {f"2020/{m:02d}/data/air_temperature_at_2_metres.nc": os.urandom(1000 + m) for m in range(1, 13)}
+    large = os.urandom(12 * MB)
+    for key, body in small.items():
+        s3.put_object(Bucket="era5", Key=key, Body=body)
+    s3.put_object(Bucket="era5", Key="2020/01/data/precipitation_amount_1hour_Accumulation.nc", Body=large)
+    s3.put_object(Bucket="era5", Key="2021/01/data/air_temperature_at_2_metres.nc", Body=b"other year")
+
+    stats = copy_prefix("era5", "2020/", "raw", lambda key: f"era5/{key}", s3=s3, max_workers=8, part_size=5 * MB)
+
+    assert (stats["objects"], stats["copied"], stats["skipped"], stats["failed"]) == (13, 13, 0, 0)
+    assert stats["bytes"] == sum(map(len, small.values())) + len(large)
+    for key, body in small.items():
+        assert local_s3.store.body("raw", f"era5/{key}") == body
+    assert local_s3.store.body("raw", "era5/2020/01/data/precipitation_amount_1hour_Accumulation.nc") == large
+    assert _copies(local_s3).count("UploadPartCopy") == 3
+    assert ("raw", "era5/2021/01/data/air_temperature_at_2_metres.nc") not in local_s3.store.objects
+
+    # Same size and ETag (or source ETag, for the multipart copy): nothing is copied again
+    copies = len(_copies(local_s3))
+    s3.put_object(Bucket="era5", Key="2020/02/data/air_temperature_at_2_metres.nc", Body=b"changed")
+    stats = copy_prefix("era5", "2020/", "raw", lambda key: f"era5/{key}", s3=s3, part_size=5 * MB)
+
+    assert (stats["copied"], stats["skipped"]) == (1, 12)
+    assert _copies(local_s3)[copies:] == ["CopyObject"]
+    assert local_s3.store.body("raw", "era5/2020/02/data/air_temperature_at_2_metres.nc") == b"changed"
+
+
+def test_multipart_source_under_part_size_is_not_recopied(local_s3, tmp_path):
+    from boto3.s3.transfer import TransferConfig
+
+    s3 = local_s3.client()
+    path = tmp_path / "wind.nc"
+    path.write_bytes(os.urandom(6 * MB))
+    s3.upload_file(str(path), "era5", "2020/01/data/wind.nc", Config=TransferConfig(multipart_threshold=5 * MB))
+    assert "-" in s3.head_object(Bucket="era5", Key="2020/01/data/wind.nc")["ETag"]
+
+    first = copy_prefix("era5", "2020/", "raw", s3=s3, part_size=64 * MB)
+    copies = len(_copies(local_s3))
+    second = copy_prefix("era5", "2020/", "raw", s3=s3, part_size=64 * MB)
+
+    assert (first["copied"], second["copied"], second["skipped"]) == (1, 0, 1)
+    assert _copies(local_s3)[copies - 1:] == ["CopyObject"]
+    assert local_s3.store.body("raw", "2020/01/data/wind.nc") == path.read_bytes()
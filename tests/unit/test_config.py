@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.profile_cli_imports import ENTRY_POINTS, PROJECT_ROOT, entry_point_times
+from scripts.profile_lambda_imports import import_times
+from src.config import Settings
+
+
+def _outputs(tmp_path, **values):
+    path = tmp_path / "cdk_outputs.json"
+    path.write_text(json.dumps({"WildfireRiskAnalyticsStack": values}))
+    return path
+
+
+def test_import_has_no_side_effects():
+    times = import_times("import src.config; src.config.REGION", cwd=PROJECT_ROOT)
+
+    assert "boto3" not in times
+    assert "src.config" in times
+
+
+def test_entry_points_import_without_cdk_outputs(monkeypatch):
+    # Nothing may be resolved at import, so a clean checkout (no cdk_outputs.json) imports fine
+    for name in ("RAW_BUCKET", "PROCESSED_BUCKET", "FPA_FOD_CRAWLER_NAME", "NCLIMDIV_CRAWLER_NAME", "WRC_CRAWLER_NAME"):
+        monkeypatch.delenv(name, raising=False)
+    if (Path(PROJECT_ROOT) / "cdk_outputs.json").exists():
+        pytest.skip("a deployed checkout has cdk_outputs.json")
+
+    results = entry_point_times(repeat=1)
+
+    assert list(results) == list(ENTRY_POINTS)
+    assert not [module for module, r in results.items() if r["boto3"]]
+
+
+def test_settings_resolve_lazily_and_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("RAW_BUCKET", raising=False)
+    path = _outputs(tmp_path, RawBucketName="raw", ProcessedBucketName="processed")
+    settings = Settings(path)
+
+    assert "cdk_outputs" not in vars(settings)
+    assert settings.raw_bucket == "raw"
+    assert settings.athena_output_location == "s3://processed/athena-results/"
+
+    path.unlink()
+    assert settings.processed_bucket == "processed"
+
+
+def test_environment_overrides_cdk_outputs(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAW_BUCKET", "from-env")
+    settings = Settings(tmp_path / "missing.json")
+
+    assert settings.raw_bucket == "from-env"
+    with pytest.raises(FileNotFoundError):
+        settings.processed_bucket
+
+
+def test_clients_share_one_session(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
+    settings = Settings(tmp_path / "missing.json")
+
+    glue = settings.client("glue")
+
+    assert settings.client("glue") is glue
+    assert glue.meta.region_name == "us-west-2"
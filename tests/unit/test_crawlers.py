@@ -0,0 +1,111 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from src.config import settings
+from src.orchestrator.crawlers import run_crawlers
+
+
+class FakeGlue:
+    """Crawlers that report RUNNING for a number of polls, then READY with a LastCrawl status."""
+
+    def __init__(self, polls_until_done, statuses=None, already_running=()):
+        self.remaining = dict(polls_until_done)
+        self.statuses = statuses or {}
+        self.already_running = set(already_running)
+        self.started = []
+        self.batch_calls = []
+
+    def start_crawler(self, Name):
+        if Name in self.already_running:
+            raise ClientError({"Error": {"Code": "CrawlerRunningException"}}, "StartCrawler")
+        self.started.append(Name)
+
+    def batch_get_crawlers(self, CrawlerNames):
+        self.batch_calls.append(list(CrawlerNames))
+        result = []
+        for name in CrawlerNames:
+            if name not in self.started and name not in self.already_running:
+                result.append({"Name": name, "State": "READY"})
+                continue
+            self.remaining[name] -= 1
+            crawler = {"Name": name, "DatabaseName": f"{name}_db", "State": "RUNNING"}
+            if self.remaining[name] < 0:
+                crawler.update(State="READY", LastCrawl={"Status": self.statuses.get(name, "SUCCEEDED")})
+            result.append(crawler)
+        return {"Crawlers": result}
+
+    def get_crawler_metrics(self, CrawlerNameList):
+        return {"CrawlerMetricsList": [
+            {"CrawlerName": name, "TablesCreated": 1, "TablesUpdated": 2, "TablesDeleted": 0}
+            for name in CrawlerNameList
+        ]}
+
+
+class FakeCatalog:
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate(self, database_name=None):
+        self.invalidated.append(database_name)
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    catalog = FakeCatalog()
+    monkeypatch.setitem(vars(settings), "catalog", catalog)
+    return catalog
+
+
+def test_crawlers_run_concurrently_with_one_batched_poll(catalog):
+    glue = FakeGlue({"a": 1, "b": 3, "c": 0})
+    sleeps = []
+
+    results = run_crawlers(["a", "b", "c"], glue=glue, sleep=sleeps.append, clock=lambda: 0.0)
+
+    assert glue.started == ["a", "b", "c"]
+    # Everything is polled together; finished crawlers drop out of the batch
+    assert glue.batch_calls == [["a", "b", "c"], ["a", "b", "c"], ["a", "b"], ["b"], ["b"]]
+    assert {name: r["status"] for name, r in results.items()} == {"a": "SUCCEEDED", "b": "SUCCEEDED", "c": "SUCCEEDED"}
+    assert results["b"]["tables_updated"] == 2
+    assert sorted(catalog.invalidated) == ["a_db", "b_db", "c_db"]
+    assert len(sleeps) == 4
+
+
+def test_polling_backs_off_while_nothing_changes(catalog):
+    glue = FakeGlue({"slow": 6})
+    sleeps = []
+
+    run_crawlers(["slow"], glue=glue, min_poll=2, max_poll=5, sleep=sleeps.append, clock=lambda: 0.0)
+
+    assert sleeps == [2, 2, 3.0, 4.5, 5, 5, 5]
+
+
+def test_failures_and_running_crawlers_are_reported(catalog):
+    glue = FakeGlue({"a": 0, "b": 0}, statuses={"b": "FAILED"}, already_running={"a"})
+
+    results = run_crawlers(["a", "b"], glue=glue, sleep=lambda s: None, clock=lambda: 0.0)
+
+    assert glue.started == ["b"]
+    assert results["a"]["status"] == "SUCCEEDED"
+    assert results["b"]["status"] == "FAILED"
+
+
+def test_crawl_finished_between_polls_is_noticed(catalog):
+    # Started, ran and finished before the first poll: never seen RUNNING
+    glue = FakeGlue({"fast": -1})
+
+    results = run_crawlers(["fast"], glue=glue, sleep=lambda s: None, clock=lambda: 0.0)
+
+    assert results["fast"]["status"] == "SUCCEEDED"
+    assert len(glue.batch_calls) == 2
+
+
+def test_gives_up_after_timeout(catalog):
+    glue = FakeGlue({"stuck": 10**6})
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    with pytest.raises(TimeoutError, match="stuck"):
+        run_crawlers(["stuck"], glue=glue, timeout=60, sleep=sleep, clock=lambda: now[0])
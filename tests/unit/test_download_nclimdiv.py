@@ -0,0 +1,121 @@
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault("RAW_BUCKET", "test-raw-bucket")
+
+from infra.lambdas.download_nclimdiv_data import lambda_function, noaa_listing  # noqa: E402
+
+# The smallest part size S3 (and boto3) allows, so test files span several parts
+PART_SIZE = 5 * 1024 * 1024
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def noaa_server(tmp_path, monkeypatch):
+    files = {
+        f"{prefix}-v1.0.0-20250306": os.urandom(PART_SIZE + 300_000 + i) for i, prefix in enumerate(lambda_function.FILE_PREFIXES)
+    }
+    for name, body in files.items():
+        (tmp_path / name).write_bytes(body)
+    links = "".join(f'<a href="{name}">{name}</a>' for name in files)
+    (tmp_path / "index.html").write_text(f'<html><body><a href="readme.txt">readme</a>{links}</body></html>')
+
+    handler = partial(QuietHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(lambda_function, "base_url", f"http://127.0.0.1:{server.server_port}/")
+    noaa_listing.clear_cache()
+    yield tmp_path, files
+    server.shutdown()
+
+
+@pytest.fixture
+def s3(local_s3, monkeypatch):
+    """The handler's real boto3 upload path (TransferConfig, multipart) against a local S3."""
+    monkeypatch.setattr(lambda_function, "s3", local_s3.client())
+    monkeypatch.setattr(lambda_function, "CHUNK_SIZE", PART_SIZE)
+    monkeypatch.setattr(lambda_function, "transfer_config", None)
+    return local_s3.store
+
+
+def test_streams_every_file_into_s3_in_parts(noaa_server, s3):
+    result = lambda_function.lambda_handler({}, None)
+
+    assert len(result["transfers"]) == 5
+    for prefix in lambda_function.FILE_PREFIXES:
+        body = noaa_server[1][f"{prefix}-v1.0.0-20250306"]
+        key = f"nclimdiv-county/{prefix}/{prefix}.dat"
+        assert s3.body(lambda_function.bucket, key) == body
+        # Larger than one part, so each file went up as a two-part multipart upload
+        assert [op for op, k, _ in s3.requests if k == key and op == "UploadPart"] == ["UploadPart"] * 2
+        assert s3.objects[(lambda_function.bucket, key)]["etag"].endswith('-2"')
+    assert all(t["bytes"] == len(s3.body(lambda_function.bucket, t["s3_key"])) for t in result["transfers"])
+    assert all(t["bytes_per_second"] > 0 for t in result["transfers"])
+
+    config = lambda_function.get_transfer_config()
+    assert config.max_in_memory_upload_chunks == lambda_function.UPLOAD_CONCURRENCY + 1
+
+
+def test_unchanged_files_are_skipped(noaa_server, s3):
+    root, files = noaa_server
+    lambda_function.lambda_handler({}, None)
+
+    # Same versioned names: the conditional GET comes back 304 Not Modified
+    second = lambda_function.lambda_handler({}, None)
+    assert second["files_uploaded"] == [] and second["uploaded_keys"] == []
+    assert len(second["files_skipped"]) == 5
+
+    # NOAA publishes a new tmax release
+    new_name = "climdiv-tmaxcy-v1.0.0-20250406"
+    (root / new_name).write_bytes(b"new release")
+    index = (root / "index.html").read_text().replace("climdiv-tmaxcy-v1.0.0-20250306", new_name)
+    (root / "index.html").write_text(index)
+
+    noaa_listing.clear_cache()
+    third = lambda_function.lambda_handler({}, None)
+    key = "nclimdiv-county/climdiv-tmaxcy/climdiv-tmaxcy.dat"
+    assert third["uploaded_keys"] == [key]
+    assert s3.body(lambda_function.bucket, key) == b"new release"
+    assert s3.objects[(lambda_function.bucket, key)]["metadata"]["source-filename"] == new_name
+
+
+def test_listing_picks_newest_version_and_is_cached(monkeypatch):
+    html = """
+    <a href="climdiv-tmaxcy-v1.0.0-20250406">new</a>
+    <A HREF='climdiv-tmaxcy-v1.0.0-20250306'>old, listed last</A>
+    <a href="climdiv-tmaxcy-v1.0.0-20250406.txt">notes</a>
+    <a class="x" href="climdiv-pcpncy-v1.0.10-20250306">v1.0.10</a>
+    <a href="climdiv-pcpncy-v1.0.9-20250401">v1.0.9</a>
+    """
+    calls = []
+
+    class Index:
+        text = html
+
+        def raise_for_status(self):
+            pass
+
+    class Http:
+        def get(self, url, timeout):
+            calls.append(url)
+            return Index()
+
+    noaa_listing.clear_cache()
+    args = (Http(), "https://noaa.test/climdiv/", ["climdiv-tmaxcy", "climdiv-pcpncy"], (".txt",))
+    urls = noaa_listing.get_listing(*args, ttl=60)
+
+    assert urls == {
+        "climdiv-tmaxcy": "https://noaa.test/climdiv/climdiv-tmaxcy-v1.0.0-20250406",
+        "climdiv-pcpncy": "https://noaa.test/climdiv/climdiv-pcpncy-v1.0.10-20250306",
+    }
+    assert noaa_listing.get_listing(*args, ttl=60) == urls
+    assert len(calls) == 1
@@ -0,0 +1,106 @@
+import io
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+import shapely
+import xarray as xr
+
+from src.config import settings
+from src.ingest.era5_county import (
+    AGGREGATES,
+    INPUT_VARIABLES,
+    CountyWeights,
+    county_aggregates,
+    hourly_fields,
+    open_era5,
+    reduce_era5_prefix,
+)
+
+LAT = np.array([40.0, 39.75, 39.5, 39.25])
+LON = np.array([250.0, 250.25, 250.5, 250.75, 251.0])
+
+
+def _era5_files(folder, start="2020-06-30T12:00", hours=60):
+    """One era5-pds style file per input variable, with a NaN hour in one cell."""
+    rng = np.random.default_rng(0)
+    time = pd.date_range(start, periods=hours, freq="h")
+    base = {"t2m": 295.0, "d2m": 280.0, "u10": 0.0, "v10": 0.0}
+    paths = []
+    for short, (name, _) in INPUT_VARIABLES.items():
+        values = (base[short] + rng.normal(0, 5, (hours, len(LAT), len(LON)))).astype(np.float32)
+        values[3, 1, 1] = np.nan
+        ds = xr.Dataset({name: (("time0", "lat", "lon"), values)}, coords={"time0": time, "lat": LAT, "lon": LON})
+        paths.append(str(folder / f"{name}.nc"))
+        ds.to_netcdf(paths[-1])
+    return paths
+
+
+def _counties():
+    # 06001 is exactly the cell at (39.75, 250.25); 06003 is two cells at 39.5 and half of a third
+    return gpd.GeoDataFrame(
+        {"GEOID": ["06001", "06003"]},
+        geometry=[shapely.box(-109.875, 39.625, -109.625, 39.875), shapely.box(-109.625, 39.375, -109.0, 39.625)],
+        crs="EPSG:4326",
+    )
+
+
+def test_weights_are_area_fractions(tmp_path):
+    weights = CountyWeights.build(LAT, LON, _counties())
+    weights.save(tmp_path / "weights.npz")
+    weights = CountyWeights.load(tmp_path / "weights.npz")
+
+    dense = weights.matrix.toarray()
+    assert list(weights.geoids) == ["06001", "06003"]
+    assert np.allclose(dense.sum(axis=1), 1)
+    assert np.count_nonzero(dense[0]) == 1 and dense[0].max() == pytest.approx(1)
+    assert sorted(np.round(dense[1][dense[1] > 0], 2)) == [0.2, 0.4, 0.4]
+    # Only the box of cells the counties touch is read
+    assert (weights.lat_slice, weights.lon_slice) == (slice(1, 3), slice(1, 5))
+
+
+@pytest.mark.parametrize("freq", ["daily", "monthly"])
+def test_chunked_reduction_matches_whole_array(tmp_path, freq):
+    weights = CountyWeights.build(LAT, LON, _counties())
+    with open_era5(_era5_files(tmp_path)) as ds:
+        result = county_aggregates(ds, weights, freq, chunk_hours=7)
+        box = ds.isel(lat=weights.lat_slice, lon=weights.lon_slice).load()
+
+    fields = hourly_fields({name: box[name].values.reshape(len(box["time"]), -1) for name in INPUT_VARIABLES})
+    periods = pd.DatetimeIndex(box["time"].values)
+    periods = periods.normalize() if freq == "daily" else periods.to_period("M").to_timestamp()
+    expected = {}
+    for period in periods.unique():
+        rows = np.asarray(periods == period)
+        for column, (field, how) in AGGREGATES.items():
+            reduce = {"max": np.nanmax, "min": np.nanmin, "mean": np.nanmean}[how]
+            expected[period, column] = weights.apply(reduce(fields[field][rows], axis=0))
+
+    assert len(result) == 2 * (3 if freq == "daily" else 2)
+    assert result["month"].tolist()[:2] == [6, 6] and result["year"].eq(2020).all()
+    for i, period in enumerate(periods.unique()):
+        part = result.iloc[2 * i:2 * i + 2]
+        for column in AGGREGATES:
+            assert np.allclose(part[column].to_numpy(), expected[period, column], rtol=1e-5)
+    assert (result["rh_min"] <= 100).all() and (result["wind_max"] >= result["wind_mean"]).all()
+
+
+def test_reduces_copied_files_into_county_partitions(tmp_path, local_s3, monkeypatch):
+    monkeypatch.setitem(vars(settings), "raw_bucket", "raw")
+    monkeypatch.setitem(vars(settings), "processed_bucket", "processed")
+    s3 = local_s3.client()
+    for path in _era5_files(tmp_path, start="2020-07-01T00:00", hours=48):
+        s3.upload_file(path, "raw", f"era5/2020/07/data/{path.rsplit('/', 1)[1]}")
+    s3.put_object(Bucket="raw", Key="era5/2020/07/data/sea_surface_temperature.nc", Body=b"not needed")
+    weights_path = str(tmp_path / "weights.npz")
+    CountyWeights.build(LAT, LON, _counties()).save(weights_path)
+
+    keys = reduce_era5_prefix("2020/", "daily", weights_path, s3=s3)
+
+    assert keys == ["era5/county_daily/year=2020/month=7/part-00000.parquet"]
+    assert ("GetObject", "era5/2020/07/data/sea_surface_temperature.nc", 0) not in local_s3.store.requests
+    table = pq.read_table(io.BytesIO(local_s3.store.body("processed", keys[0]))).to_pandas()
+    assert table.columns.tolist() == ["geoid", "date", *AGGREGATES]
+    assert len(table) == 4 and table["geoid"].tolist() == ["06001", "06003"] * 2
@@ -0,0 +1,74 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from src.data.fpa_fod_parquet import convert_csv_to_parquet, partition_keys
+
+HEADER = "FOD_ID,FPA_ID,FIRE_YEAR,DISCOVERY_DATE,DISCOVERY_DOY,FIRE_SIZE,FIRE_SIZE_CLASS,LATITUDE,LONGITUDE,STATE,FIPS_CODE"
+
+
+def _write_csv(path, n=300, fpa_id="FS-{i}"):
+    rows = [HEADER]
+    for i in range(n):
+        year = 2015 + i % 3
+        state = ("CA", "OR", "MT")[i % 3 if i % 7 else 0]
+        size = "" if i % 50 == 0 else f"{(i % 40) * 37.5}"
+        rows.append(f'{i + 1},"{fpa_id.format(i=i)}",{year}.0,1/{1 + i % 28}/{year},{1 + i % 365}.0,{size},B,{40 + i / 1000},{-120 - i / 1000},{state},06037')
+    path.write_text("\n".join(rows) + "\n")
+    return n
+
+
+def test_converts_to_typed_partitioned_parquet(tmp_path):
+    csv_path = tmp_path / "fpa_fod.csv"
+    n = _write_csv(csv_path)
+    out_dir = tmp_path / "parquet"
+
+    # A tiny block size forces the CSV through many streamed batches
+    files = convert_csv_to_parquet(str(csv_path), str(out_dir), block_size=4096)
+
+    assert all("fire_year=" in f and "/state=" in f for f in files)
+    assert len(files) == 5  # one file per fire_year/state pair in the fixture
+    table = ds.dataset(str(out_dir), format="parquet", partitioning="hive").to_table()
+    assert table.num_rows == n
+
+    schema = pq.read_schema(files[0])
+    assert schema.field("fod_id").type == pa.int64()
+    assert schema.field("discovery_doy").type == pa.int16()
+    assert schema.field("fire_size").type == pa.float64()
+    assert schema.field("latitude").type == pa.float64()
+    assert schema.field("fips_code").type == pa.string()
+    assert "fire_year" not in schema.names and "state" not in schema.names
+
+    sizes = table.column("fire_size").to_pylist()
+    assert sizes.count(None) == 6
+    assert sorted(set(table.column("fire_year").to_pylist())) == [2015, 2016, 2017]
+
+
+def test_quoted_newlines_across_block_boundaries(tmp_path):
+    csv_path = tmp_path / "fpa_fod.csv"
+    n = _write_csv(csv_path, n=200, fpa_id='FS-{i}\nline ""two""\n')
+    out_dir = tmp_path / "parquet"
+
+    # Blocks this small end inside nearly every quoted value
+    for block_size in (37, 64, 101):
+        convert_csv_to_parquet(str(csv_path), str(out_dir), block_size=block_size)
+        table = ds.dataset(str(out_dir), format="parquet", partitioning="hive").to_table().sort_by("fod_id")
+
+        assert table.num_rows == n
+        assert table.column("fpa_id")[7].as_py() == 'FS-7\nline "two"\n'
+
+
+def test_zstd_and_partition_keys(tmp_path):
+    csv_path = tmp_path / "fpa_fod.csv"
+    _write_csv(csv_path, n=30)
+    out_dir = tmp_path / "parquet"
+
+    files = convert_csv_to_parquet(str(csv_path), str(out_dir), compression="zstd")
+    keys = partition_keys(files, str(out_dir), "fpa-fod/")
+
+    assert pq.ParquetFile(files[0]).metadata.row_group(0).column(0).compression == "ZSTD"
+    assert all(k.startswith("fpa-fod/fire_year=") and k.endswith(".parquet") for k in keys.values())
+
+    with pytest.raises(ValueError):
+        convert_csv_to_parquet(str(csv_path), str(out_dir), compression="gzip2")
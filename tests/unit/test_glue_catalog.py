@@ -0,0 +1,93 @@
+from src.glue_athena.catalog import GlueCatalogCache
+
+
+class FakeGlue:
+    """Paginated get_databases/get_tables over an in-memory catalog, counting calls."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.calls = []
+
+    def get_paginator(self, operation):
+        glue = self
+
+        class Paginator:
+            def paginate(self, **kwargs):
+                glue.calls.append((operation, kwargs.get("DatabaseName")))
+                if operation == "get_databases":
+                    names = list(glue.catalog)
+                    # Two pages, like a real catalog with many databases
+                    yield {"DatabaseList": [{"Name": n} for n in names[:1]]}
+                    yield {"DatabaseList": [{"Name": n} for n in names[1:]]}
+                else:
+                    yield {"TableList": glue.catalog[kwargs["DatabaseName"]]}
+
+        return Paginator()
+
+
+def _table(name, columns, partitions=()):
+    return {
+        "Name": name,
+        "StorageDescriptor": {"Columns": [{"Name": c, "Type": "string"} for c in columns], "Location": f"s3://b/{name}/"},
+        "PartitionKeys": [{"Name": p, "Type": "string"} for p in partitions],
+    }
+
+
+def _glue():
+    return FakeGlue({
+        "wildfire_fpa_fod_db": [_table("fpa_fpa_fod", ["fod_id", "fire_size"], ["fire_year", "state"])],
+        "wildfire_nclimdiv_db": [_table("nclimdiv_merged", ["tavg"], ["year"]), _table("other", ["x"])],
+    })
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeated_lookups_cost_no_api_calls():
+    glue = _glue()
+    catalog = GlueCatalogCache(glue)
+
+    for _ in range(3):
+        db = catalog.database_name("wildfire_nclimdiv")
+        assert catalog.table_names(db, "nclimdiv_") == ["nclimdiv_merged"]
+    assert catalog.partition_keys("wildfire_fpa_fod_db", "fpa_fpa_fod") == [
+        {"name": "fire_year", "type": "string"}, {"name": "state", "type": "string"},
+    ]
+    assert [c["name"] for c in catalog.columns("wildfire_fpa_fod_db", "fpa_fpa_fod")] == ["fod_id", "fire_size"]
+
+    assert glue.calls == [
+        ("get_databases", None),
+        ("get_tables", "wildfire_nclimdiv_db"),
+        ("get_tables", "wildfire_fpa_fod_db"),
+    ]
+
+
+def test_ttl_and_invalidation():
+    glue, clock = _glue(), Clock()
+    catalog = GlueCatalogCache(glue, ttl=60, clock=clock)
+    catalog.table_names("wildfire_nclimdiv_db")
+
+    clock.now += 30
+    catalog.table_names("wildfire_nclimdiv_db")
+    assert len(glue.calls) == 1
+
+    clock.now += 31
+    catalog.table_names("wildfire_nclimdiv_db")
+    assert len(glue.calls) == 2
+
+    glue.catalog["wildfire_nclimdiv_db"].append(_table("nclimdiv_new", ["y"]))
+    catalog.invalidate("wildfire_nclimdiv_db")
+    assert "nclimdiv_new" in catalog.table_names("wildfire_nclimdiv_db")
+
+
+def test_disk_cache_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "cache" / "glue_catalog.json")
+    GlueCatalogCache(_glue(), path=path).table_names("wildfire_fpa_fod_db")
+
+    glue = _glue()
+    assert GlueCatalogCache(glue, path=path).table_names("wildfire_fpa_fod_db") == ["fpa_fpa_fod"]
+    assert glue.calls == []
@@ -0,0 +1,69 @@
+import pyarrow as pa
+import pytest
+
+from src.local.glue import LocalGlue
+from src.config import get_client, settings
+from src.data.upload_fpa_fod_parquet import upload_fpa_fod_parquet
+from src.glue_athena import partitions
+from src.glue_athena.catalog import GlueCatalogCache
+from src.orchestrator.pipeline import offline_stand_ins
+from tests.unit.test_fpa_fod_parquet import _write_csv
+
+SCHEMA = pa.schema([("fod_id", pa.int64()), ("fire_size", pa.float64()), ("cause", pa.dictionary(pa.int32(), pa.string()))])
+PARTITION_KEYS = [("fire_year", "smallint"), ("state", "string")]
+
+
+def _keys(years, states):
+    return [f"fpa-fod/fire_year={y}/state={s}/part-0.parquet" for y in years for s in states]
+
+
+def test_registers_table_and_partitions_in_batches(monkeypatch):
+    glue = LocalGlue()
+    monkeypatch.setitem(vars(settings), "catalog", GlueCatalogCache(glue))
+    states = [f"S{i:02d}" for i in range(50)]
+
+    first = partitions.register_parquet_dataset("db", "fpa", "bucket", "fpa-fod/", _keys(range(2000, 2005), states),
+                                                SCHEMA, PARTITION_KEYS, glue=glue)
+
+    assert first == {"table": "created", "created": 250, "existing": 0}
+    assert sorted(n for op, n in glue.requests if op == "batch_create_partition") == [50, 100, 100]
+    table = glue.tables["db", "fpa"]
+    assert [c["Type"] for c in table["StorageDescriptor"]["Columns"]] == ["bigint", "double", "string"]
+    assert table["StorageDescriptor"]["Location"] == "s3://bucket/fpa-fod/"
+    partition = glue.partitions["db", "fpa"][("2003", "S07")]
+    assert partition["StorageDescriptor"]["Location"] == "s3://bucket/fpa-fod/fire_year=2003/state=S07/"
+
+    # Re-registering known partitions is not an error, and no crawler is needed
+    second = partitions.register_parquet_dataset("db", "fpa", "bucket", "fpa-fod/", _keys(range(2004, 2006), states),
+                                                 SCHEMA, PARTITION_KEYS, glue=glue, crawler_name="fpa_fod_crawler")
+    assert second == {"table": "unchanged", "created": 50, "existing": 50}
+    assert glue.crawls == {}
+
+
+def test_other_partition_errors_raise():
+    glue = LocalGlue()
+    glue.batch_create_partition = lambda **kwargs: {"Errors": [{
+        "PartitionValues": ["2020"], "ErrorDetail": {"ErrorCode": "InternalServiceException", "ErrorMessage": "boom"},
+    }]}
+    with pytest.raises(RuntimeError, match="InternalServiceException"):
+        partitions.create_partitions(glue, "db", "t", "s3://b/p/", ["year"], [("2020",)], [])
+
+
+def test_fpa_fod_parquet_registers_without_crawler(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    _write_csv(tmp_path / "data" / "fpa_fod.csv")
+    monkeypatch.chdir(tmp_path)
+
+    with offline_stand_ins():
+        glue = get_client("glue")
+        upload_fpa_fod_parquet(raise_on_failure=True)
+
+        table = glue.tables["wildfire_fpa_fod_db", "fpa_fpa_fod"]
+        assert table["PartitionKeys"] == [{"Name": "fire_year", "Type": "smallint"}, {"Name": "state", "Type": "string"}]
+        assert len(glue.partitions["wildfire_fpa_fod_db", "fpa_fpa_fod"]) == 5
+        assert glue.crawls == {}
+
+        # A column the table does not know about is left to the crawler
+        table["StorageDescriptor"]["Columns"].pop()
+        upload_fpa_fod_parquet(raise_on_failure=True)
+        assert glue.crawls == {"fpa_fod_crawler": 1}
@@ -0,0 +1,25 @@
+from scripts.profile_lambda_imports import (
+    LAZY_MODULES,
+    PACKAGE_BUDGET_MB,
+    import_times,
+    package_size,
+)
+
+
+def test_cold_import_stays_lean():
+    # Which modules load is deterministic; wall-clock import time on a shared runner is not
+    times = import_times()
+
+    assert "lambda_function" in times
+    assert not [m for m in times if m.split(".")[0] in LAZY_MODULES + ("pandas", "numpy", "pyarrow")]
+
+
+def test_first_call_loads_clients():
+    times = import_times("import lambda_function; lambda_function.get_session()")
+
+    assert "requests" in times
+    assert "boto3" not in times
+
+
+def test_package_size_budget():
+    assert package_size() / (1024 * 1024) < PACKAGE_BUDGET_MB
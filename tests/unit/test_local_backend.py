@@ -0,0 +1,100 @@
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from scripts.convert_nclimdiv_manually import write_local_merged
+from scripts.nclimdiv_fixtures import make_synthetic_dat
+from src.config import FPA_FOD_SAMPLE_PATH, NCLIMDIV_MERGED_LOCAL_PATH, project_root
+from src.data.fpa_fod_parquet import convert_csv_to_parquet
+from src.glue_athena.analyses import ANALYSES, Plan, climate_trend, fire_size_stats, state_counts, top_causes
+from src.glue_athena.athena import run_sync
+from src.glue_athena.local_backend import LocalBackend
+from tests.unit.test_fpa_fod_parquet import _write_csv
+
+
+@pytest.fixture
+def backend(tmp_path):
+    csv_path = tmp_path / "fpa_fod.csv"
+    _write_csv(csv_path, n=600)
+    convert_csv_to_parquet(str(csv_path), str(tmp_path / "fpa_parquet"))
+
+    months = pd.DataFrame({"year": [1999, 2000, 2000, 2001, 2001], "month": [1, 1, 1, 2, 2],
+                           "tavg": [50.0, 40.0, 60.0, None, 55.0], "pdsi": [1.0, -1.0, 0.0, 2.0, 3.0]})
+    (tmp_path / "nclimdiv").mkdir()
+    pq.write_table(pa.Table.from_pandas(months, preserve_index=False), tmp_path / "nclimdiv" / "part.parquet")
+
+    backend = LocalBackend({"fpa_fpa_fod": "fpa_parquet", "nclimdiv_merged": "nclimdiv", "fpa_csv": "fpa_fod.csv"}, root=tmp_path)
+    expected = pd.read_csv(csv_path)
+    expected.columns = expected.columns.str.lower()
+    return backend, expected
+
+
+def test_plans_match_pandas(backend):
+    backend, fires = backend
+
+    states = run_sync(state_counts().run(backend)).to_pandas()
+    expected = fires["state"].value_counts()
+    assert dict(zip(states["state"], states["fire_count"])) == expected.to_dict()
+    assert list(states["fire_count"]) == sorted(expected, reverse=True)
+
+    stats = run_sync(fire_size_stats(min_size=1000).run(backend)).to_pylist()[0]
+    large = fires["fire_size"][fires["fire_size"] > 1000]
+    assert stats["total_records"] == len(large)
+    assert stats["max_fire_size"] == large.max() and stats["avg_fire_size"] == pytest.approx(large.mean())
+
+
+def test_filters_groups_and_orders(backend):
+    backend, _ = backend
+    trend = run_sync(climate_trend().run(backend)).to_pylist()
+    assert trend == [
+        {"year": 2000, "month": 1, "avg_tavg": 50.0, "avg_pdsi": -0.5},
+        {"year": 2001, "month": 2, "avg_tavg": 55.0, "avg_pdsi": 3.0},
+    ]
+
+    limited = Plan("fpa_csv", [("n", "count_all", None)], group_by=["fire_year"], where=[("state", "=", "CA")],
+                   order_by=[("fire_year", "ascending")], limit=2)
+    assert [row["fire_year"] for row in run_sync(backend.query(limited)).to_pylist()] == [2015.0, 2016.0]
+
+
+def test_same_plan_as_athena_sql():
+    assert top_causes(limit=5).to_sql() == (
+        'SELECT "nwcg_general_cause", COUNT(*) AS "count"\n'
+        'FROM "fpa_fpa_fod"\n'
+        "WHERE \"nwcg_general_cause\" IS NOT NULL AND \"nwcg_general_cause\" <> ''\n"
+        'GROUP BY "nwcg_general_cause"\n'
+        'ORDER BY "count" DESC\n'
+        "LIMIT 5"
+    )
+
+
+def test_default_tables_fall_back_to_bundled_and_local_files(tmp_path):
+    # A fresh checkout: only the notebooks' sample, plus the raw nClimDiv files merged locally
+    (tmp_path / "notebooks" / "eda" / "data").mkdir(parents=True)
+    os.symlink(project_root / FPA_FOD_SAMPLE_PATH, tmp_path / FPA_FOD_SAMPLE_PATH)
+    raw = []
+    for seed, prefix in enumerate(["climdiv-tmpccy", "climdiv-pdsicy"]):
+        raw.append(tmp_path / f"{prefix}-v1.0.0-20250306")
+        raw[-1].write_bytes(make_synthetic_dat(n_counties=5, n_years=2, first_year=2001, seed=seed))
+    write_local_merged([str(path) for path in raw], str(tmp_path / NCLIMDIV_MERGED_LOCAL_PATH))
+
+    backend = LocalBackend(root=tmp_path)
+    results = {name: run_sync(plan().run(backend)).to_pandas() for name, plan in ANALYSES.items()}
+
+    fires = pd.read_csv(project_root / FPA_FOD_SAMPLE_PATH)
+    assert results["state_counts"]["fire_count"].tolist() == fires["state"].value_counts().head(10).tolist()
+    assert results["fire_size_stats"]["total_records"][0] == (fires["fire_size"] > 1000).sum()
+    assert results["top_causes"]["count"].sum() == fires["nwcg_general_cause"].notna().sum()
+    assert results["cause_stats"]["total_fires"].sum() == (fires["fire_size"] > 1000).sum()
+    assert results["climate_trend"][["year", "month"]].values.tolist() == [[y, m] for y in (2001, 2002) for m in range(1, 13)]
+
+
+def test_sql_without_duckdb_says_what_to_install(backend, monkeypatch):
+    backend, _ = backend
+    monkeypatch.setitem(sys.modules, "duckdb", None)
+    with pytest.raises(RuntimeError, match="pip install duckdb"):
+        run_sync(backend.query('SELECT COUNT(*) FROM "fpa_csv"'))
+    assert run_sync(backend.query(state_counts(table="fpa_csv"))).num_rows > 0
@@ -0,0 +1,51 @@
+import hashlib
+import os
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+
+from src.local.s3 import FileS3Store, LocalS3Server
+from src.orchestrator.pipeline import offline_stand_ins
+
+MB = 1024 * 1024
+
+
+def test_file_store_round_trip_survives_restart(tmp_path):
+    payload = os.urandom(6 * MB)
+    source = tmp_path / "big.bin"
+    source.write_bytes(payload)
+    root = tmp_path / "s3"
+
+    with LocalS3Server(store=FileS3Store(root)) as server:
+        s3 = server.client()
+        s3.put_object(Bucket="raw", Key="wrc-v2/wrc.csv", Body=b"a,b\n", Metadata={"sha256": "abc"})
+        s3.upload_file(str(source), "raw", "fpa-fod/fire_year=2020/part 0.parquet",
+                       Config=TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB))
+        s3.put_object(Bucket="raw", Key="odd/../key", Body=b"x")
+        s3.put_object(Bucket="raw", Key="gone.txt", Body=b"x")
+        s3.delete_object(Bucket="raw", Key="gone.txt")
+
+    assert (root / "raw" / "wrc-v2" / "wrc.csv").read_bytes() == b"a,b\n"
+    assert not (root / "raw" / "gone.txt").exists()
+    (root / "raw" / "wrc-v2" / "by_hand.csv").write_bytes(b"c\n")
+
+    with LocalS3Server(store=FileS3Store(root)) as server:
+        s3 = server.client()
+        pages = s3.get_paginator("list_objects_v2").paginate(Bucket="raw", PaginationConfig={"PageSize": 2})
+        keys = [obj["Key"] for page in pages for obj in page.get("Contents", [])]
+        assert keys == ["fpa-fod/fire_year=2020/part 0.parquet", "odd/../key", "wrc-v2/by_hand.csv", "wrc-v2/wrc.csv"]
+        assert s3.head_object(Bucket="raw", Key="wrc-v2/wrc.csv")["Metadata"] == {"sha256": "abc"}
+        assert s3.get_object(Bucket="raw", Key="fpa-fod/fire_year=2020/part 0.parquet")["Body"].read() == payload
+        assert s3.head_object(Bucket="raw", Key="wrc-v2/by_hand.csv")["ETag"] == '"%s"' % hashlib.md5(b"c\n").hexdigest()
+
+
+def test_plain_boto3_clients_reach_the_offline_store(tmp_path, monkeypatch):
+    monkeypatch.delenv("AWS_ENDPOINT_URL_S3", raising=False)
+
+    with offline_stand_ins(FileS3Store(tmp_path)) as server:
+        # As the Lambdas and copy_era5_to_s3 build their client
+        boto3.client("s3", region_name="us-east-1").put_object(Bucket="local-processed", Key="nclimdiv/tavg.csv", Body=b"t\n")
+        assert server.store.body("local-processed", "nclimdiv/tavg.csv") == b"t\n"
+
+    assert (tmp_path / "local-processed" / "nclimdiv" / "tavg.csv").read_bytes() == b"t\n"
+    assert "AWS_ENDPOINT_URL_S3" not in os.environ
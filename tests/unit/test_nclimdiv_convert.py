@@ -0,0 +1,127 @@
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from scripts import convert_nclimdiv_manually
+from scripts.nclimdiv_fixtures import make_synthetic_dat
+from src.config import settings
+
+# Listing (key) order, and the variable each file becomes
+RAW_FILES = {
+    "climdiv-pcpncy": "precipitation",
+    "climdiv-pdsicy": "pdsi",
+    "climdiv-tmaxcy": "tmax",
+    "climdiv-tmincy": "tmin",
+    "climdiv-tmpccy": "tavg",
+}
+
+
+@pytest.fixture
+def raw_files(local_s3):
+    s3 = local_s3.client()
+    for seed, prefix in enumerate(RAW_FILES):
+        body = make_synthetic_dat(n_counties=30, n_years=3, seed=seed)
+        s3.put_object(Bucket="raw", Key=f"nclimdiv-county/{prefix}/{prefix}.dat", Body=body)
+    return s3
+
+
+def _processed(local_s3):
+    return {key: obj["body"] for (bucket, key), obj in local_s3.store.objects.items() if bucket == "processed"}
+
+
+@pytest.fixture
+def manual(raw_files, monkeypatch):
+    monkeypatch.setattr(convert_nclimdiv_manually, "get_client", lambda service: raw_files)
+    monkeypatch.setitem(vars(settings), "raw_bucket", "raw")
+    monkeypatch.setitem(vars(settings), "processed_bucket", "processed")
+
+    # Files listed later finish first, so completion order is the reverse of listing order
+    load_variable = convert_nclimdiv_manually.load_variable
+    finished = []
+    lock = threading.Lock()
+
+    def slow_load_variable(key):
+        position = list(RAW_FILES).index(key.split("/")[1])
+        time.sleep(0.05 * (len(RAW_FILES) - position))
+        result = load_variable(key)
+        with lock:
+            finished.append(result[0])
+        return result
+
+    monkeypatch.setattr(convert_nclimdiv_manually, "load_variable", slow_load_variable)
+    return finished
+
+
+def test_concurrent_merge_keeps_listing_order(manual, local_s3):
+    convert_nclimdiv_manually.convert_and_merge_all("csv", workers=1, executor="thread")
+    serial = _processed(local_s3)["nclimdiv/nclimdiv_merged.csv"]
+
+    manual.clear()
+    convert_nclimdiv_manually.convert_and_merge_all("csv", workers=5, executor="thread")
+    concurrent = _processed(local_s3)["nclimdiv/nclimdiv_merged.csv"]
+
+    assert manual == list(reversed(RAW_FILES.values()))
+    header = concurrent.split(b"\n", 1)[0].decode().split(",")
+    assert header == ["state_code", "county_fips", "year", "month", *RAW_FILES.values()]
+    assert concurrent == serial
+
+
+def test_listing_past_the_first_page(manual, local_s3):
+    # 1,000 other objects sort ahead of the .dat files, pushing them onto the second listing page
+    for i in range(1000):
+        local_s3.store.put("raw", f"nclimdiv-county/00-readme-{i:04d}.txt", {"body": b"", "etag": '"x"', "metadata": {}, "checksums": {}})
+
+    convert_nclimdiv_manually.convert_and_merge_all("csv", workers=5, executor="thread")
+
+    header = _processed(local_s3)["nclimdiv/nclimdiv_merged.csv"].split(b"\n", 1)[0].decode().split(",")
+    assert header[4:] == list(RAW_FILES.values())
+
+
+@pytest.fixture
+def handler(raw_files, monkeypatch):
+    # The Lambda reads its buckets from the environment at import
+    monkeypatch.setenv("RAW_BUCKET", "raw")
+    monkeypatch.setenv("PROCESSED_BUCKET", "processed")
+    lambda_function_csv = importlib.import_module("infra.lambdas.nclimdiv_convert_csv.lambda_function_csv")
+    monkeypatch.setattr(lambda_function_csv, "s3", raw_files)
+    monkeypatch.setattr(lambda_function_csv, "raw_bucket", "raw")
+    monkeypatch.setattr(lambda_function_csv, "processed_bucket", "processed")
+    monkeypatch.setattr(lambda_function_csv, "incremental", False)
+
+    def run(workers, output_format):
+        monkeypatch.setattr(lambda_function_csv, "max_workers", workers)
+        monkeypatch.setattr(lambda_function_csv, "worker_budget_mb", max(1, 64 // workers))
+        monkeypatch.setattr(lambda_function_csv, "output_format", output_format)
+        return lambda_function_csv.lambda_handler({}, None)
+
+    return run
+
+
+def test_lambda_converts_files_concurrently_with_serial_output(handler, local_s3):
+    handler(1, "csv")
+    serial = _processed(local_s3)
+    local_s3.store.objects = {k: v for k, v in local_s3.store.objects.items() if k[0] == "raw"}
+
+    handler(5, "csv")
+
+    assert _processed(local_s3) == serial
+    assert sorted(serial) == sorted(f"nclimdiv/{var}.csv" for var in RAW_FILES.values())
+
+    result = handler(5, "parquet")
+    assert list(result["partitions_written"]) == list(RAW_FILES.values())
+    assert set(result["partitions_written"].values()) == {3}
+
+
+def test_csv_mode_does_not_import_the_parquet_writer():
+    asset_dir = os.path.join(os.path.dirname(__file__), "..", "..", "infra", "lambdas", "nclimdiv_convert_csv")
+    env = dict(os.environ, RAW_BUCKET="raw", PROCESSED_BUCKET="processed", AWS_DEFAULT_REGION="us-east-1")
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, lambda_function_csv; print('nclimdiv_parquet' in sys.modules)"],
+        cwd=asset_dir, env=env, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,29 @@
+import numpy as np
+
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_merge import merge_wide
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import decode_records
+from scripts.nclimdiv_fixtures import chained_merge, synthetic_variables
+
+
+def test_matches_chained_outer_merges():
+    records_by_var = synthetic_variables(n_counties=60, n_years=4)
+
+    expected = chained_merge(records_by_var)
+    actual = merge_wide(records_by_var)
+
+    assert list(actual.columns) == list(expected.columns)
+    assert actual.to_csv(index=False) == expected.to_csv(index=False)
+
+
+def test_month_missing_everywhere_is_dropped():
+    line = "01001022000" + "   1.00" * 11 + " -99.99"
+    records_by_var = {
+        "tmax": decode_records(line.encode()),
+        "tmin": decode_records(line.replace("   1.00", "   2.00").encode()),
+    }
+
+    merged = merge_wide(records_by_var)
+
+    assert merged["month"].tolist() == list(range(1, 12))
+    assert merged["state_code"].iloc[0] == "01" and merged["county_fips"].iloc[0] == "001"
+    np.testing.assert_array_equal(merged["tmin"].to_numpy(), np.full(11, 2.0, dtype=np.float32))
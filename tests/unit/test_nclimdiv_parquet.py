@@ -0,0 +1,53 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_merge import merge_wide
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parquet import write_parquet_partitions
+from scripts.nclimdiv_fixtures import synthetic_variables
+
+
+def _bodies(local_s3):
+    return {key: obj["body"] for (_, key), obj in local_s3.store.objects.items()}
+
+
+def test_year_partitions_are_typed_and_complete(local_s3):
+    merged = merge_wide(synthetic_variables(n_counties=20, n_years=3))
+
+    keys = write_parquet_partitions(local_s3.client(), "processed", "nclimdiv/merged/", merged)
+
+    assert keys == [f"nclimdiv/merged/year={y}/part-00000.parquet" for y in (1991, 1992, 1993)]
+    objects = _bodies(local_s3)
+    table = pq.read_table(io.BytesIO(objects[keys[0]]))
+    assert "year" not in table.column_names
+    assert table.schema.field("month").type == pa.int8()
+    assert table.schema.field("tmax").type == pa.float32()
+    assert sum(pq.read_metadata(io.BytesIO(b)).num_rows for b in objects.values()) == len(merged)
+
+
+def test_optional_state_partition(local_s3):
+    merged = merge_wide(synthetic_variables(n_counties=150, n_years=1))
+
+    keys = write_parquet_partitions(local_s3.client(), "processed", "nclimdiv/merged", merged, ["year", "state_code"])
+
+    assert keys == ["nclimdiv/merged/year=1991/state_code=01/part-00000.parquet",
+                    "nclimdiv/merged/year=1991/state_code=02/part-00000.parquet"]
+    table = pq.read_table(io.BytesIO(local_s3.store.body("processed", keys[1])))
+    assert set(table.column("county_fips").to_pylist()) == {f"{1 + 2 * i:03d}" for i in range(50)}
+
+
+def test_incremental_rewrites_only_changed_years(local_s3):
+    records_by_var = synthetic_variables(n_counties=20, n_years=5)
+    s3 = local_s3.client()
+    fingerprints = {}
+
+    first = write_parquet_partitions(s3, "processed", "nclimdiv/merged", merge_wide(records_by_var), fingerprints=fingerprints)
+    assert len(first) == 5 and len(fingerprints) == 5
+
+    # A new release revises one value in the latest year
+    tmax = records_by_var["tmax"]
+    tmax.values[tmax.year == 1995, 0] += 1.0
+    second = write_parquet_partitions(s3, "processed", "nclimdiv/merged", merge_wide(records_by_var), fingerprints=fingerprints)
+
+    assert second == ["nclimdiv/merged/year=1995/part-00000.parquet"]
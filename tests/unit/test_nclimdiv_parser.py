@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import decode_records, parse_fixed_width
+from scripts.nclimdiv_fixtures import legacy_parse_fixed_width_lines, make_synthetic_dat
+
+
+def _line(state, county, year, values):
+    return f"{state}{county}02{year}" + "".join(v if isinstance(v, str) else f"{v:7.2f}" for v in values)
+
+
+def test_matches_legacy_parser():
+    buf = make_synthetic_dat(n_counties=40, n_years=5)
+
+    expected = legacy_parse_fixed_width_lines(buf.decode("utf-8").splitlines(), "tavg")
+    actual = parse_fixed_width(buf, "tavg")
+
+    assert actual.to_csv(index=False) == expected.to_csv(index=False)
+
+
+def test_typed_columns():
+    df = parse_fixed_width(make_synthetic_dat(n_counties=3, n_years=2), "tmax")
+
+    assert df["year"].dtype == np.int16
+    assert df["month"].dtype == np.int8
+    assert df["tmax"].dtype == np.float32
+
+
+def test_sentinels_blanks_and_ragged_lines():
+    lines = [
+        _line("01", "001", 2000, [1.5, -9.99, -99.99, "  -9999", 2.0] + [3.0] * 7),
+        "",
+        _line("01", "003", 2000, [4.0] * 12)[:-14],  # last two months trimmed
+        "0100502XXXX" + "   1.00" * 12,  # invalid year
+    ]
+    df = parse_fixed_width("\n".join(lines).encode(), "pcpn")
+
+    first = df[df["county_fips"] == "001"]
+    assert first["month"].tolist() == [1, 5, 6, 7, 8, 9, 10, 11, 12]
+    assert len(df[df["county_fips"] == "003"]) == 10
+    assert "005" not in set(df["county_fips"])
+
+
+def test_crlf_and_empty_input():
+    lf = make_synthetic_dat(n_counties=2, n_years=2)
+    crlf = lf.replace(b"\n", b"\r\n")
+
+    assert decode_records(crlf).year.tolist() == [1991, 1992, 1991, 1992]
+    pd.testing.assert_frame_equal(parse_fixed_width(crlf, "v"), parse_fixed_width(lf, "v"))
+    assert parse_fixed_width(b"", "tavg").empty
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from infra.lambdas.nclimdiv_convert_csv.nclimdiv_parser import (
+    concat_records,
+    decode_records,
+    iter_decode_records,
+)
+from infra.lambdas.nclimdiv_convert_csv.s3_stream import MIN_PART_SIZE, S3MultipartWriter
+from scripts.nclimdiv_fixtures import convert_peak_bytes, make_synthetic_dat
+
+
+@pytest.mark.parametrize("chunk_size", [1, 95, 96, 1000, 10 ** 6])
+def test_chunk_boundaries_do_not_change_records(chunk_size):
+    buf = make_synthetic_dat(n_counties=7, n_years=3)
+    chunks = (buf[i:i + chunk_size] for i in range(0, len(buf), chunk_size))
+
+    streamed = concat_records(iter_decode_records(chunks))
+    whole = decode_records(buf)
+
+    for streamed_column, whole_column in zip(streamed, whole):
+        np.testing.assert_array_equal(streamed_column, whole_column)
+
+
+def test_writer_splits_into_parts(local_s3):
+    payload = b"x" * (MIN_PART_SIZE * 2 + 10)
+
+    with S3MultipartWriter(local_s3.client(), "bucket", "big.csv") as writer:
+        for i in range(0, len(payload), 1_000_000):
+            writer.write(payload[i:i + 1_000_000])
+
+    assert local_s3.store.body("bucket", "big.csv") == payload
+    assert [size for op, _, size in local_s3.store.requests if op == "UploadPart"] == [MIN_PART_SIZE, MIN_PART_SIZE, 10]
+
+
+def test_small_output_uses_single_put_and_errors_abort(local_s3):
+    s3 = local_s3.client()
+    with S3MultipartWriter(s3, "bucket", "small.csv") as writer:
+        writer.write(b"a,b\n")
+    assert local_s3.store.body("bucket", "small.csv") == b"a,b\n"
+    assert [op for op, _, _ in local_s3.store.requests] == ["PutObject"]
+
+    with pytest.raises(RuntimeError):
+        with S3MultipartWriter(s3, "bucket", "broken.csv") as writer:
+            writer.write(b"x" * MIN_PART_SIZE)
+            raise RuntimeError("parse failed")
+    assert local_s3.store.uploads == {}
+    assert ("bucket", "broken.csv") not in local_s3.store.objects
+
+
+def test_streaming_peak_memory_stays_flat():
+    chunk_size = 256 * 1024
+    small = convert_peak_bytes(make_synthetic_dat(n_counties=200, n_years=10), chunk_size)
+    large = convert_peak_bytes(make_synthetic_dat(n_counties=1600, n_years=10), chunk_size)
+
+    assert large < small * 1.5
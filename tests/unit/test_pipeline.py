@@ -0,0 +1,139 @@
+import os
+import threading
+
+import pytest
+
+from src.config import get_client, settings
+from src.data.uploader import upload_files
+from src.local.s3 import FileS3Store
+from src.orchestrator.pipeline import Stage, check_graph, offline_stand_ins, offline_state_path, run_pipeline
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name, action=None):
+        def run():
+            with self._lock:
+                self.calls.append(name)
+            if action:
+                action()
+        return run
+
+
+def test_independent_stages_run_concurrently(tmp_path):
+    ran = Recorder()
+    # Both uploads must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [
+        Stage("deploy", ran("deploy")),
+        Stage("upload_wrc", ran("upload_wrc", barrier.wait), deps=["deploy"]),
+        Stage("convert_nclimdiv", ran("convert_nclimdiv", barrier.wait), deps=["deploy"]),
+        Stage("crawl", ran("crawl"), deps=["upload_wrc", "convert_nclimdiv"]),
+    ]
+
+    results = run_pipeline(stages, state_path=str(tmp_path / "state.json"))
+
+    assert ran.calls[0] == "deploy" and ran.calls[-1] == "crawl"
+    assert {name: r["status"] for name, r in results.items() if name != "total"} == dict.fromkeys(
+        ["deploy", "upload_wrc", "convert_nclimdiv", "crawl"], "ran"
+    )
+
+
+def test_unchanged_inputs_are_skipped_downstream_too(tmp_path):
+    source = tmp_path / "wrc.csv"
+    other = tmp_path / "fpa.csv"
+    source.write_text("a")
+    other.write_text("b")
+    state = str(tmp_path / "state.json")
+    ran = Recorder()
+    stages = [
+        Stage("upload_wrc", ran("upload_wrc"), inputs=[str(source)]),
+        Stage("crawl_wrc", ran("crawl_wrc"), deps=["upload_wrc"]),
+        Stage("upload_fpa", ran("upload_fpa"), inputs=[str(other)]),
+    ]
+
+    run_pipeline(stages, state_path=state)
+    second = run_pipeline(stages, state_path=state)
+    assert [second[name]["status"] for name in ("upload_wrc", "crawl_wrc", "upload_fpa")] == ["skipped"] * 3
+
+    source.write_text("changed")
+    ran.calls.clear()
+    third = run_pipeline(stages, state_path=state)
+    assert sorted(ran.calls) == ["crawl_wrc", "upload_wrc"]
+    assert third["upload_fpa"]["status"] == "skipped"
+
+    ran.calls.clear()
+    run_pipeline(stages, state_path=state, force=True)
+    assert sorted(ran.calls) == ["crawl_wrc", "upload_fpa", "upload_wrc"]
+
+
+def test_failure_blocks_dependents_only(tmp_path):
+    def boom():
+        raise RuntimeError("NoSuchBucket")
+
+    ran = Recorder()
+    state = str(tmp_path / "state.json")
+    stages = [
+        Stage("deploy", ran("deploy"), cloud=True),
+        Stage("upload_nclimdiv", boom, deps=["deploy"]),
+        Stage("convert_nclimdiv", ran("convert_nclimdiv"), deps=["upload_nclimdiv"]),
+        Stage("crawl_nclimdiv", ran("crawl_nclimdiv"), deps=["convert_nclimdiv"]),
+        Stage("upload_wrc", ran("upload_wrc"), deps=["deploy"]),
+    ]
+
+    results = run_pipeline(stages, state_path=state, offline=True)
+
+    assert results["deploy"]["status"] == "offline"
+    assert results["upload_nclimdiv"]["status"] == "failed"
+    assert "NoSuchBucket" in results["upload_nclimdiv"]["error"]
+    assert results["convert_nclimdiv"]["status"] == results["crawl_nclimdiv"]["status"] == "blocked"
+    assert ran.calls == ["upload_wrc"]
+
+    # Only successful stages are remembered, so the failed branch runs again next time
+    again = run_pipeline(stages, state_path=state, offline=True)
+    assert again["upload_wrc"]["status"] == "skipped"
+    assert again["upload_nclimdiv"]["status"] == "failed"
+
+
+def test_graph_errors():
+    with pytest.raises(ValueError, match="cycle"):
+        check_graph([Stage("a", None, deps=["b"]), Stage("b", None, deps=["a"])])
+    with pytest.raises(ValueError, match="unknown"):
+        check_graph([Stage("a", None, deps=["missing"])])
+
+
+def test_offline_stand_ins(tmp_path):
+    path = tmp_path / "wrc.csv"
+    path.write_bytes(os.urandom(1000))
+
+    with offline_stand_ins() as server:
+        stage = Stage("upload_wrc", lambda: upload_files({str(path): "wrc-v2/wrc.csv"}, settings.raw_bucket,
+                                                         manifest_path=None, raise_on_failure=True))
+        results = run_pipeline([stage], state_path=None)
+
+        assert results["upload_wrc"]["status"] == "ran"
+        assert server.store.body("local-raw", "wrc-v2/wrc.csv") == path.read_bytes()
+        assert get_client("glue").batch_get_crawlers(CrawlerNames=["wrc_crawler"])["Crawlers"][0]["State"] == "READY"
+
+    assert "raw_bucket" not in vars(settings) or vars(settings)["raw_bucket"] != "local-raw"
+
+
+@pytest.mark.parametrize("keep_objects", [False, True])
+def test_offline_runs_skip_only_what_the_store_still_holds(tmp_path, keep_objects):
+    path = tmp_path / "wrc.csv"
+    path.write_bytes(os.urandom(1000))
+    s3_dir = str(tmp_path / "s3") if keep_objects else None
+
+    statuses = []
+    for _ in range(2):
+        with offline_stand_ins(FileS3Store(s3_dir) if s3_dir else None) as server:
+            stage = Stage("upload_wrc", lambda: upload_files({str(path): "wrc-v2/wrc.csv"}, settings.raw_bucket,
+                                                             manifest_path=None, raise_on_failure=True),
+                          inputs=[str(path)])
+            statuses.append(run_pipeline([stage], offline_state_path(s3_dir), offline=True)["upload_wrc"]["status"])
+            assert server.store.body("local-raw", "wrc-v2/wrc.csv") == path.read_bytes()
+
+    assert statuses == (["ran", "skipped"] if keep_objects else ["ran", "ran"])
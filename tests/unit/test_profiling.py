@@ -0,0 +1,74 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from src.config import settings
+from src.glue_athena.profiling import profile_athena, profile_sql, profile_table
+
+COLUMNS = [
+    {"name": "fod_id", "type": "bigint"},
+    {"name": "fire_size", "type": "double"},
+    {"name": "fire-name", "type": "string"},
+    {"name": "tags", "type": "array<string>"},
+]
+
+
+class FakeCatalog:
+    def columns(self, database, table):
+        return COLUMNS
+
+    def partition_keys(self, database, table):
+        return [{"name": "fire_year", "type": "smallint"}]
+
+
+class FakeClient:
+    def __init__(self, row):
+        self.row = row
+        self.queries = []
+
+    async def query(self, sql, database=None, timeout=None):
+        self.queries.append((sql, database))
+        return pa.Table.from_pylist([self.row])
+
+
+def test_one_query_covers_every_column():
+    sql = profile_sql("fpa_fpa_fod", COLUMNS)
+
+    assert sql.count("SELECT") == 1 and sql.count("FROM") == 1
+    assert 'COUNT(*) - COUNT("fire-name") AS c2_nulls' in sql
+    assert "approx_percentile(CAST(\"fire_size\" AS DOUBLE), 0.5) AS c1_p50" in sql
+    assert "c2_p50" not in sql and "c3_min" not in sql  # no percentiles for text, no min/max for arrays
+
+
+def test_profile_athena_reshapes_the_single_row(monkeypatch):
+    monkeypatch.setitem(vars(settings), "catalog", FakeCatalog())
+    client = FakeClient({
+        "row_count": 200,
+        "c0_nulls": 0, "c0_distinct": 200, "c0_min": "1", "c0_max": "200", "c0_p25": 50.0, "c0_p50": 100.0, "c0_p75": 150.0,
+        "c1_nulls": 50, "c1_distinct": 40, "c1_min": "0.1", "c1_max": "9000.0", "c1_p25": 1.0, "c1_p50": 5.0, "c1_p75": 20.0,
+    })
+
+    report = profile_athena("wildfire_fpa_fod_db", "fpa_fpa_fod", client=client, columns=["fod_id", "fire_size", "missing"])
+
+    assert len(client.queries) == 1
+    assert list(report["column"]) == ["fire_size", "fod_id"]  # most nulls first
+    fire_size = report.iloc[0]
+    assert fire_size["null_count"] == 50 and fire_size["null_fraction"] == 0.25
+    assert fire_size["distinct_estimate"] == 40 and fire_size["max"] == "9000.0" and fire_size["p50"] == 5.0
+
+
+def test_local_profile_in_one_pass(tmp_path):
+    path = tmp_path / "fpa.parquet"
+    pq.write_table(pa.table({
+        "fire_size": [1.0, 2.0, None, 4.0, 5.0],
+        "state": ["CA", "CA", None, None, "OR"],
+        "cause": pa.array(["Arson", "Debris", "Arson", None, "Arson"]).dictionary_encode(),
+    }), path)
+
+    report = profile_table(ds.dataset(str(path))).set_index("column")
+
+    assert report.loc["state", "null_count"] == 2 and report.loc["state", "distinct_estimate"] == 2
+    assert report.loc["fire_size", "min"] == "1.0" and report.loc["fire_size", "max"] == "5.0"
+    assert report.loc["fire_size", "p50"] == pytest.approx(3.0, abs=1.0)
+    assert report.loc["cause", "distinct_estimate"] == 2 and report.loc["cause", "null_fraction"] == 0.2
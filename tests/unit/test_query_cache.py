@@ -0,0 +1,82 @@
+import pyarrow as pa
+import pytest
+
+from src.local.glue import LocalGlue
+from src.glue_athena.athena import AthenaClient, run_sync
+from src.glue_athena.partitions import touch_table
+from src.glue_athena.query_cache import QueryResultCache, cacheable, normalize_sql, referenced_tables
+from tests.unit.test_athena import FakeAthena
+
+ROWS = [["2020", "CA", "1.5", "2020-01-01", "1.00"]] * 10
+
+
+@pytest.fixture
+def glue():
+    glue = LocalGlue()
+    glue.create_table(DatabaseName="wildfire_fpa_fod_db", TableInput={"Name": "fpa_fpa_fod", "Parameters": {}})
+    return glue
+
+
+def test_normalized_sql_and_tables():
+    assert normalize_sql("SELECT  *\n FROM \"FPA_FPA_FOD\" -- preview\n WHERE state = 'CA';") == \
+        normalize_sql("select * from \"fpa_fpa_fod\" where state = 'CA'")
+    assert normalize_sql("SELECT 'CA'") != normalize_sql("SELECT 'ca'")
+    assert referenced_tables('SELECT * FROM "fpa_fpa_fod" f JOIN wildfire_wrc_db.wrc_wrc_v2 w ON f.x = w.x', "fpa_db") == [
+        ("fpa_db", "fpa_fpa_fod"), ("wildfire_wrc_db", "wrc_wrc_v2"),
+    ]
+    assert not cacheable("SELECT * FROM t WHERE d < current_date")
+    assert not cacheable("CREATE OR REPLACE VIEW v AS SELECT 1")
+    assert cacheable("SELECT * FROM t WHERE note = 'rand(1)'")
+
+
+def test_repeated_query_is_served_locally_until_the_table_changes(tmp_path, glue):
+    athena = FakeAthena(ROWS)
+    client = AthenaClient(athena, output_location="s3://results/", cache=QueryResultCache(tmp_path, glue=glue))
+    query = 'SELECT * FROM "fpa_fpa_fod"'
+
+    first = run_sync(client.query(query, "wildfire_fpa_fod_db"))
+    again = run_sync(client.query(" select *  from \"fpa_fpa_fod\";", "wildfire_fpa_fod_db"))
+
+    assert len(athena.started) == 1
+    assert again.equals(first)
+    assert client.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "bytes_saved": 1000, "server_reuses": 0}
+
+    # New partitions move the table's UpdateTime, so the old result no longer matches
+    touch_table(glue, "wildfire_fpa_fod_db", "fpa_fpa_fod")
+    run_sync(client.query(query, "wildfire_fpa_fod_db"))
+    assert len(athena.started) == 2
+
+
+def test_least_recently_used_results_are_evicted(tmp_path, glue):
+    cache = QueryResultCache(tmp_path, glue=glue)
+    table = pa.table({"x": list(range(1000))})
+    for key in ("a", "b", "c"):
+        cache.put(key, table)
+    size = (tmp_path / "a.parquet").stat().st_size
+
+    cache.get("a")
+    cache.max_bytes = 2 * size + 100
+    cache.put("d", table)
+
+    assert sorted(p.stem for p in tmp_path.glob("*.parquet")) == ["a", "d"]
+
+
+def test_entries_expire(tmp_path, glue):
+    now = [0.0]
+    cache = QueryResultCache(tmp_path, max_age=60, glue=glue, clock=lambda: now[0])
+    cache.put("k", pa.table({"x": [1]}))
+    assert cache.get("k") is not None
+    now[0] = 61
+    assert cache.get("k") is None
+
+
+def test_server_side_reuse(tmp_path):
+    athena = FakeAthena(ROWS, reused=True)
+    client = AthenaClient(athena, output_location="s3://results/", reuse_minutes=60)
+
+    run_sync(client.query("SELECT * FROM t"))
+
+    assert athena.started[0][1]["ResultReuseConfiguration"] == {
+        "ResultReuseByAgeConfiguration": {"Enabled": True, "MaxAgeInMinutes": 60}
+    }
+    assert client.stats() == {"server_reuses": 1}
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from src.data import uploader
+from src.data.uploader import MAX_PARTS, MB, transfer_config_for, upload_files
+
+
+def test_chunk_size_scales_with_file_size():
+    assert transfer_config_for(100 * MB).multipart_chunksize == 8 * MB
+    assert transfer_config_for(3000 * MB).multipart_chunksize == 64 * MB
+
+    huge = 2000 * 1024 * MB
+    config = transfer_config_for(huge)
+    assert config.multipart_chunksize % MB == 0
+    assert huge / config.multipart_chunksize <= MAX_PARTS
+
+
+def test_uploads_files_concurrently_with_stats(local_s3, tmp_path):
+    files = {}
+    for i, size in enumerate([20 * MB, 1000, 2000, 3000]):
+        path = tmp_path / f"file{i}.dat"
+        path.write_bytes(os.urandom(size))
+        files[str(path)] = f"raw/file{i}.dat"
+
+    results = upload_files(files, "bucket", s3=local_s3.client(), max_concurrency=4, manifest_path=None)
+
+    assert [r["s3_key"] for r in results] == list(files.values())
+    for local_path, key in files.items():
+        with open(local_path, "rb") as f:
+            assert local_s3.store.body("bucket", key) == f.read()
+    assert all(r["bytes_per_second"] > 0 for r in results)
+    assert ("CreateMultipartUpload", "raw/file0.dat", 0) in local_s3.store.requests
+
+
+def test_failed_file_is_reported_and_skipped(local_s3, tmp_path):
+    path = tmp_path / "ok.dat"
+    path.write_bytes(b"ok")
+
+    files = {str(tmp_path / "missing.dat"): "raw/missing", str(path): "raw/ok"}
+    results = upload_files(files, "bucket", s3=local_s3.client(), manifest_path=None)
+
+    assert [r["s3_key"] for r in results] == ["raw/ok"]
+
+
+def test_unchanged_files_are_skipped(local_s3, tmp_path, monkeypatch):
+    big, small = tmp_path / "big.csv", tmp_path / "small.csv"
+    big.write_bytes(os.urandom(17 * MB))
+    small.write_bytes(b"a,b\n1,2\n")
+    files = {str(big): "raw/big.csv", str(small): "raw/small.csv"}
+    manifest_path = str(tmp_path / "manifest.json")
+    client = local_s3.client()
+
+    first = upload_files(files, "bucket", s3=client, manifest_path=manifest_path)
+    assert not any(r["skipped"] for r in first)
+
+    hashed = []
+    monkeypatch.setattr(uploader, "file_digests", lambda path, part_size: hashed.append(path))
+    sent = local_s3.store.bytes_received()
+    second = upload_files(files, "bucket", s3=client, manifest_path=manifest_path)
+
+    assert all(r["skipped"] for r in second)
+    assert local_s3.store.bytes_received() == sent
+    assert hashed == []  # digests came from the manifest
+
+
+def test_changed_file_is_uploaded_again(local_s3, tmp_path):
+    path = tmp_path / "wrc.csv"
+    path.write_bytes(b"county,risk\n001,0.5\n")
+    files = {str(path): "raw/wrc.csv"}
+    client = local_s3.client()
+    upload_files(files, "bucket", s3=client, manifest_path=None)
+
+    path.write_bytes(b"county,risk\n001,0.7\n")
+    results = upload_files(files, "bucket", s3=client, manifest_path=None)
+
+    assert not results[0]["skipped"]
+    assert local_s3.store.body("bucket", "raw/wrc.csv") == path.read_bytes()
+
+
+def test_checksum_mismatch_fails_the_upload(local_s3, tmp_path, monkeypatch):
+    path = tmp_path / "fpa_fod.csv"
+    path.write_bytes(os.urandom(9 * MB))
+    monkeypatch.setattr(uploader, "file_digests", lambda local_path, part_size: ("0" * 64, "bm90LXRoZS1jaGVja3N1bQ==-2"))
+
+    assert upload_files({str(path): "raw/fpa_fod.csv"}, "bucket", s3=local_s3.client(), manifest_path=None) == []
@@ -13,3 +13,19 @@ def test_sqs_queue_created():
 #     template.has_resource_properties("AWS::SQS::Queue", {
 #         "VisibilityTimeout": 300
 #     })
+
+
+def test_download_result_triggers_convert():
+    app = core.App()
+    stack = WildfireRiskAnalyticsStack(app, "wildfire-risk-analytics")
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Lambda::EventInvokeConfig", {
+        "DestinationConfig": {"OnSuccess": {"Destination": assertions.Match.any_value()}},
+    })
+    template.has_resource_properties("AWS::Events::Rule", {
+        "EventPattern": assertions.Match.object_like({
+            "source": ["lambda"],
+            "detail-type": ["Lambda Function Invocation Result - Success"],
+        }),
+    })
@@ -4,6 +4,7 @@ from aws_cdk import (
     aws_iam as iam,
     aws_glue as glue,
     aws_lambda as _lambda,
+    aws_lambda_destinations as destinations,
     aws_events as events,
     aws_events_targets as targets,
     CfnOutput,
@@ -67,9 +68,17 @@ class WildfireRiskAnalyticsStack(Stack):
             self, "DownloadNclimdivData",
             runtime=_lambda.Runtime.PYTHON_3_9,
             handler="lambda_function.lambda_handler",
-            code=_lambda.Code.from_asset("infra/lambdas/download_nclimdiv_data"),
+            code=_lambda.Code.from_asset(
+                "infra/lambdas/download_nclimdiv_data",
+                exclude=["**/__pycache__", "requirements.txt"],
+            ),
             role=lambda_role,
+            # Five concurrent streamed multipart uploads buffer up to 120 MB of parts
+            memory_size=512,
             timeout=Duration.minutes(10),
+            # Publishes the handler's return value (uploaded_keys, files_skipped)
+            # for the convert trigger below; applies to the scheduled async invocations
+            on_success=destinations.EventBridgeDestination(),
             environment={
                 "RAW_BUCKET": raw_bucket_name
             }
@@ -92,7 +101,15 @@ class WildfireRiskAnalyticsStack(Stack):
             timeout=Duration.minutes(10),
             environment={
                 "RAW_BUCKET": raw_bucket_name,
-                "PROCESSED_BUCKET": processed_bucket_name
+                "PROCESSED_BUCKET": processed_bucket_name,
+                "CONVERSION_MODE": "stream",
+                "MEMORY_BUDGET_MB": "128",
+                # CSV stays the deployed format: the nclimdiv_ crawler tables and the
+                # notebooks read nclimdiv/{var}.csv, and the Parquet path holds a whole
+                # variable's records in memory, which 512 MB does not cover
+                "OUTPUT_FORMAT": "csv",
+                "INCREMENTAL": "true",
+                "MAX_WORKERS": "5"
             }
         )
 
@@ -104,12 +121,14 @@ class WildfireRiskAnalyticsStack(Stack):
         monthly_schedule.add_target(targets.LambdaFunction(self.download_lambda))
 
         # 🔹 EventBridge Trigger: Convert Lambda after Download
+        # Destination events carry the download result as detail.responsePayload;
+        # their functionArn is version-qualified (…:$LATEST), hence the prefix match
         convert_trigger = events.Rule(
             self, "TriggerConvertAfterDownload",
             event_pattern=events.EventPattern(
-                source=["aws.lambda"],
-                detail_type=["Lambda Function Invocation Result"],
-                detail={"requestContext": {"functionArn": [self.download_lambda.function_arn]}}
+                source=["lambda"],
+                detail_type=["Lambda Function Invocation Result - Success"],
+                detail={"requestContext": {"functionArn": events.Match.prefix(self.download_lambda.function_arn)}}
             )
         )
         convert_trigger.add_target(targets.LambdaFunction(self.convert_lambda))
@@ -126,7 +145,8 @@ class WildfireRiskAnalyticsStack(Stack):
             name="fpa_fod_crawler",
             role=self.glue_role.role_arn,
             database_name=self.fpa_fod_db.ref,
-            targets={"s3Targets": [{"path": f"s3://{raw_bucket_name}/fpa-fod/"}]},
+            # Typed Parquet partitioned by fire_year/state, written by src.data.upload_fpa_fod_parquet
+            targets={"s3Targets": [{"path": f"s3://{processed_bucket_name}/fpa-fod/"}]},
             table_prefix="fpa_",
             schema_change_policy={
                 "UpdateBehavior": "UPDATE_IN_DATABASE",